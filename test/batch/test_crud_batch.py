@@ -1,4 +1,7 @@
+import threading
+import time
 import unittest
+import uuid as uuid_lib
 from numbers import Real
 from unittest.mock import Mock, patch
 
@@ -1016,6 +1019,396 @@ class TestBatch(unittest.TestCase):
             batch.consistency_level = 1
         check_startswith_error_message(self, error, "1 is not a valid ConsistencyLevel")
 
+    def test_return_futures(self):
+        """
+        Test the per-item futures returned by `add_data_object` and `add_reference`.
+        """
+
+        uuid_1 = "154cbccd-89f4-4b29-9c1b-001a3339d89d"
+        uuid_2 = "154cbccd-89f4-4b29-9c1b-001a3339d89c"
+        objects_response = [
+            {"id": uuid_1, "class": "Test", "result": {}},
+            {"id": uuid_2, "class": "Test", "result": {"errors": {"error": [{"message": "e"}]}}},
+        ]
+        mock_connection = mock_connection_func("post", return_json=objects_response)
+        batch = Batch(mock_connection)
+        self.assertFalse(batch.return_futures)
+        batch.configure(callback=None, return_futures=True)
+        self.assertTrue(batch.return_futures)
+
+        future_1 = batch.add_data_object({}, "Test", uuid_1)
+        future_2 = batch.add_data_object({}, "Test", uuid_2)
+        self.assertFalse(future_1.done())
+        batch._create_data("objects", batch._objects_batch)
+        self.assertEqual(future_1.result(timeout=0), objects_response[0])
+        self.assertEqual(future_2.result(timeout=0), objects_response[1])
+
+        # popped and emptied items cancel their futures
+        future_3 = batch.add_data_object({}, "Test", uuid_1)
+        batch.pop_object()
+        self.assertTrue(future_3.cancelled())
+
+        # every object with the same UUID gets its own entry
+        duplicates_response = [
+            {"id": uuid_1, "class": "Test", "result": {}},
+            {"id": uuid_1, "class": "Test", "result": {"errors": {"error": [{"message": "e"}]}}},
+        ]
+        mock_connection = mock_connection_func("post", return_json=duplicates_response)
+        batch = Batch(mock_connection)
+        batch.configure(callback=None, return_futures=True)
+        future_1 = batch.add_data_object({"a": 1}, "Test", uuid_1)
+        future_2 = batch.add_data_object({"a": 2}, "Test", uuid_1)
+        future_3 = batch.add_data_object({"a": 3}, "Test", uuid_1)
+        batch.pop_object(1)
+        self.assertTrue(future_2.cancelled())
+        batch._create_data("objects", batch._objects_batch)
+        self.assertEqual(future_1.result(timeout=0), duplicates_response[0])
+        self.assertEqual(future_3.result(timeout=0), duplicates_response[1])
+
+        # the futures of objects replaced when deduplicating resolve with the last version
+        mock_connection = mock_connection_func("post", return_json=objects_response)
+        batch = Batch(mock_connection)
+        batch.configure(callback=None, return_futures=True, deduplicate=True)
+        future_1 = batch.add_data_object({"a": 1}, "Test", uuid_1)
+        future_2 = batch.add_data_object({"a": 1}, "Test", uuid_2)
+        future_3 = batch.add_data_object({"a": 2}, "Test", uuid_1)
+        self.assertEqual(batch.num_objects(), 2)
+        batch._create_data("objects", batch._objects_batch)
+        self.assertEqual(future_1.result(timeout=0), objects_response[0])
+        self.assertEqual(future_2.result(timeout=0), objects_response[1])
+        self.assertEqual(future_3.result(timeout=0), objects_response[0])
+
+        batch.empty_objects()
+        future_1 = batch.add_data_object({"a": 1}, "Test", uuid_1)
+        future_2 = batch.add_data_object({"a": 2}, "Test", uuid_1)
+        batch.pop_object()
+        self.assertTrue(future_1.cancelled())
+        self.assertTrue(future_2.cancelled())
+
+        # errors are propagated to all futures of the request
+        mock_connection = mock_connection_func("post", side_effect=RequestsConnectionError("Test!"))
+        batch = Batch(mock_connection)
+        batch.configure(connection_error_retries=0, return_futures=True)
+        future = batch.add_reference(uuid_1, "Test", "prop", uuid_2)
+        with self.assertRaises(RequestsConnectionError):
+            batch._create_data("references", batch._reference_batch)
+        self.assertIsInstance(future.exception(timeout=0), RequestsConnectionError)
+
+        with self.assertRaises(TypeError):
+            batch.return_futures = 1
+
+    def test_callback_dispatcher(self):
+        """
+        Test running the callbacks in the CallbackDispatcher thread.
+        """
+
+        main_thread = threading.current_thread()
+        results = []
+
+        def callback(response):
+            results.append((response, threading.current_thread()))
+
+        mock_connection = mock_connection_func("post", return_json=[{"id": 1}])
+        batch = Batch(mock_connection)
+        batch.configure(callback=callback, callback_queue_size=2)
+        for _ in range(3):
+            batch._create_data("objects", ObjectsBatchRequest())
+        batch.flush()
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(thread is not main_thread for _, thread in results))
+
+        # exceptions in the callback are raised by flush
+        def failing_callback(response):
+            raise ValueError("Test!")
+
+        batch.configure(callback=failing_callback, callback_queue_size=2)
+        batch._create_data("objects", ObjectsBatchRequest())
+        with self.assertRaises(ValueError):
+            batch.flush()
+
+        # exceptions that were not raised by a flush are reported at shutdown
+        batch._create_data("objects", ObjectsBatchRequest())
+        with self.assertWarns(RuntimeWarning):
+            batch.shutdown()
+        self.assertFalse(batch._callback_dispatcher.is_alive())
+
+        # the dispatcher is stopped even if the flush on exit fails
+        with self.assertRaises(ValueError):
+            with batch(callback=failing_callback, callback_queue_size=2):
+                batch._create_data("objects", ObjectsBatchRequest())
+        self.assertFalse(batch._callback_dispatcher.is_alive())
+
+        # drop responses when the queue is full
+        release = threading.Event()
+        batch.configure(
+            callback=lambda _: release.wait(), callback_queue_size=1, callback_queue_policy="drop"
+        )
+        for _ in range(5):
+            batch._create_data("objects", ObjectsBatchRequest())
+        self.assertGreaterEqual(batch.num_dropped_callbacks, 3)
+        release.set()
+        batch.shutdown()
+        self.assertFalse(batch._callback_dispatcher.is_alive())
+
+        # without a queue the callback runs in the sending thread
+        batch.configure(callback=callback)
+        results.clear()
+        batch._create_data("objects", ObjectsBatchRequest())
+        self.assertIs(results[0][1], main_thread)
+
+        with self.assertRaises(ValueError):
+            batch.configure(callback_queue_size=1, callback_queue_policy="wait")
+        with self.assertRaises(ValueError):
+            batch.configure(callback_queue_size=0)
+
+    def test_deduplicate(self):
+        """
+        Test that the same UUID is never sent concurrently when deduplicating.
+        """
+
+        uuid_1 = "154cbccd-89f4-4b29-9c1b-001a3339d89d"
+        sent = []
+        in_flight = []
+        lock = threading.Lock()
+
+        def post(path, weaviate_object, params):
+            uuids = [obj["id"] for obj in weaviate_object["objects"]]
+            with lock:
+                self.assertFalse(any(uuid in in_flight for uuid in uuids))
+                in_flight.extend(uuids)
+            time.sleep(0.05)
+            with lock:
+                for uuid in uuids:
+                    in_flight.remove(uuid)
+                sent.append(weaviate_object["objects"])
+            response = Mock(status_code=200)
+            response.json.return_value = []
+            response.elapsed.total_seconds.return_value = 0.05
+            return response
+
+        batch = Batch(mock_connection_func("post", side_effect=post))
+        batch.configure(batch_size=2, num_workers=4, deduplicate=True, callback=None)
+        batch.add_data_object({"a": 1}, "Test", uuid_1)
+        batch.add_data_object({"a": 2}, "Test", uuid_1)
+        self.assertEqual(batch.num_objects(), 1)
+        for i in range(3, 8):
+            batch.add_data_object({"a": i}, "Test", uuid_1)
+            batch.add_data_object({"a": i}, "Test")
+        batch.flush()
+        batch.shutdown()
+
+        versions = [
+            obj["properties"]["a"] for objects in sent for obj in objects if obj["id"] == uuid_1
+        ]
+        self.assertEqual(versions, sorted(versions))
+        self.assertEqual(versions[-1], 7)
+
+    def test_thread_safe(self):
+        """
+        Test sharing one Batch between multiple producer threads.
+        """
+
+        sent = []
+        request_sizes = []
+        lock = threading.Lock()
+
+        def post(path, weaviate_object, params):
+            with lock:
+                sent.extend(obj["id"] for obj in weaviate_object["objects"])
+                request_sizes.append(len(weaviate_object["objects"]))
+            response = Mock(status_code=200)
+            response.json.return_value = []
+            response.elapsed.total_seconds.return_value = 0.01
+            return response
+
+        batch = Batch(mock_connection_func("post", side_effect=post))
+        batch.configure(batch_size=7, num_workers=2, thread_safe=True, callback=None)
+
+        # every thread keeps 6 objects in its buffer
+        def produce():
+            for _ in range(48):
+                batch.add_data_object({}, "Test")
+
+        producers = [threading.Thread(target=produce) for _ in range(4)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        # counting does not merge the buffers of the threads
+        num_merged = len(batch._objects_batch)
+        self.assertEqual(batch.num_objects(), 192 - len(sent))
+        self.assertEqual(len(batch._objects_batch), num_merged)
+        batch.flush()
+        batch.shutdown()
+
+        self.assertEqual(len(sent), 192)
+        self.assertEqual(len(set(sent)), 192)
+        self.assertEqual(batch.shape, (0, 0))
+        # the buffers of all threads are never sent in one request
+        self.assertLessEqual(max(request_sizes), 7)
+
+        # manual batching merges the buffers of all threads when they are created
+        batch = Batch(mock_connection_func("post", return_json=[]))
+        batch.configure(thread_safe=True)
+        producer = threading.Thread(target=lambda: batch.add_data_object({}, "Test"))
+        producer.start()
+        producer.join()
+        self.assertEqual(batch.num_objects(), 1)
+        self.assertEqual(batch.shape, (1, 0))
+        self.assertEqual(len(batch._shards), 1)
+        batch._create_data = Mock()
+        batch._create_data.return_value.elapsed.total_seconds.return_value = 1
+        batch.create_objects()
+        batch._create_data.assert_called_once()
+        # the buffer of the ended thread is dropped
+        self.assertEqual(batch._shards, [])
+
+    def test_keep_executor_and_scale_workers(self):
+        """
+        Test keeping the BatchExecutor between sessions and scaling the number of workers.
+        """
+
+        batch = Batch(mock_connection_func("post", return_json=[]))
+        with batch(batch_size=10, dynamic=True, keep_executor=True, callback=None) as b:
+            executor = b._executor
+            b._recommended_num_objects = 42
+        self.assertFalse(executor.is_shutdown())
+        with batch(batch_size=10, dynamic=True, keep_executor=True, callback=None) as b:
+            self.assertIs(b._executor, executor)
+            self.assertEqual(b.recommended_num_objects, 42)
+        batch.shutdown()
+        self.assertTrue(executor.is_shutdown())
+
+        batch.configure(batch_size=10, num_workers=2, max_workers=4)
+        self.assertEqual(batch.num_workers, 2)
+        batch._future_pool = [Mock(), Mock()]
+        batch._scale_workers(num_busy=2, timeout_occurred=False)
+        batch._scale_workers(num_busy=2, timeout_occurred=False)
+        batch._scale_workers(num_busy=2, timeout_occurred=False)
+        self.assertEqual(batch.num_workers, 4)
+        batch._scale_workers(num_busy=0, timeout_occurred=False)
+        self.assertEqual(batch.num_workers, 3)
+        batch._scale_workers(num_busy=1, timeout_occurred=True)
+        self.assertEqual(batch.num_workers, 2)
+        batch.shutdown()
+
+        with self.assertRaises(ValueError):
+            batch.configure(batch_size=10, num_workers=2, max_workers=1)
+
+    def test_purge_objects(self):
+        """
+        Test the `purge_objects` method.
+        """
+
+        remaining = {f"{i:08d}" for i in range(10)}
+        lock = threading.Lock()
+
+        def delete(path, weaviate_object, params):
+            where = weaviate_object["match"]["where"]
+            with lock:
+                if "operands" in where:
+                    matching = {op["valueString"] for op in where["operands"]} & remaining
+                else:
+                    matching = set(remaining)
+                deleted = sorted(matching)[:4]
+                if not weaviate_object["dryRun"]:
+                    remaining.difference_update(deleted)
+            results = {
+                "matches": len(deleted),
+                "limit": 4,
+                "successful": len(deleted),
+                "failed": 0,
+                "objects": [{"id": uuid, "status": "SUCCESS"} for uuid in deleted],
+            }
+            return Mock(status_code=200, json=Mock(return_value={"results": results}))
+
+        connection_mock = mock_connection_func("delete", side_effect=delete)
+        connection_mock = mock_connection_func(
+            "post",
+            return_json={"data": {"Aggregate": {"Test": [{"meta": {"count": 10}}]}}},
+            connection_mock=connection_mock,
+        )
+        batch = Batch(connection_mock)
+        where = {"path": ["name"], "operator": "Equal", "valueText": "Test"}
+        progress = []
+
+        # the matches are capped at the limit, so they are counted with an Aggregate query
+        result = batch.purge_objects("Test", where, dry_run=True)
+        self.assertEqual(result["results"]["matches"], 10)
+        self.assertFalse(result["truncated"])
+        self.assertIn("meta{count}", connection_mock.post.call_args[1]["weaviate_object"]["query"])
+        self.assertEqual(len(remaining), 10)
+
+        # GraphQL does not support array values
+        contains_any = {"path": ["id"], "operator": "ContainsAny", "valueTextArray": ["1"]}
+        result = batch.purge_objects("Test", contains_any, dry_run=True)
+        self.assertEqual(result["results"]["matches"], 4)
+        self.assertTrue(result["truncated"])
+
+        result = batch.purge_objects("Test", where, progress=progress.append)
+        self.assertEqual(result["results"], {"matches": 10, "successful": 10, "failed": 0})
+        # 4 + 4 + 2 matches, the last call matches less than the limit
+        self.assertEqual(result["requests"], 3)
+        self.assertEqual([p["results"]["successful"] for p in progress], [4, 8, 10])
+        self.assertGreater(result["objectsPerSecond"], 0)
+        self.assertEqual(len(remaining), 0)
+
+        remaining.update(f"{i:08d}" for i in range(10))
+        where = {
+            "operator": "Or",
+            "operands": [
+                {"path": ["id"], "operator": "Equal", "valueString": f"{i:08d}"}
+                for i in range(1, 9)
+            ],
+        }
+        result = batch.purge_objects("Test", where, output="verbose", chunk_size=3)
+        self.assertEqual(result["results"]["successful"], 8)
+        self.assertEqual(
+            sorted(obj["id"] for obj in result["results"]["objects"]),
+            [f"{i:08d}" for i in range(1, 9)],
+        )
+        self.assertEqual(remaining, {"00000000", "00000009"})
+
+        with self.assertRaises(ValueError):
+            batch.purge_objects("Test", where, chunk_size=0)
+
+    def test_delete_by_ids(self):
+        """
+        Test the `delete_by_ids` method.
+        """
+
+        uuids = [str(uuid_lib.UUID(int=i)) for i in range(5)]
+        results = {"matches": 2, "limit": 10000, "successful": 2, "failed": 0}
+        connection_mock = mock_connection_func("delete", return_json={"results": results})
+        batch = Batch(connection_mock)
+
+        result = batch.delete_by_ids("Test", uuids + uuids[:2], chunk_size=3)
+        self.assertEqual(result["results"]["successful"], 4)
+        self.assertEqual(connection_mock.delete.call_count, 2)
+        wheres = [
+            call[1]["weaviate_object"]["match"]["where"]
+            for call in connection_mock.delete.call_args_list
+        ]
+        self.assertEqual(
+            sorted(op["valueString"] for where in wheres for op in where["operands"]), uuids
+        )
+
+        connection_mock = mock_connection_func(
+            "delete", return_json={"results": results}, server_version="1.21.1"
+        )
+        Batch(connection_mock).delete_by_ids("Test", uuids)
+        self.assertEqual(
+            connection_mock.delete.call_args[1]["weaviate_object"]["match"]["where"],
+            {"path": ["id"], "operator": "ContainsAny", "valueTextArray": uuids},
+        )
+
+        result = Batch(connection_mock).delete_by_ids("Test", [], output="verbose")
+        self.assertEqual(result["results"]["objects"], [])
+        self.assertEqual(connection_mock.delete.call_count, 1)
+
+        with self.assertRaises(ValueError):
+            batch.delete_by_ids("Test", ["not-a-uuid"])
+
     @patch("weaviate.batch.crud_batch.Batch._auto_create")
     def test_configure_call(self, mock_auto_create):
         """
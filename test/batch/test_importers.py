@@ -0,0 +1,154 @@
+"""
+Test the 'weaviate.batch.importers' functions and the `Batch.import_*` methods.
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from test.util import mock_connection_func
+from weaviate.batch import Batch
+from weaviate.batch.importers import iter_import_items, prefetch, read_csv, read_jsonl
+
+UUID_1 = "154cbccd-89f4-4b29-9c1b-001a3339d89d"
+UUID_2 = "154cbccd-89f4-4b29-9c1b-001a3339d89c"
+
+
+def _mock_batch():
+    sent = []
+
+    def post(path, weaviate_object, params):
+        sent.extend(weaviate_object["objects"])
+        response = Mock(status_code=200)
+        response.json.return_value = []
+        response.elapsed.total_seconds.return_value = 0.1
+        return response
+
+    batch = Batch(mock_connection_func("post", side_effect=post))
+    return batch, sent
+
+
+class TestImporters(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.tmp_path = Path(directory.name)
+
+    def test_read_jsonl_and_csv(self):
+        """
+        Test the `read_jsonl` and `read_csv` functions.
+        """
+
+        jsonl = self.tmp_path / "data.jsonl"
+        jsonl.write_text('{"a": 1}\n\n{"a": 2}\n')
+        self.assertEqual(list(read_jsonl(str(jsonl))), [{"a": 1}, {"a": 2}])
+
+        csv_file = self.tmp_path / "data.csv"
+        csv_file.write_text("name;price\nfoo;1.5\nbar;2\n")
+        self.assertEqual(
+            list(read_csv(str(csv_file), {"price": float}, delimiter=";")),
+            [{"name": "foo", "price": 1.5}, {"name": "bar", "price": 2.0}],
+        )
+
+    def test_iter_import_items(self):
+        """
+        Test the `iter_import_items` function.
+        """
+
+        records = [
+            {"id": UUID_1, "t": "x", "other": 1, "vec": [0.1, 0.2]},
+            {"id": UUID_2, "t": "y", "other": 2},
+        ]
+        items = list(iter_import_items(records, {"t": "title"}, "id", "vec"))
+        self.assertEqual(
+            items, [({"title": "x"}, UUID_1, [0.1, 0.2]), ({"title": "y"}, UUID_2, None)]
+        )
+
+        items = list(iter_import_items([{"a": 1, "b": 2}], vectors=[[0.5]]))
+        self.assertEqual(items, [({"a": 1, "b": 2}, None, [0.5])])
+
+        # the records are not modified, so importing them again gives the same items
+        records = [{"id": UUID_1, "t": "x", "vec": [0.1, 0.2]}]
+        items = list(iter_import_items(records, uuid_column="id", vector_column="vec"))
+        self.assertEqual(items, [({"t": "x"}, UUID_1, [0.1, 0.2])])
+        self.assertEqual(records, [{"id": UUID_1, "t": "x", "vec": [0.1, 0.2]}])
+        self.assertEqual(
+            list(iter_import_items(records, uuid_column="id", vector_column="vec")), items
+        )
+
+    def test_prefetch(self):
+        """
+        Test the `prefetch` function.
+        """
+
+        self.assertEqual(list(prefetch(iter(range(100)), 3)), list(range(100)))
+
+        def failing():
+            yield 1
+            raise ValueError("Test!")
+
+        with self.assertRaises(ValueError):
+            list(prefetch(failing(), 3))
+
+        # stopping early stops the reader thread
+        items = prefetch(iter(range(100)), 3)
+        self.assertEqual(next(items), 0)
+        items.close()
+
+    def test_import_jsonl(self):
+        """
+        Test the `Batch.import_jsonl` method.
+        """
+
+        jsonl = self.tmp_path / "data.jsonl"
+        jsonl.write_text("\n".join(json.dumps({"id": str(i), "t": i}) for i in range(25)))
+
+        batch, sent = _mock_batch()
+        batch.configure(batch_size=10, callback=None)
+        self.assertEqual(
+            batch.import_jsonl(str(jsonl), "Test", property_mapping={"t": "value"}), 25
+        )
+        self.assertEqual(len(sent), 25)
+        self.assertEqual(sent[3]["properties"], {"value": 3})
+        self.assertEqual(batch.shape, (0, 0))
+
+        # manual batching is flushed every `max_prefetched` objects
+        batch, sent = _mock_batch()
+        batch.configure(callback=None)
+        batch.flush = Mock(wraps=batch.flush)
+        self.assertEqual(batch.import_jsonl(str(jsonl), "Test", max_prefetched=10), 25)
+        self.assertEqual(batch.flush.call_count, 3)
+
+        # also when the objects are buffered per thread
+        batch, sent = _mock_batch()
+        batch.configure(callback=None, thread_safe=True)
+        batch.flush = Mock(wraps=batch.flush)
+        self.assertEqual(batch.import_jsonl(str(jsonl), "Test", max_prefetched=10), 25)
+        self.assertEqual(batch.flush.call_count, 3)
+        self.assertEqual(len(sent), 25)
+
+    def test_import_csv_with_npy_vectors(self):
+        """
+        Test the `Batch.import_csv` method with the vectors in a `.npy` file.
+        """
+
+        np = pytest.importorskip("numpy")
+
+        csv_file = self.tmp_path / "data.csv"
+        csv_file.write_text(f"uuid,name\n{UUID_1},foo\n{UUID_2},bar\n")
+        npy_file = self.tmp_path / "vectors.npy"
+        np.save(npy_file, np.array([[0.0, 1.0], [2.0, 3.0]], dtype=np.float32))
+
+        batch, sent = _mock_batch()
+        batch.configure(batch_size=10, callback=None)
+        num_imported = batch.import_csv(
+            str(csv_file), "Test", uuid_column="uuid", vectors=str(npy_file)
+        )
+        self.assertEqual(num_imported, 2)
+        self.assertEqual(
+            [(obj["id"], obj["properties"], obj["vector"]) for obj in sent],
+            [(UUID_1, {"name": "foo"}, [0.0, 1.0]), (UUID_2, {"name": "bar"}, [2.0, 3.0])],
+        )
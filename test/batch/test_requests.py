@@ -303,3 +303,38 @@ class TestBatchObjects(unittest.TestCase):
         batch.empty()
         self.assertEqual(len(batch), 0)
         self.assertTrue(batch.is_empty())
+
+
+def test_objects_batch_request_deduplicate():
+    """
+    Test that objects with the same UUID replace each other when deduplicating.
+    """
+
+    uuid_1 = "154cbccd-89f4-4b29-9c1b-001a3339d89d"
+    uuid_2 = "154cbccd-89f4-4b29-9c1b-001a3339d89c"
+
+    batch = ObjectsBatchRequest()
+    batch.add({"a": 1}, "Test", uuid_1)
+    batch.add({"a": 2}, "Test", uuid_1)
+    assert len(batch) == 2
+
+    batch = ObjectsBatchRequest(deduplicate=True)
+    batch.add({"a": 1}, "Test", uuid_1)
+    batch.add({"a": 1}, "Test", uuid_2)
+    assert batch.add({"a": 2}, "Test", uuid_1) == uuid_1
+    assert len(batch) == 2
+    assert batch.uuids() == [uuid_1, uuid_2]
+    assert batch.get_request_body()["objects"][0]["properties"] == {"a": 2}
+
+    batch.pop(0)
+    batch.add({"a": 3}, "Test", uuid_2)
+    assert len(batch) == 1
+    assert batch.get_request_body()["objects"][0]["properties"] == {"a": 3}
+
+    batch.empty()
+    batch.add({"a": 4}, "Test", uuid_2)
+    assert batch.uuids() == [uuid_2]
+
+    batch.deduplicate = False
+    batch.add({"a": 5}, "Test", uuid_2)
+    assert len(batch) == 2
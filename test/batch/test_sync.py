@@ -0,0 +1,107 @@
+"""
+Test the 'weaviate.batch.sync' functions/classes.
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from test.util import mock_connection_func
+from weaviate.batch import Batch, IncrementalSync
+
+UUID_1 = "154cbccd-89f4-4b29-9c1b-001a3339d89d"
+UUID_2 = "154cbccd-89f4-4b29-9c1b-001a3339d89c"
+UUID_3 = "254cbccd-89f4-4b29-9c1b-001a3339d89a"
+
+
+def _post(path, weaviate_object, params):
+    response = Mock(status_code=200)
+    response.elapsed.total_seconds.return_value = 0.1
+    response.json.return_value = [
+        {"id": obj["id"], "result": {"errors": {"error": [{"message": "failed"}]}}}
+        if obj["properties"].get("fail", False)
+        else {"id": obj["id"], "result": {}}
+        for obj in weaviate_object["objects"]
+    ]
+    return response
+
+
+class TestIncrementalSync(unittest.TestCase):
+    def setUp(self):
+        connection = mock_connection_func("post", side_effect=_post)
+        self.connection = mock_connection_func(
+            "delete", return_json={"results": {"successful": 1}}, connection_mock=connection
+        )
+        self.batch = Batch(self.connection).configure(callback=None)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.manifest_path = os.path.join(directory.name, "manifest.sqlite")
+
+    def test_incremental_sync(self):
+        """
+        Test that unchanged objects are skipped and missing objects are deleted.
+        """
+
+        with IncrementalSync(self.batch, self.manifest_path) as sync:
+            sync.add_data_object({"a": 1}, "test", UUID_1, [0.1, 0.2])
+            sync.add_data_object({"a": 1}, "Test", UUID_2)
+            sync.add_data_object({"fail": True}, "Test", UUID_3)
+        self.assertEqual(self.connection.post.call_count, 1)
+        self.assertEqual((sync.num_added, sync.num_skipped), (3, 0))
+
+        # a new run on the same manifest
+        sync = IncrementalSync(self.batch, self.manifest_path)
+        self.assertIsNone(sync.add_data_object({"a": 1}, "Test", UUID_1, [0.1, 0.2]))
+        self.assertIsNotNone(sync.add_data_object({"fail": True}, "Test", UUID_3))
+        self.assertIsNotNone(sync.add_data_object({"a": 1}, "Test", UUID_1, [0.1, 0.3]))
+        self.assertEqual((sync.num_added, sync.num_skipped), (2, 1))
+
+        self.assertEqual(sync.missing("Test"), [UUID_2])
+        self.assertEqual(sync.delete_missing("Test"), 1)
+        where = self.connection.delete.call_args[1]["weaviate_object"]["match"]["where"]
+        self.assertEqual(where["operands"][0]["valueString"], UUID_2)
+        self.assertEqual(sync.missing("Test"), [])
+        sync.close()
+
+        with self.assertRaises(ValueError):
+            IncrementalSync(self.batch, ":memory:").add_data_object({}, "Test", None)
+
+    def test_manifest_chunks(self):
+        """
+        Test that the manifest is written every `manifest_chunk_size` objects.
+        """
+
+        def manifest_rows():
+            with sqlite3.connect(self.manifest_path) as db:
+                return db.execute("SELECT uuid, run FROM manifest ORDER BY uuid").fetchall()
+
+        with IncrementalSync(self.batch, self.manifest_path) as sync:
+            sync.add_data_object({"a": 1}, "Test", UUID_1)
+            sync.add_data_object({"a": 2}, "Test", UUID_2)
+        self.assertEqual(manifest_rows(), [(UUID_2, 1), (UUID_1, 1)])
+
+        sync = IncrementalSync(self.batch, self.manifest_path, manifest_chunk_size=1)
+        sync.add_data_object({"a": 1}, "Test", UUID_1)
+        self.assertEqual(manifest_rows(), [(UUID_2, 1), (UUID_1, 2)])
+        sync.close()
+
+        with self.assertRaises(ValueError):
+            IncrementalSync(self.batch, ":memory:", manifest_chunk_size=0)
+        with self.assertRaises(TypeError):
+            IncrementalSync(self.batch, ":memory:", manifest_chunk_size=1.5)
+
+    def test_return_futures_disabled(self):
+        """
+        Test that adding fails clearly if `return_futures` was disabled after the start.
+        """
+
+        sync = IncrementalSync(self.batch, ":memory:")
+        self.batch.configure(callback=None)
+        with self.assertRaises(ValueError):
+            sync.add_data_object({"a": 1}, "Test", UUID_1)
+        self.assertEqual(sync.num_added, 0)
+
+        self.batch.return_futures = True
+        self.assertIsNotNone(sync.add_data_object({"a": 1}, "Test", UUID_1))
+        sync.close()
@@ -0,0 +1,108 @@
+"""
+Test the 'weaviate.data.bulk' functions/classes and `DataObject.update_many`.
+"""
+import itertools
+import time
+import unittest
+import uuid as uuid_lib
+from unittest.mock import Mock, patch
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from test.util import mock_connection_func
+from weaviate.data import DataObject
+from weaviate.data.bulk import RateLimiter, call_with_retries, run_bounded
+from weaviate.exceptions import UnexpectedStatusCodeException
+
+
+class TestBulk(unittest.TestCase):
+    def test_rate_limiter(self):
+        """
+        Test the `RateLimiter` class.
+        """
+
+        limiter = RateLimiter(max_per_second=100)
+        start = time.monotonic()
+        for _ in range(11):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    @patch("weaviate.data.bulk.time.sleep")
+    def test_call_with_retries(self, mock_sleep):
+        """
+        Test the `call_with_retries` function.
+        """
+
+        func = Mock(side_effect=[RequestsConnectionError("Test!"), 42])
+        self.assertEqual(call_with_retries(func, max_retries=3), 42)
+        self.assertEqual(func.call_count, 2)
+        mock_sleep.assert_called_once_with(2)
+
+        func = Mock(side_effect=RequestsConnectionError("Test!"))
+        with self.assertRaises(RequestsConnectionError):
+            call_with_retries(func, max_retries=2)
+        self.assertEqual(func.call_count, 3)
+
+        # only transient status codes are retried
+        error = UnexpectedStatusCodeException("Test", Mock(status_code=422))
+        func = Mock(side_effect=error)
+        with self.assertRaises(UnexpectedStatusCodeException):
+            call_with_retries(func, max_retries=2)
+        self.assertEqual(func.call_count, 1)
+
+        error = UnexpectedStatusCodeException("Test", Mock(status_code=503))
+        func = Mock(side_effect=[error, 42])
+        self.assertEqual(call_with_retries(func, max_retries=2), 42)
+
+    def test_run_bounded(self):
+        """
+        Test the `run_bounded` function.
+        """
+
+        results = sorted(run_bounded(lambda x: 10 // x, [1, 2, 0, 5], max_workers=2), key=str)
+        self.assertEqual([item for item, _, _ in results], [0, 1, 2, 5])
+        self.assertIsNone(results[0][1])
+        self.assertIsInstance(results[0][2], ZeroDivisionError)
+        self.assertEqual([result for _, result, _ in results[1:]], [10, 5, 2])
+
+        # the items are consumed lazily
+        consumed = itertools.count()
+        items = (next(consumed) for _ in itertools.repeat(None))
+        first = next(run_bounded(lambda x: x, items, max_workers=2))
+        self.assertIsNone(first[2])
+        self.assertLessEqual(next(consumed), 5)
+
+    def test_update_many(self):
+        """
+        Test the `DataObject.update_many` method.
+        """
+
+        uuids = [str(uuid_lib.UUID(int=i)) for i in range(20)]
+
+        def patch_(path, weaviate_object, params):
+            return Mock(status_code=404 if path.endswith(uuids[3]) else 204)
+
+        connection_mock = mock_connection_func("patch", side_effect=patch_, server_version="1.18.0")
+        results = DataObject(connection_mock).update_many(
+            ((uuid, "Test", {"name": "Test"}) for uuid in uuids), max_workers=4
+        )
+        connection_mock.patch.assert_not_called()
+        results = list(results)
+        self.assertEqual(sorted(result["id"] for result in results), uuids)
+        failed = [result for result in results if result["error"] is not None]
+        self.assertEqual([result["id"] for result in failed], [uuids[3]])
+        self.assertIsInstance(failed[0]["error"], UnexpectedStatusCodeException)
+
+        connection_mock = mock_connection_func("put", status_code=200, server_version="1.18.0")
+        results = list(
+            DataObject(connection_mock).update_many(
+                [(uuids[0], "Test", {"name": "Test"})], replace=True, max_requests_per_second=10
+            )
+        )
+        self.assertEqual(results, [{"id": uuids[0], "class": "Test", "error": None}])
+        self.assertEqual(connection_mock.put.call_count, 1)
+
+        with self.assertRaises(ValueError):
+            DataObject(connection_mock).update_many([], max_workers=0)
+        with self.assertRaises(TypeError):
+            DataObject(connection_mock).update_many([], max_requests_per_second="10")
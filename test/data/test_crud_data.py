@@ -1,4 +1,5 @@
 import unittest
+import uuid as uuid_lib
 from unittest.mock import patch, Mock
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
@@ -9,6 +10,7 @@ from weaviate.data.replication import ConsistencyLevel
 from weaviate.exceptions import (
     UnexpectedStatusCodeException,
     ObjectAlreadyExistsException,
+    QueryFailedException,
 )
 
 
@@ -533,6 +535,111 @@ class TestDataObject(unittest.TestCase):
             )
             assert "consistency_level" in error
 
+    def test_get_by_ids(self):
+        """
+        Test the `get_by_ids` method.
+        """
+
+        uuids = [str(uuid_lib.UUID(int=i)) for i in range(5)]
+        existing = set(uuids[1:4])
+
+        def post(path, weaviate_object):
+            # GraphQL: return the existing objects of the `id` filter, in reverse order
+            results = [
+                {"name": uuid[-1], "_additional": {"id": uuid, "vector": [1.0]}}
+                for uuid in reversed(uuids)
+                if uuid in existing and uuid in weaviate_object["query"]
+            ]
+            return Mock(
+                status_code=200, json=Mock(return_value={"data": {"Get": {"Test": results}}})
+            )
+
+        connection_mock = mock_connection_func("post", side_effect=post, server_version="1.18.0")
+        data_object = DataObject(connection_mock)
+        result = data_object.get_by_ids(
+            "test", uuids + [uuids[2]], properties=["name"], with_vector=True, chunk_size=2
+        )
+        self.assertEqual(connection_mock.post.call_count, 3)
+        self.assertEqual(result["missing"], [uuids[0], uuids[4]])
+        self.assertEqual(
+            result["objects"],
+            [None]
+            + [
+                {"class": "Test", "id": uuid, "properties": {"name": uuid[-1]}, "vector": [1.0]}
+                for uuid in uuids[1:4]
+            ]
+            + [None]
+            + [{"class": "Test", "id": uuids[2], "properties": {"name": "2"}, "vector": [1.0]}],
+        )
+        self.assertIn(
+            "limit: 2 ", connection_mock.post.call_args_list[0][1]["weaviate_object"]["query"]
+        )
+
+        # without properties all properties of the class definition are requested
+        class_schema = {
+            "class": "Test",
+            "properties": [
+                {"name": "name", "dataType": ["text"]},
+                {"name": "location", "dataType": ["geoCoordinates"]},
+                {"name": "hasAuthor", "dataType": ["Author"]},
+                {"name": "hasCited", "dataType": ["Article", "book"]},
+            ],
+        }
+        graphql_result = {
+            "name": "A",
+            "location": None,
+            "hasAuthor": [{"_additional": {"id": uuids[0]}}],
+            "hasCited": None,
+            "_additional": {"id": uuids[1]},
+        }
+        connection_mock = mock_connection_func(
+            "get", return_json=class_schema, server_version="1.18.0"
+        )
+        connection_mock = mock_connection_func(
+            "post",
+            return_json={"data": {"Get": {"Test": [graphql_result]}}},
+            connection_mock=connection_mock,
+        )
+        data_object = DataObject(connection_mock)
+        result = data_object.get_by_ids("Test", uuids[:3], chunk_size=100)
+        self.assertEqual(connection_mock.get.call_count, 1)
+        self.assertEqual(connection_mock.post.call_count, 1)
+        query = connection_mock.post.call_args[1]["weaviate_object"]["query"]
+        self.assertIn(
+            "name location {latitude longitude} hasAuthor {... on Author {_additional {id}}} "
+            "hasCited {... on Article {_additional {id}} ... on Book {_additional {id}}}",
+            query,
+        )
+        self.assertEqual(result["missing"], [uuids[0], uuids[2]])
+        self.assertEqual(
+            result["objects"][1],
+            {
+                "class": "Test",
+                "id": uuids[1],
+                "properties": {
+                    "name": "A",
+                    "hasAuthor": [
+                        {
+                            "beacon": f"weaviate://localhost/Author/{uuids[0]}",
+                            "href": f"/v1/objects/Author/{uuids[0]}",
+                        }
+                    ],
+                },
+            },
+        )
+
+        self.assertEqual(data_object.get_by_ids("Test", []), {"objects": [], "missing": []})
+
+        connection_mock = mock_connection_func(
+            "post", return_json={"errors": [{"message": "Test!"}]}, server_version="1.18.0"
+        )
+        with self.assertRaises(QueryFailedException):
+            DataObject(connection_mock).get_by_ids("Test", uuids, properties=["name"])
+        with self.assertRaises(TypeError):
+            data_object.get_by_ids("Test", uuids, properties="name")
+        with self.assertRaises(ValueError):
+            data_object.get_by_ids("Test", uuids, chunk_size=0)
+
     @patch("weaviate.data.crud_data._get_params")
     def test_get(self, mock_get_params):
         """
@@ -621,6 +728,34 @@ class TestDataObject(unittest.TestCase):
             params={"consistency_level": "QUORUM"},
         )
 
+    def test_exists_many(self):
+        """
+        Test the `exists_many` method.
+        """
+
+        uuids = [str(uuid_lib.UUID(int=i)) for i in range(5)]
+        existing = {uuids[1], uuids[3]}
+
+        def post(path, weaviate_object):
+            query = weaviate_object["query"]
+            self.assertIn("_additional {id }", query)
+            results = [{"_additional": {"id": uuid}} for uuid in existing if uuid in query]
+            return Mock(
+                status_code=200, json=Mock(return_value={"data": {"Get": {"Test": results}}})
+            )
+
+        connection_mock = mock_connection_func("post", side_effect=post, server_version="1.18.0")
+        data_object = DataObject(connection_mock)
+        result = data_object.exists_many("test", uuids + [uuids[3]], chunk_size=2)
+        self.assertEqual(result, [False, True, False, True, False, True])
+        self.assertEqual(connection_mock.post.call_count, 3)
+        self.assertEqual(data_object.exists_many("Test", []), [])
+
+        with self.assertRaises(TypeError):
+            data_object.exists_many(["Test"], uuids)
+        with self.assertRaises(ValueError):
+            data_object.exists_many("Test", uuids, max_workers=0)
+
     @patch("weaviate.data.crud_data._get_dict_from_object", side_effect=lambda x: x)
     @patch("weaviate.data.crud_data.get_vector", side_effect=lambda x: x)
     def test_validate(self, mock_get_vector, mock_get_dict_from_object):
@@ -0,0 +1,200 @@
+"""
+Test the 'weaviate.data.export' functions/classes and `DataObject.export`.
+"""
+import json
+import tempfile
+import unittest
+import uuid as uuid_lib
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from test.util import mock_connection_func
+from weaviate.data import DataObject
+from weaviate.data.export import NpyWriter, ParquetWriter, scan_pages, uuid_partitions
+
+UUIDS = sorted(str(uuid_lib.UUID(int=i * (2**128 // 37))) for i in range(37))
+
+
+def _get_page(after, limit):
+    return [{"id": uuid} for uuid in UUIDS if after is None or uuid > after][:limit]
+
+
+class TestScanPages(unittest.TestCase):
+    def test_uuid_partitions(self):
+        """
+        Test the `uuid_partitions` function.
+        """
+
+        self.assertEqual(uuid_partitions(1), [(None, "ffffffff-ffff-ffff-ffff-ffffffffffff")])
+        partitions = uuid_partitions(4)
+        self.assertEqual(
+            partitions[1],
+            ("3fffffff-ffff-ffff-ffff-ffffffffffff", "7fffffff-ffff-ffff-ffff-ffffffffffff"),
+        )
+        for prev, next_ in zip(partitions, partitions[1:]):
+            self.assertEqual(prev[1], next_[0])
+
+    def test_scan_pages(self):
+        """
+        Test the `scan_pages` function.
+        """
+
+        for num_partitions in [1, 3, 8]:
+            for page_size in [1, 5, 100]:
+                with self.subTest(num_partitions=num_partitions, page_size=page_size):
+                    pages = list(scan_pages(_get_page, page_size, num_partitions))
+                    self.assertTrue(all(len(page) <= page_size for page in pages))
+                    self.assertEqual(sorted(obj["id"] for page in pages for obj in page), UUIDS)
+
+                    pages = list(scan_pages(_get_page, page_size, num_partitions, after=UUIDS[20]))
+                    self.assertEqual(
+                        sorted(obj["id"] for page in pages for obj in page), UUIDS[21:]
+                    )
+
+    def test_scan_pages_error(self):
+        """
+        Test that `scan_pages` raises the exceptions of `get_page`.
+        """
+
+        def get_page(after, limit):
+            raise ValueError("Test!")
+
+        with self.assertRaises(ValueError):
+            list(scan_pages(get_page, 10, 4))
+
+    def test_scan_pages_target_latency(self):
+        """
+        Test adapting the page size to `target_latency`.
+        """
+
+        limits = []
+
+        def get_page(after, limit):
+            limits.append(limit)
+            return _get_page(after, limit)
+
+        pages = list(scan_pages(get_page, 2, target_latency=10.0, max_page_size=8))
+        self.assertEqual(sorted(obj["id"] for page in pages for obj in page), UUIDS)
+        self.assertEqual(limits[:4], [2, 4, 8, 8])
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.tmp_path = Path(directory.name)
+
+    def test_npy_writer(self):
+        """
+        Test the `NpyWriter` class.
+        """
+
+        np = pytest.importorskip("numpy")
+
+        path = str(self.tmp_path / "vectors.npy")
+        writer = NpyWriter(path)
+        writer.write_objects([{"vector": [0.5, 1.0]}, {"vector": [2.0, 3.0]}])
+        with self.assertRaises(ValueError):
+            writer.write([1.0])
+        writer.close()
+        np.testing.assert_array_equal(np.load(path), np.array([[0.5, 1.0], [2.0, 3.0]], np.float32))
+
+        # objects without a vector are not written
+        writer = NpyWriter(path)
+        with self.assertRaises(ValueError):
+            writer.write_objects([{"id": "a", "vector": [0.5]}, {"id": "b"}])
+        writer.close()
+        self.assertEqual(np.load(path).shape, (0, 0))
+
+    def test_parquet_writer(self):
+        """
+        Test the `ParquetWriter` class.
+        """
+
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        path = str(self.tmp_path / "objects.parquet")
+        properties = [
+            {"name": "n", "dataType": ["int"]},
+            {"name": "tags", "dataType": ["text[]"]},
+            {"name": "location", "dataType": ["geoCoordinates"]},
+            {"name": "hasAuthor", "dataType": ["Author"]},
+        ]
+        writer = ParquetWriter(path, properties)
+        # the properties that are missing or null in the first page are kept
+        writer.write_objects([{"id": UUIDS[0], "properties": {"n": 1}}])
+        writer.write_objects(
+            [
+                {
+                    "id": UUIDS[1],
+                    "properties": {
+                        "n": 2,
+                        "tags": ["a"],
+                        "location": {"latitude": 1.0, "longitude": 2.0},
+                        "hasAuthor": [{"beacon": "weaviate://localhost/Author/x", "href": "x"}],
+                    },
+                }
+            ]
+        )
+        writer.close()
+
+        table = pq.read_table(path)
+        self.assertEqual(table.column_names, ["id", "n", "tags", "location", "hasAuthor"])
+        rows = table.to_pylist()
+        self.assertEqual(rows[1]["tags"], ["a"])
+        self.assertEqual(rows[1]["location"], {"latitude": 1.0, "longitude": 2.0})
+        self.assertIsNone(rows[0]["tags"])
+
+    def test_export(self):
+        """
+        Test the `DataObject.export` method.
+        """
+
+        def get(path, params):
+            objects = [
+                {"id": obj["id"], "properties": {"n": UUIDS.index(obj["id"])}, "vector": [1.0]}
+                for obj in _get_page(params.get("after"), params["limit"])
+            ]
+            return Mock(status_code=200, json=Mock(return_value={"objects": objects}))
+
+        connection = mock_connection_func("get", side_effect=get, server_version="1.18.0")
+        jsonl_path = self.tmp_path / "objects.jsonl"
+        vectors_path = self.tmp_path / "vectors.npy"
+        num_exported = DataObject(connection).export(
+            "Test", jsonl_path=str(jsonl_path), vectors_path=str(vectors_path), page_size=4
+        )
+        self.assertEqual(num_exported, len(UUIDS))
+        lines = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+        self.assertEqual([line["id"] for line in lines], UUIDS)
+        self.assertEqual(lines[3]["properties"], {"n": 3})
+        self.assertEqual(connection.get.call_args[1]["params"]["include"], "vector")
+
+        with self.assertRaises(ValueError):
+            DataObject(connection).export("Test")
+
+    def test_iterate(self):
+        """
+        Test the `DataObject.iterate` method.
+        """
+
+        def get(path, params):
+            objects = _get_page(params.get("after"), params["limit"])
+            return Mock(status_code=200, json=Mock(return_value={"objects": objects}))
+
+        connection = mock_connection_func("get", side_effect=get, server_version="1.18.0")
+        data_object = DataObject(connection)
+        objects = data_object.iterate("Test", page_size=5)
+        connection.get.assert_not_called()
+        self.assertEqual([obj["id"] for obj in objects], UUIDS)
+
+        # resume from a checkpoint
+        objects = data_object.iterate("Test", 5, after=UUIDS[9])
+        self.assertEqual([obj["id"] for obj in objects], UUIDS[10:])
+
+        objects = data_object.iterate("Test", page_size=5, num_partitions=4)
+        self.assertEqual(sorted(obj["id"] for obj in objects), UUIDS)
+
+        with self.assertRaises(ValueError):
+            data_object.iterate("Test", page_size=0)
@@ -0,0 +1,202 @@
+import re
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from test.util import mock_connection_func
+from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.gql.batcher import QueryBatcher, _has_request_errors, _split_response
+from weaviate.gql.get import GetBuilder
+from weaviate.gql.query import Query
+
+
+def _multi_get_response(**kwargs) -> Mock:
+    """
+    Answer with the limit of every query, by alias or class name, e.g. 'q0: Article(limit: 3 )'
+    gets {"q0": [{"limit": 3}]}.
+    """
+
+    sent = kwargs["weaviate_object"]["query"]
+    data = {
+        alias or class_name: [{"limit": int(limit)}]
+        for alias, class_name, limit in re.findall(r"(?:(q\d+): )?(\w+)\(limit: (\d+) \)", sent)
+    }
+    response = Mock(status_code=200)
+    response.json.return_value = {"data": {"Get": data}}
+    return response
+
+
+class TestQueryBatcher(unittest.TestCase):
+    def test_concurrent_queries_are_batched(self):
+        """
+        Test that concurrent queries are sent as one request and every caller gets its result.
+        """
+
+        connection_mock = mock_connection_func("post", side_effect=_multi_get_response)
+        query = Query(connection_mock)
+        # the batch is sent as soon as it is full
+        query.batcher.window = 10
+        query.batcher.max_batch_size = 3
+
+        builders = [
+            query.get("Article", ["title"]).with_limit(1).with_auto_batching(),
+            query.get("Article", ["title"]).with_limit(2).with_auto_batching(),
+            query.get("Author", ["name"]).with_alias("writer").with_limit(3).with_auto_batching(),
+        ]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda builder: builder.do(), builders))
+
+        self.assertEqual(connection_mock.post.call_count, 1)
+        sent = connection_mock.post.call_args[1]["weaviate_object"]["query"]
+        self.assertTrue(sent.startswith("{Get{"))
+        self.assertEqual(sorted(re.findall(r"q\d+", sent)), ["q0", "q1", "q2"])
+
+        # every caller gets the slice of its own query
+        self.assertEqual(results[0], {"data": {"Get": {"Article": [{"limit": 1}]}}})
+        self.assertEqual(results[1], {"data": {"Get": {"Article": [{"limit": 2}]}}})
+        self.assertEqual(results[2], {"data": {"Get": {"writer": [{"limit": 3}]}}})
+        self.assertEqual(query.batcher.stats, {"requests": 1, "queries": 3})
+        # the aliases are only set on copies
+        self.assertIsNone(builders[0]._alias)
+        self.assertEqual(builders[2]._alias, "writer")
+
+    def test_request_errors_resend_every_query(self):
+        """
+        Test that every query is sent alone if the batch fails as a whole.
+        """
+
+        def post(**kwargs):
+            sent = kwargs["weaviate_object"]["query"]
+            if "bad" in sent:
+                response = Mock(status_code=200)
+                response.json.return_value = {
+                    "data": None,
+                    "errors": [{"message": "Cannot query field 'bad' on type 'Article'."}],
+                }
+                return response
+            return _multi_get_response(**kwargs)
+
+        connection_mock = mock_connection_func("post", side_effect=post)
+        query = Query(connection_mock)
+        query.batcher.window = 10
+        query.batcher.max_batch_size = 2
+
+        builders = [
+            query.get("Article", ["title"]).with_limit(1).with_auto_batching(),
+            query.get("Article", ["bad"]).with_limit(2).with_auto_batching(),
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda builder: builder.do(), builders))
+
+        self.assertEqual(connection_mock.post.call_count, 3)
+        self.assertEqual(results[0], {"data": {"Get": {"Article": [{"limit": 1}]}}})
+        self.assertIsNone(results[1]["data"])
+        self.assertEqual(len(results[1]["errors"]), 1)
+
+    def test_resent_queries_are_concurrent_and_fail_alone(self):
+        """
+        Test that the queries sent alone after a failed batch run concurrently and that the
+        error of one query only fails its own caller.
+        """
+
+        # every query sent alone waits for the other one
+        barrier = threading.Barrier(2, timeout=5)
+
+        def post(**kwargs):
+            sent = kwargs["weaviate_object"]["query"]
+            if "q0:" in sent:
+                response = Mock(status_code=200)
+                response.json.return_value = {"data": None, "errors": [{"message": "all"}]}
+                return response
+            barrier.wait()
+            if "bad" in sent:
+                return Mock(status_code=500)
+            return _multi_get_response(**kwargs)
+
+        connection_mock = mock_connection_func("post", side_effect=post)
+        query = Query(connection_mock)
+        query.batcher.window = 10
+        query.batcher.max_batch_size = 2
+
+        builders = [
+            query.get("Article", ["title"]).with_limit(1).with_auto_batching(),
+            query.get("Article", ["bad"]).with_limit(2).with_auto_batching(),
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(builder.do) for builder in builders]
+            self.assertEqual(futures[0].result(), {"data": {"Get": {"Article": [{"limit": 1}]}}})
+            with self.assertRaises(UnexpectedStatusCodeException):
+                futures[1].result()
+        self.assertEqual(connection_mock.post.call_count, 3)
+
+    def test_single_query(self):
+        """
+        Test that a query without others is sent unchanged.
+        """
+
+        response = {"data": {"Get": {"Article": [{"title": "A"}]}}}
+        connection_mock = mock_connection_func("post", return_json=response)
+        query = Query(connection_mock)
+        query.batcher.window = 0
+
+        self.assertEqual(query.get("Article", ["title"]).with_auto_batching().do(), response)
+        sent = connection_mock.post.call_args[1]["weaviate_object"]["query"]
+        self.assertEqual(sent, "{Get{Article{title}}}")
+
+    def test_errors_are_shared(self):
+        """
+        Test that every caller of a failed request gets its exception.
+        """
+
+        connection_mock = mock_connection_func("post", status_code=500)
+        query = Query(connection_mock)
+        query.batcher.window = 10
+        query.batcher.max_batch_size = 2
+
+        builders = [query.get("Article", ["title"]).with_auto_batching() for _ in range(2)]
+        builders[1].with_limit(1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(builder.do) for builder in builders]
+            for future in futures:
+                with self.assertRaises(UnexpectedStatusCodeException):
+                    future.result()
+        self.assertEqual(connection_mock.post.call_count, 1)
+
+    def test_split_response(self):
+        """
+        Test the `_split_response` and `_has_request_errors` functions.
+        """
+
+        builders = [GetBuilder("Article", ["title"], None), GetBuilder("Author", ["name"], None)]
+        response = {
+            "data": {"Get": {"q0": [{"title": "A"}], "q1": None}},
+            "errors": [{"message": "bad", "path": ["Get", "q1", 0]}],
+        }
+
+        self.assertFalse(_has_request_errors(response, 2))
+        self.assertEqual(
+            _split_response(response, builders),
+            [
+                {"data": {"Get": {"Article": [{"title": "A"}]}}},
+                {
+                    "data": {"Get": {"Author": None}},
+                    "errors": [{"message": "bad", "path": ["Get", "Author", 0]}],
+                },
+            ],
+        )
+        self.assertTrue(_has_request_errors({"data": None, "errors": [{"message": "all"}]}, 2))
+
+    def test_validation(self):
+        """
+        Test the validation of the arguments.
+        """
+
+        with self.assertRaises(ValueError):
+            QueryBatcher(Mock(), window=-1)
+        with self.assertRaises(ValueError):
+            QueryBatcher(Mock(), max_batch_size=0)
+        with self.assertRaises(TypeError):
+            QueryBatcher(Mock(), max_batch_size=1.5)
+        with self.assertRaises(AttributeError):
+            GetBuilder("Article", ["title"], Mock()).with_auto_batching()
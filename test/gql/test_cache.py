@@ -0,0 +1,162 @@
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from test.util import mock_connection_func
+from weaviate.data import DataObject
+from weaviate.gql.cache import QueryCache
+from weaviate.gql.query import Query
+
+RESULT = {"data": {"Get": {"Article": [{"title": "A"}]}}}
+
+
+class TestQueryCache(unittest.TestCase):
+    def test_hits_and_copies(self):
+        """
+        Test that hits return copies of the cached result.
+        """
+
+        cache = QueryCache()
+        run = Mock(return_value=RESULT)
+
+        cache.get_or_run("{Get{Article{title}}}", {"Article"}, 10, run)
+        cache.get_or_run("{Get{Article{title}}}", {"Article"}, 10, run)["data"].clear()
+        result = cache.get_or_run("{Get{Article{title}}}", {"Article"}, 10, run)
+
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(result, RESULT)
+        stats = cache.stats
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 1, 1))
+        self.assertEqual(stats["bytes"], len(json.dumps(RESULT)))
+
+    def test_errors_are_not_cached(self):
+        """
+        Test that results with errors are not cached.
+        """
+
+        cache = QueryCache()
+        run = Mock(return_value={"errors": [{"message": "boom"}]})
+
+        cache.get_or_run("{Get{Article{title}}}", {"Article"}, 10, run)
+        cache.get_or_run("{Get{Article{title}}}", {"Article"}, 10, run)
+
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(cache.stats["entries"], 0)
+
+    def test_ttl(self):
+        """
+        Test that results expire after their `ttl`.
+        """
+
+        cache = QueryCache()
+        run = Mock(return_value=RESULT)
+
+        with patch("weaviate.gql.cache.time.monotonic", return_value=100.0):
+            cache.get_or_run("q", {"Article"}, 5, run)
+        with patch("weaviate.gql.cache.time.monotonic", return_value=104.0):
+            cache.get_or_run("q", {"Article"}, 5, run)
+        self.assertEqual(run.call_count, 1)
+        with patch("weaviate.gql.cache.time.monotonic", return_value=105.0):
+            cache.get_or_run("q", {"Article"}, 5, run)
+        self.assertEqual(run.call_count, 2)
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used results are evicted beyond `max_bytes`.
+        """
+
+        size = len(json.dumps(RESULT))
+        cache = QueryCache(max_bytes=2 * size)
+        run = Mock(return_value=RESULT)
+
+        cache.get_or_run("q1", {"Article"}, 10, run)
+        cache.get_or_run("q2", {"Article"}, 10, run)
+        cache.get_or_run("q1", {"Article"}, 10, run)  # q2 is now the least recently used
+        cache.get_or_run("q3", {"Article"}, 10, run)
+        self.assertEqual(cache.stats["evictions"], 1)
+
+        cache.get_or_run("q1", {"Article"}, 10, run)
+        self.assertEqual(run.call_count, 3)
+        cache.get_or_run("q2", {"Article"}, 10, run)
+        self.assertEqual(run.call_count, 4)
+
+        cache.max_bytes = 0
+        self.assertEqual(cache.stats["entries"], 0)
+        self.assertEqual(cache.stats["bytes"], 0)
+
+        with self.assertRaises(ValueError):
+            cache.max_bytes = -1
+        with self.assertRaises(TypeError):
+            cache.max_bytes = 1.5
+
+    def test_invalidate(self):
+        """
+        Test the `invalidate` method.
+        """
+
+        cache = QueryCache()
+        run = Mock(return_value=RESULT)
+
+        cache.get_or_run("article", {"Article"}, 10, run)
+        cache.get_or_run("author", {"Author"}, 10, run)
+        cache.get_or_run("unknown", None, 10, run)
+        cache.invalidate(["article"])
+        self.assertEqual(cache.stats["entries"], 1)  # only the query of "Author" is left
+
+        cache.get_or_run("author", {"Author"}, 10, run)
+        self.assertEqual(run.call_count, 3)
+        cache.invalidate()
+        self.assertEqual(cache.stats["entries"], 0)
+
+    def test_invalidate_while_running(self):
+        """
+        Test that a result is not cached if its classes were written while it ran.
+        """
+
+        cache = QueryCache()
+
+        def run():
+            cache.invalidate(["Article"])
+            return RESULT
+
+        cache.get_or_run("q", {"Article"}, 10, run)
+        self.assertEqual(cache.stats["entries"], 0)
+
+        # writes to other classes do not matter, unless the classes of the query are unknown
+        def run_with_other_write():
+            cache.invalidate(["Author"])
+            return RESULT
+
+        cache.get_or_run("q", {"Article"}, 10, run_with_other_write)
+        self.assertEqual(cache.stats["entries"], 1)
+        cache.get_or_run("unknown", None, 10, run_with_other_write)
+        self.assertEqual(cache.stats["entries"], 1)
+
+    def test_with_cache(self):
+        """
+        Test `with_cache` of the query builders and the invalidation by writes.
+        """
+
+        connection_mock = mock_connection_func("post", return_json=RESULT)
+        query = Query(connection_mock)
+
+        for _ in range(2):
+            result = query.get("Article", ["title"]).with_cache(ttl=30).do()
+            self.assertEqual(result, RESULT)
+        self.assertEqual(connection_mock.post.call_count, 1)
+
+        # not cached without `with_cache`
+        query.get("Article", ["title"]).do()
+        self.assertEqual(connection_mock.post.call_count, 2)
+
+        data_object = DataObject(
+            mock_connection_func("post", return_json={"id": "1"}), query_cache=query.cache
+        )
+        data_object.create({"title": "B"}, "Article")
+        query.get("Article", ["title"]).with_cache(ttl=30).do()
+        self.assertEqual(connection_mock.post.call_count, 3)
+
+        with self.assertRaises(ValueError):
+            query.aggregate("Article").with_cache(ttl=0)
+        with self.assertRaises(TypeError):
+            query.aggregate("Article").with_cache(ttl="30")
@@ -0,0 +1,115 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from test.util import mock_connection_func
+from weaviate.gql.coalescer import QueryCoalescer
+from weaviate.gql.get import GetBuilder
+from weaviate.gql.query import Query
+
+RESULT = {"data": {"Get": {"Article": [{"title": "A"}]}}}
+
+
+def _wait_for_coalesced(coalescer: QueryCoalescer, num: int) -> None:
+    deadline = time.monotonic() + 5
+    while coalescer.stats["coalesced"] < num:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+class TestQueryCoalescer(unittest.TestCase):
+    def test_concurrent_calls_share_one_run(self):
+        """
+        Test that concurrent identical queries share one run.
+        """
+
+        coalescer = QueryCoalescer()
+        release = threading.Event()
+        run = Mock(side_effect=lambda: release.wait() and RESULT)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(coalescer.do, "q", run) for _ in range(4)]
+            _wait_for_coalesced(coalescer, 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(results, [RESULT] * 4)
+        self.assertEqual(len({id(result) for result in results}), 4)
+        self.assertEqual(coalescer.stats, {"runs": 1, "coalesced": 3, "in_flight": 0})
+
+        # nothing is kept after the run
+        coalescer.do("q", run)
+        self.assertEqual(run.call_count, 2)
+
+    def test_leader_result_is_a_copy(self):
+        """
+        Test that modifying the result of the caller that ran the query does not affect the
+        results of the callers that waited.
+        """
+
+        coalescer = QueryCoalescer()
+        result = {"data": {"Get": {"Article": [{"title": "A"}]}}}
+        executor = ThreadPoolExecutor(max_workers=3)
+        self.addCleanup(executor.shutdown)
+        followers = []
+
+        def run():
+            followers.extend(executor.submit(coalescer.do, "q", run) for _ in range(3))
+            _wait_for_coalesced(coalescer, 3)
+            return result
+
+        leader_result = coalescer.do("q", run)
+        self.assertIsNot(leader_result, result)
+        leader_result["data"]["Get"]["Article"].append({"title": "B"})
+        leader_result.pop("data")
+
+        self.assertEqual([future.result() for future in followers], [RESULT] * 3)
+        self.assertEqual(result, RESULT)
+
+    def test_errors_are_shared(self):
+        """
+        Test that the waiting callers get the exception of the run.
+        """
+
+        coalescer = QueryCoalescer()
+        release = threading.Event()
+
+        def run():
+            release.wait()
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(coalescer.do, "q", run) for _ in range(2)]
+            _wait_for_coalesced(coalescer, 1)
+            release.set()
+            for future in futures:
+                with self.assertRaises(ValueError):
+                    future.result()
+        self.assertEqual(coalescer.stats["in_flight"], 0)
+
+    def test_with_coalescing(self):
+        """
+        Test `GetBuilder.with_coalescing`.
+        """
+
+        release = threading.Event()
+        connection_mock = mock_connection_func("post", return_json=RESULT)
+        response = connection_mock.post.return_value
+        connection_mock.post.side_effect = lambda **kwargs: release.wait() and response
+        query = Query(connection_mock)
+
+        def search():
+            return query.get("Article", ["title"]).with_limit(1).with_coalescing().do()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(search) for _ in range(3)]
+            _wait_for_coalesced(query.coalescer, 2)
+            release.set()
+            self.assertEqual([future.result() for future in futures], [RESULT] * 3)
+        self.assertEqual(connection_mock.post.call_count, 1)
+
+        with self.assertRaises(AttributeError):
+            GetBuilder("Article", ["title"], Mock()).with_coalescing()
@@ -357,6 +357,10 @@ class TestNearVector(unittest.TestCase):
             NearVector({"vector": [1.0, 2.0, 3.0, 4.0], "certainty": "0.5"})
         check_error_message(self, error, certainty_error_msg(str))
 
+        ## test "precision"
+        with self.assertRaises(ValueError):
+            NearVector({"vector": [1.0, 2.0, 3.0, 4.0], "precision": 0})
+
         # test valid calls
         NearVector({"vector": [1.0, 2.0, 3.0, 4.0]})
         NearVector({"vector": [1.0, 2.0, 3.0, 4.0], "certainty": 0.75})
@@ -367,11 +371,11 @@ class TestNearVector(unittest.TestCase):
         """
 
         near_vector = NearVector({"vector": [1.0, 2.0, 3.0, 4.0]})
-        self.assertEqual(str(near_vector), "nearVector: {vector: [1.0, 2.0, 3.0, 4.0]} ")
+        self.assertEqual(str(near_vector), "nearVector: {vector: [1,2,3,4]} ")
         near_vector = NearVector({"vector": [1.0, 2.0, 3.0, 4.0], "certainty": 0.75})
-        self.assertEqual(
-            str(near_vector), "nearVector: {vector: [1.0, 2.0, 3.0, 4.0] certainty: 0.75} "
-        )
+        self.assertEqual(str(near_vector), "nearVector: {vector: [1,2,3,4] certainty: 0.75} ")
+        near_vector = NearVector({"vector": [0.123456, 2.5], "precision": 3})
+        self.assertEqual(str(near_vector), "nearVector: {vector: [0.123,2.5]} ")
 
 
 class TestNearObject(unittest.TestCase):
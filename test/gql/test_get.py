@@ -4,7 +4,7 @@ from unittest.mock import patch, Mock
 
 import pytest
 
-from test.util import check_error_message
+from test.util import check_error_message, mock_connection_func
 from weaviate.gql.get import GetBuilder, BM25, Hybrid
 
 mock_connection_v117 = Mock()
@@ -35,7 +35,7 @@ def test_bm25(query: str, properties: List[str], expected: str):
             "query",
             [1, 2, 3],
             0.5,
-            'hybrid:{query: "query", vector: [1, 2, 3], alpha: 0.5}',
+            'hybrid:{query: "query", vector: [1,2,3], alpha: 0.5}',
         ),
         ("query", None, None, 'hybrid:{query: "query"}'),
     ],
@@ -202,7 +202,7 @@ class TestGetBuilder(unittest.TestCase):
         mock_connection.server_version = "1.14.0"
         query = GetBuilder("Person", "name", mock_connection).with_near_vector(near_vector).build()
         self.assertEqual(
-            "{Get{Person(nearVector: {vector: [1, 2, 3, 4, 5, 6, 7, 8, 9] certainty: 0.55} ){name}}}",
+            "{Get{Person(nearVector: {vector: [1,2,3,4,5,6,7,8,9] certainty: 0.55} ){name}}}",
             query,
         )
 
@@ -606,3 +606,48 @@ class TestGetBuilder(unittest.TestCase):
 
         get = GetBuilder("test", ["prop"], None)
         self.assertEqual(get._class_name, "Test")
+
+    def test_prepare(self):
+        """
+        Test the `prepare` method.
+        """
+
+        builder = (
+            GetBuilder("Person", ["name"], Mock())
+            .with_where({"path": ["name"], "operator": "Equal", "valueString": "Alan"})
+            .with_near_vector({"vector": [1.0, 2.0], "distance": 0.5})
+            .with_limit(10)
+            .with_additional("distance")
+        )
+        prepared = builder.prepare()
+        self.assertEqual(sorted(prepared.slots), ["distance", "limit", "vector"])
+        self.assertEqual(prepared.build(), builder.build())
+
+        builder = (
+            GetBuilder("Person", ["name"], Mock())
+            .with_where({"path": ["name"], "operator": "Equal", "valueString": "Alan"})
+            .with_near_vector({"vector": [0.5, 0.25], "distance": 0.5})
+            .with_limit(3)
+            .with_additional("distance")
+        )
+        self.assertEqual(prepared.build(vector=[0.5, 0.25], limit=3), builder.build())
+
+        # the precision of the nearVector content also applies to the bound vectors
+        prepared = (
+            GetBuilder("Person", ["name"], Mock())
+            .with_near_vector({"vector": [1.0, 2.0], "precision": 2})
+            .prepare()
+        )
+        self.assertIn("nearVector: {vector: [0.12,3.5]}", prepared.build(vector=[0.1234, 3.456]))
+
+        connection_mock = mock_connection_func("post", return_json={"data": {}})
+        prepared = GetBuilder("Person", "name", connection_mock).with_limit(1).prepare()
+        self.assertEqual(prepared.do(limit=2), {"data": {}})
+        connection_mock.post.assert_called_with(
+            path="/graphql", weaviate_object={"query": "{Get{Person(limit: 2 ){name}}}"}
+        )
+
+        with self.assertRaises(TypeError):
+            prepared.build(vector=[1.0])
+        with self.assertRaises(ValueError):
+            prepared.build(limit=0)
@@ -1,10 +1,12 @@
+import re
 import unittest
 from unittest.mock import Mock
 
+import pytest
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from test.util import mock_connection_func, check_error_message, check_startswith_error_message
-from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.exceptions import UnexpectedStatusCodeException, WeaviateBaseError
 from weaviate.gql.query import Query
 
 
@@ -64,3 +66,63 @@ class TestQuery(unittest.TestCase):
         with self.assertRaises(UnexpectedStatusCodeException) as error:
             query.raw("TestQuery")
         check_startswith_error_message(self, error, query_error_message)
+
+    def test_batch_near_vector(self):
+        """
+        Test the `batch_near_vector` method.
+        """
+
+        def post(path, weaviate_object):
+            # every query returns 2 objects, with the first element of its vector as id
+            results = {
+                alias: [
+                    {"_additional": {"id": first, "distance": 0.0}},
+                    {"_additional": {"id": first, "distance": 0.5}},
+                ]
+                for alias, first in re.findall(
+                    r"(q\d+): Test\(limit: 2 nearVector: {vector: \[([\d.]+)",
+                    weaviate_object["query"],
+                )
+            }
+            return Mock(status_code=200, json=Mock(return_value={"data": {"Get": results}}))
+
+        connection_mock = mock_connection_func("post", side_effect=post)
+        vectors = [[i + 0.5, 1.0] for i in range(7)]
+        results = Query(connection_mock).batch_near_vector(
+            "Test", vectors, k=2, chunk_size=3, max_workers=2
+        )
+        self.assertEqual(connection_mock.post.call_count, 3)
+        self.assertEqual(
+            [objects[0]["_additional"]["id"] for objects in results],
+            [str(i + 0.5) for i in range(7)],
+        )
+
+        connection_mock = mock_connection_func(
+            "post", return_json={"data": {"Get": {"q0": []}}, "errors": [{"message": "Test!"}]}
+        )
+        with self.assertRaises(WeaviateBaseError):
+            Query(connection_mock).batch_near_vector("Test", vectors[:1], k=2)
+        with self.assertRaises(ValueError):
+            Query(connection_mock).batch_near_vector("Test", vectors, k=0)
+
+    def test_batch_near_vector_as_arrays(self):
+        """
+        Test the `batch_near_vector` method returning numpy arrays.
+        """
+
+        np = pytest.importorskip("numpy")
+        response = {
+            "data": {
+                "Get": {
+                    "q0": [{"_additional": {"id": "a", "distance": 0.25}}],
+                    "q1": [],
+                }
+            }
+        }
+        connection_mock = mock_connection_func("post", return_json=response)
+        ids, distances = Query(connection_mock).batch_near_vector(
+            "Test", np.ones((2, 4), dtype=np.float32), k=2, as_arrays=True
+        )
+        self.assertEqual(ids.tolist(), [["a", None], [None, None]])
+        self.assertEqual(distances[0, 0], 0.25)
+        self.assertTrue(np.isnan(distances[0, 1]) and np.isnan(distances[1]).all())
@@ -0,0 +1,160 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import pytest
+
+from test.util import mock_connection_func
+from weaviate.gql.cache import QueryCache
+from weaviate.gql.query import Query
+from weaviate.gql.semantic_cache import SemanticCache
+
+np = pytest.importorskip("numpy")
+
+RESULT = {"data": {"Get": {"Article": [{"title": "A"}]}}}
+
+
+class TestSemanticCache(unittest.TestCase):
+    def test_similar_vectors(self):
+        """
+        Test that queries with similar vectors share a result.
+        """
+
+        cache = SemanticCache()
+        run = Mock(return_value=RESULT)
+
+        cache.get_or_run("q", [1.0, 0.0], {"Article"}, 0.01, 10, run)
+        # cosine distance of ~0.00005
+        self.assertEqual(cache.get_or_run("q", [1.0, 0.01], {"Article"}, 0.01, 10, run), RESULT)
+        # same direction, different length
+        cache.get_or_run("q", np.array([3.0, 0.0]), {"Article"}, 0.01, 10, run)
+        self.assertEqual(run.call_count, 1)
+
+        # too far, a different query or a different dimension
+        cache.get_or_run("q", [0.9, 0.4], {"Article"}, 0.01, 10, run)
+        cache.get_or_run("other", [1.0, 0.0], {"Article"}, 0.01, 10, run)
+        cache.get_or_run("q", [1.0, 0.0, 0.0], {"Article"}, 0.01, 10, run)
+        self.assertEqual(run.call_count, 4)
+
+        stats = cache.stats
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (2, 4, 4))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 6)
+
+    def test_zero_vector_and_errors_are_not_cached(self):
+        """
+        Test that results with errors and of zero vectors are not cached.
+        """
+
+        cache = SemanticCache()
+        run = Mock(return_value={"errors": [{"message": "boom"}]})
+
+        cache.get_or_run("q", [1.0, 0.0], {"Article"}, 0.01, 10, run)
+        cache.get_or_run("q", [0.0, 0.0], {"Article"}, 0.01, 10, Mock(return_value=RESULT))
+        self.assertEqual(cache.stats["entries"], 0)
+
+    def test_ttl(self):
+        """
+        Test that results expire after their `ttl`.
+        """
+
+        cache = SemanticCache()
+        run = Mock(return_value=RESULT)
+
+        with patch("weaviate.gql.semantic_cache.time.monotonic", return_value=100.0):
+            cache.get_or_run("q", [1.0, 0.0], {"Article"}, 0.01, 5, run)
+        with patch("weaviate.gql.semantic_cache.time.monotonic", return_value=105.0):
+            cache.get_or_run("q", [1.0, 0.0], {"Article"}, 0.01, 5, run)
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(cache.stats["entries"], 1)
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used results are evicted beyond `max_entries`.
+        """
+
+        cache = SemanticCache(max_entries=2)
+        run = Mock(return_value=RESULT)
+
+        cache.get_or_run("q", [1.0, 0.0], {"Article"}, 0.01, 10, run)
+        cache.get_or_run("q", [0.0, 1.0], {"Article"}, 0.01, 10, run)
+        cache.get_or_run("q", [1.0, 0.0], {"Article"}, 0.01, 10, run)  # [0, 1] is now the LRU
+        cache.get_or_run("q", [-1.0, 0.0], {"Article"}, 0.01, 10, run)
+        self.assertEqual(cache.stats["evictions"], 1)
+
+        cache.get_or_run("q", [1.0, 0.0], {"Article"}, 0.01, 10, run)
+        cache.get_or_run("q", [-1.0, 0.0], {"Article"}, 0.01, 10, run)
+        self.assertEqual(run.call_count, 3)
+        cache.get_or_run("q", [0.0, 1.0], {"Article"}, 0.01, 10, run)
+        self.assertEqual(run.call_count, 4)
+
+        # more vectors than the initial capacity of a group
+        cache.max_entries = 100
+        for vector in np.eye(20):
+            cache.get_or_run("q", vector, {"Article"}, 0.01, 10, run)
+        self.assertEqual(cache.stats["entries"], 22)
+        cache.get_or_run("q", np.eye(20)[7], {"Article"}, 0.01, 10, run)
+        self.assertEqual(run.call_count, 24)
+
+        cache.max_entries = 0
+        self.assertEqual(cache.stats["entries"], 0)
+        with self.assertRaises(ValueError):
+            cache.max_entries = -1
+
+    def test_invalidate(self):
+        """
+        Test the invalidation through the `QueryCache`.
+        """
+
+        query_cache = QueryCache()
+        run = Mock(return_value=RESULT)
+
+        query_cache.semantic.get_or_run("q", [1.0, 0.0], {"Article"}, 0.01, 10, run)
+        query_cache.semantic.get_or_run("q", [0.0, 1.0], {"Author"}, 0.01, 10, run)
+        query_cache.invalidate(["Article"])
+        self.assertEqual(query_cache.semantic.stats["entries"], 1)
+        query_cache.invalidate()
+        self.assertEqual(query_cache.semantic.stats["entries"], 0)
+
+        def run_with_write(class_name):
+            query_cache.invalidate([class_name])
+            return RESULT
+
+        # only results of queries that raced a write to their class are not cached
+        query_cache.semantic.get_or_run(
+            "q", [1.0, 0.0], {"Article"}, 0.01, 10, lambda: run_with_write("Article")
+        )
+        self.assertEqual(query_cache.semantic.stats["entries"], 0)
+        query_cache.semantic.get_or_run(
+            "q", [1.0, 0.0], {"Article"}, 0.01, 10, lambda: run_with_write("Author")
+        )
+        self.assertEqual(query_cache.semantic.stats["entries"], 1)
+
+    def test_with_semantic_cache(self):
+        """
+        Test `GetBuilder.with_semantic_cache`.
+        """
+
+        connection_mock = mock_connection_func("post", return_json=RESULT)
+        connection_mock.grpc_stub = None
+        query = Query(connection_mock)
+
+        def search(vector, limit=10):
+            return (
+                query.get("Article", ["title"])
+                .with_near_vector({"vector": vector})
+                .with_limit(limit)
+                .with_semantic_cache(max_distance=0.01, ttl=30)
+                .do()
+            )
+
+        self.assertEqual(search([1.0, 0.0]), RESULT)
+        self.assertEqual(search([1.0, 0.01]), RESULT)
+        self.assertEqual(connection_mock.post.call_count, 1)
+        search([1.0, 0.01], limit=5)
+        self.assertEqual(connection_mock.post.call_count, 2)
+
+        with self.assertRaises(AttributeError):
+            query.get("Article", ["title"]).with_semantic_cache(0.01, 30).do()
+        with self.assertRaises(ValueError):
+            query.get("Article", ["title"]).with_semantic_cache(-0.01, 30)
+        with self.assertRaises(TypeError):
+            query.get("Article", ["title"]).with_semantic_cache(0.01, None)
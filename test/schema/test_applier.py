@@ -0,0 +1,104 @@
+import threading
+import unittest
+from unittest.mock import Mock
+
+from test.util import mock_connection_func
+from weaviate.exceptions import SchemaApplyException
+from weaviate.schema import Schema
+from weaviate.schema.applier import apply_in_order
+
+
+class TestApplier(unittest.TestCase):
+    def test_apply_in_order(self):
+        """
+        Test that operations run after their dependencies and failures skip dependents.
+        """
+
+        order = []
+        lock = threading.Lock()
+
+        def operation(key):
+            def _run():
+                if key == "fail":
+                    raise ValueError("Test!")
+                with lock:
+                    order.append(key)
+
+            return _run
+
+        operations = {
+            "a": (operation("a"), ()),
+            "b": (operation("b"), ("unknown",)),
+            "c": (operation("c"), ("a", "b")),
+            "d": (operation("d"), ("c",)),
+        }
+        apply_in_order(operations, max_workers=4)
+        self.assertEqual(sorted(order[:2]), ["a", "b"])
+        self.assertEqual(order[2:], ["c", "d"])
+
+        order.clear()
+        operations["fail"] = (operation("fail"), ())
+        operations["e"] = (operation("e"), ("fail",))
+        operations["f"] = (operation("f"), ("e",))
+        with self.assertRaises(SchemaApplyException) as error:
+            apply_in_order(operations, max_workers=2)
+        self.assertEqual(list(error.exception.errors), ["fail"])
+        self.assertEqual(sorted(error.exception.skipped), ["e", "f"])
+        self.assertEqual(sorted(order), ["a", "b", "c", "d"])
+
+        cyclic = {"a": (Mock(), ("b",)), "b": (Mock(), ("a",))}
+        with self.assertRaises(SchemaApplyException) as error:
+            apply_in_order(cyclic, max_workers=2)
+        self.assertEqual(sorted(error.exception.errors), ["a", "b"])
+
+    def test_schema_create_concurrently(self):
+        """
+        Test `Schema.create` with `max_workers`.
+        """
+
+        created = []
+        lock = threading.Lock()
+
+        def post(path, weaviate_object):
+            with lock:
+                if path == "/schema":
+                    created.append(weaviate_object["class"])
+                else:
+                    class_name = path.split("/")[2]
+                    # the class and the referenced classes must already exist
+                    assert class_name in created
+                    assert all(dtype in created for dtype in weaviate_object["dataType"])
+                    created.append(f"{class_name}.{weaviate_object['name']}")
+            return Mock(status_code=200)
+
+        schema = {
+            "classes": [
+                {
+                    "class": "article",
+                    "properties": [
+                        {"name": "title", "dataType": ["text"]},
+                        {"name": "hasAuthors", "dataType": ["author"]},
+                    ],
+                },
+                {
+                    "class": "Author",
+                    "properties": [{"name": "wroteArticles", "dataType": ["Article"]}],
+                },
+                {"class": "Publisher"},
+            ]
+        }
+        Schema(mock_connection_func("post", side_effect=post)).create(schema, max_workers=4)
+        self.assertEqual(
+            sorted(created),
+            ["Article", "Article.hasAuthors", "Author", "Author.wroteArticles", "Publisher"],
+        )
+
+        connection_mock = mock_connection_func("post", status_code=422)
+        with self.assertRaises(SchemaApplyException) as error:
+            Schema(connection_mock).create(schema, max_workers=4)
+        self.assertEqual(len(error.exception.errors), 3)
+        self.assertEqual(len(error.exception.skipped), 2)
+        self.assertEqual(connection_mock.post.call_count, 3)
+
+        with self.assertRaises(ValueError):
+            Schema(connection_mock).create(schema, max_workers=0)
@@ -0,0 +1,168 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from test.util import mock_connection_func
+from weaviate.data import DataObject
+from weaviate.schema import Schema
+from weaviate.schema.cache import SchemaCache
+
+UUID = "154cbccd-89f4-4b29-9c1b-001a3339d89d"
+SCHEMA = {
+    "classes": [
+        {"class": "Article", "properties": [{"name": "title", "dataType": ["text"]}]},
+        {"class": "Author", "properties": None},
+    ]
+}
+
+
+class TestSchemaCache(unittest.TestCase):
+    def test_lookups(self):
+        """
+        Test the class and property lookups.
+        """
+
+        fetch = Mock(return_value=SCHEMA)
+        cache = SchemaCache(fetch)
+        self.assertIs(cache.get(), SCHEMA)
+        self.assertEqual(cache.get_class("article")["class"], "Article")
+        self.assertIsNone(cache.get_class("Book"))
+        self.assertTrue(cache.contains_class("Author"))
+        self.assertFalse(cache.contains_class("Book"))
+        self.assertEqual(cache.get_property("Article", "title")["dataType"], ["text"])
+        self.assertIsNone(cache.get_property("Article", "body"))
+        self.assertIsNone(cache.get_property("Author", "name"))
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_invalidation(self):
+        """
+        Test the invalidation by version, TTL and refresh.
+        """
+
+        fetch = Mock(return_value=SCHEMA)
+        cache = SchemaCache(fetch, ttl=None)
+        cache.get()
+        cache.get()
+        self.assertEqual(fetch.call_count, 1)
+        cache.invalidate()
+        self.assertEqual(cache.version, 1)
+        cache.get()
+        self.assertEqual(fetch.call_count, 2)
+        cache.refresh()
+        self.assertEqual(fetch.call_count, 3)
+
+        cache.ttl = 0
+        cache.get()
+        cache.get()
+        self.assertEqual(fetch.call_count, 5)
+
+        cache.ttl = 10
+        cache.invalidate()
+        with patch("weaviate.schema.cache.time.monotonic", return_value=100.0):
+            cache.get()
+        with patch("weaviate.schema.cache.time.monotonic", return_value=105.0):
+            cache.get()
+        self.assertEqual(fetch.call_count, 6)
+        with patch("weaviate.schema.cache.time.monotonic", return_value=111.0):
+            cache.get()
+        self.assertEqual(fetch.call_count, 7)
+
+        with self.assertRaises(ValueError):
+            cache.ttl = -1
+
+    def test_fetch_during_invalidation(self):
+        """
+        Test that a schema fetched before an invalidation is not cached.
+        """
+
+        fetching = threading.Event()
+        invalidated = threading.Event()
+
+        def fetch():
+            if not invalidated.is_set():
+                fetching.set()
+                invalidated.wait()
+                return {"classes": []}
+            return SCHEMA
+
+        cache = SchemaCache(fetch)
+        thread = threading.Thread(target=cache.get)
+        thread.start()
+        fetching.wait()
+        cache.invalidate()
+        invalidated.set()
+        thread.join()
+        self.assertTrue(cache.contains_class("Article"))
+
+    def test_schema_use_cache(self):
+        """
+        Test `Schema.get`/`Schema.contains` with the cache and its invalidation by mutations.
+        """
+
+        connection_mock = mock_connection_func("get", return_json=SCHEMA)
+        connection_mock = mock_connection_func("delete", connection_mock=connection_mock)
+        connection_mock = mock_connection_func("post", connection_mock=connection_mock)
+        schema = Schema(connection_mock)
+
+        self.assertEqual(schema.get(use_cache=True), SCHEMA)
+        self.assertEqual(schema.get("article", use_cache=True), SCHEMA["classes"][0])
+        self.assertTrue(
+            schema.contains({"classes": [{"class": "Article", "properties": []}]}, use_cache=True)
+        )
+        self.assertEqual(connection_mock.get.call_count, 1)
+
+        # copies are returned
+        schema.get(use_cache=True)["classes"].clear()
+        self.assertEqual(len(schema.get(use_cache=True)["classes"]), 2)
+
+        # unknown classes are requested
+        schema.get("Book", use_cache=True)
+        connection_mock.get.assert_called_with(path="/schema/Book")
+
+        schema.delete_class("Author")
+        schema.get(use_cache=True)
+        self.assertEqual(connection_mock.get.call_count, 3)
+
+        schema.property.create("Article", {"name": "body", "dataType": ["text"]})
+        schema.get(use_cache=True)
+        self.assertEqual(connection_mock.get.call_count, 4)
+
+        schema.create_class({"class": "Book"})
+        schema.get(use_cache=True)
+        self.assertEqual(connection_mock.get.call_count, 5)
+
+    def test_internal_readers(self):
+        """
+        Test that `Schema.update_config` (with `use_cache=True`) and `DataObject.get_by_ids` read
+        the cached classes.
+        """
+
+        def get(path):
+            if path == "/schema":
+                return Mock(status_code=200, json=Mock(return_value=SCHEMA))
+            return Mock(status_code=200, json=Mock(return_value=SCHEMA["classes"][0]))
+
+        connection_mock = mock_connection_func("get", side_effect=get)
+        connection_mock = mock_connection_func("put", connection_mock=connection_mock)
+        connection_mock = mock_connection_func(
+            "post", return_json={"data": {"Get": {"Article": []}}}, connection_mock=connection_mock
+        )
+        schema = Schema(connection_mock)
+        schema.cache.get()
+
+        schema.update_config("Article", {"description": "changed"}, use_cache=True)
+        self.assertEqual(connection_mock.get.call_count, 1)
+        sent = connection_mock.put.call_args[1]["weaviate_object"]
+        self.assertEqual(sent["description"], "changed")
+        # the cached class is not modified
+        self.assertNotIn("description", SCHEMA["classes"][0])
+
+        # the live class is fetched by default
+        schema.update_config("Article", {})
+        self.assertEqual(connection_mock.get.call_count, 2)
+
+        schema.cache.get()
+        data_object = DataObject(connection_mock, schema_cache=schema.cache)
+        data_object.get_by_ids("Article", [UUID])
+        self.assertEqual(connection_mock.get.call_count, 3)
+        self.assertEqual(connection_mock.post.call_count, 1)
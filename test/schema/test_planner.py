@@ -0,0 +1,179 @@
+import unittest
+from unittest.mock import Mock
+
+from test.util import mock_connection_func
+from weaviate.exceptions import SchemaValidationException
+from weaviate.schema import Schema
+from weaviate.schema.planner import plan_schema_changes
+
+LIVE_SCHEMA = {
+    "classes": [
+        {
+            "class": "Article",
+            "vectorIndexConfig": {"ef": -1, "efConstruction": 128},
+            "invertedIndexConfig": {"bm25": {"b": 0.75, "k1": 1.2}},
+            "properties": [{"name": "title", "dataType": ["text"]}],
+        },
+        {"class": "Old", "properties": None},
+    ]
+}
+
+
+class TestPlanner(unittest.TestCase):
+    def test_plan_schema_changes(self):
+        """
+        Test `plan_schema_changes`.
+        """
+
+        # contained schema, nothing to do
+        desired = {
+            "classes": [
+                {
+                    "class": "article",
+                    "vectorIndexConfig": {"ef": -1},
+                    "properties": [{"name": "title", "dataType": ["text"]}],
+                }
+            ]
+        }
+        self.assertEqual(plan_schema_changes(desired, LIVE_SCHEMA), [])
+
+        desired = {
+            "classes": [
+                {
+                    "class": "Article",
+                    "vectorIndexConfig": {"ef": 100},
+                    "invertedIndexConfig": {"bm25": {"b": 0.75, "k1": 1.2}},
+                    "properties": [
+                        {"name": "title", "dataType": ["text"]},
+                        {"name": "body", "dataType": ["text"]},
+                        {"name": "hasAuthors", "dataType": ["author"]},
+                    ],
+                },
+                {
+                    "class": "Author",
+                    "properties": [
+                        {"name": "name", "dataType": ["text"]},
+                        {"name": "wroteArticles", "dataType": ["Article"]},
+                    ],
+                },
+            ]
+        }
+        operations = plan_schema_changes(desired, LIVE_SCHEMA)
+        self.assertEqual(
+            [operation.key for operation in operations],
+            [
+                ("create_class", "Author"),
+                ("add_property", "Article", "body"),
+                ("add_property", "Article", "hasAuthors"),
+                ("add_property", "Author", "wroteArticles"),
+                ("update_config", "Article"),
+            ],
+        )
+        create, body, has_authors, wrote_articles, update = operations
+        self.assertEqual(create.payload["properties"], [{"name": "name", "dataType": ["text"]}])
+        self.assertEqual(body.depends_on, [])
+        self.assertEqual(has_authors.depends_on, [("create_class", "Author")])
+        self.assertEqual(wrote_articles.depends_on, [("create_class", "Author")])
+        self.assertEqual(update.payload, {"vectorIndexConfig": {"ef": 100}})
+        # the config update PUTs the whole class, so it waits for the new properties
+        self.assertEqual(update.depends_on, [body.key, has_authors.key])
+
+        operations = plan_schema_changes({"classes": []}, LIVE_SCHEMA, delete_missing=True)
+        self.assertEqual(
+            [operation.key for operation in operations],
+            [("delete_class", "Article"), ("delete_class", "Old")],
+        )
+
+        changed_type = {
+            "classes": [
+                {"class": "Article", "properties": [{"name": "title", "dataType": ["int"]}]}
+            ]
+        }
+        with self.assertRaises(SchemaValidationException):
+            plan_schema_changes(changed_type, LIVE_SCHEMA)
+
+        for setting in [
+            {"vectorizer": "text2vec-openai"},
+            {"vectorIndexType": "flat"},
+            {"moduleConfig": {"text2vec-openai": {"model": "ada"}}},
+            {"shardingConfig": {"desiredCount": 3}},
+        ]:
+            changed_setting = {"classes": [{"class": "Article", **setting}]}
+            with self.assertRaises(SchemaValidationException):
+                plan_schema_changes(changed_setting, LIVE_SCHEMA)
+        # an equal immutable setting is not a change
+        same_setting = {"classes": [{"class": "Article", "vectorizer": "none"}]}
+        live = {"classes": [{**LIVE_SCHEMA["classes"][0], "vectorizer": "none"}]}
+        self.assertEqual(plan_schema_changes(same_setting, live), [])
+
+    def test_schema_migrate(self):
+        """
+        Test `Schema.plan` and `Schema.migrate`.
+        """
+
+        connection_mock = mock_connection_func(
+            "get", return_json=LIVE_SCHEMA, status_code=200, server_version="1.18.0"
+        )
+        connection_mock.post.return_value = Mock(status_code=200)
+        connection_mock.delete.return_value = Mock(status_code=200)
+        schema = Schema(connection_mock)
+
+        desired = {
+            "classes": [
+                {
+                    "class": "Article",
+                    "properties": [
+                        {"name": "title", "dataType": ["text"]},
+                        {"name": "hasAuthors", "dataType": ["Author"]},
+                    ],
+                },
+                {"class": "Author"},
+            ]
+        }
+        self.assertEqual(len(schema.plan(desired)), 2)
+        self.assertEqual(connection_mock.post.call_count, 0)
+
+        operations = schema.migrate(desired, delete_missing=True)
+        self.assertEqual(len(operations), 3)
+        paths = [call.kwargs["path"] for call in connection_mock.post.call_args_list]
+        self.assertEqual(paths, ["/schema", "/schema/Article/properties"])
+        connection_mock.delete.assert_called_once_with(path="/schema/Old")
+
+        with self.assertRaises(ValueError):
+            schema.migrate(desired, max_workers=0)
+
+    def test_schema_migrate_update_config(self):
+        """
+        Test that `Schema.migrate` updates the config of the live class with its new properties.
+        """
+
+        article = LIVE_SCHEMA["classes"][0]
+        live_article = {
+            **article,
+            "properties": article["properties"] + [{"name": "body", "dataType": ["text"]}],
+        }
+
+        def get(path):
+            if path == "/schema/Article":
+                return Mock(status_code=200, json=Mock(return_value=live_article))
+            return Mock(status_code=200, json=Mock(return_value=LIVE_SCHEMA))
+
+        connection_mock = mock_connection_func("get", side_effect=get, server_version="1.18.0")
+        connection_mock.post.return_value = Mock(status_code=200)
+        connection_mock.put.return_value = Mock(status_code=200)
+        schema = Schema(connection_mock)
+
+        desired = {
+            "classes": [
+                {
+                    "class": "Article",
+                    "vectorIndexConfig": {"ef": 100},
+                    "properties": [{"name": "body", "dataType": ["text"]}],
+                }
+            ]
+        }
+        schema.migrate(desired)
+        connection_mock.post.assert_called_once()
+        put = connection_mock.put.call_args.kwargs["weaviate_object"]
+        self.assertEqual(put["properties"], live_article["properties"])
+        self.assertEqual(put["vectorIndexConfig"]["ef"], 100)
@@ -6,7 +6,7 @@ from unittest.mock import patch, Mock
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from test.util import mock_connection_func, check_error_message, check_startswith_error_message
-from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.exceptions import SchemaApplyException, UnexpectedStatusCodeException
 from weaviate.schema import Schema
 from weaviate.util import _capitalize_first_letter
 
@@ -374,6 +374,58 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(mock_connection.get.call_count, 1)
         self.assertEqual(mock_connection.delete.call_count, 2)
 
+    def test_update_class_shard(self):
+        """
+        Test the `update_class_shard` and `update_classes_shards` methods.
+        """
+
+        shards = {
+            "/schema/Article/shards": [
+                {"name": f"shard{i}", "status": "READONLY"} for i in range(5)
+            ],
+            "/schema/Author/shards": [{"name": "shard0", "status": "READONLY"}],
+        }
+
+        def put(path, weaviate_object):
+            status_code = 500 if path == "/schema/Article/shards/shard3" else 200
+            return Mock(status_code=status_code, json=Mock(return_value=weaviate_object))
+
+        mock_connection = mock_connection_func(
+            "get",
+            side_effect=lambda path: Mock(status_code=200, json=Mock(return_value=shards[path])),
+        )
+        mock_connection = mock_connection_func("put", connection_mock=mock_connection)
+        mock_connection.put.return_value.json.return_value = {"status": "READY"}
+        schema = Schema(mock_connection)
+
+        self.assertEqual(
+            schema.update_class_shard("article", "READY", "shard1"), {"status": "READY"}
+        )
+        self.assertEqual(
+            schema.update_class_shard("Article", "READY", max_workers=3), [{"status": "READY"}] * 5
+        )
+        self.assertEqual(
+            schema.update_classes_shards(["Article", "Author"], "READY"),
+            {"Article": [{"status": "READY"}] * 5, "Author": [{"status": "READY"}]},
+        )
+
+        mock_connection.put.side_effect = put
+        with self.assertRaises(SchemaApplyException) as error:
+            schema.update_classes_shards(["Article", "Author"], "READY")
+        self.assertEqual(list(error.exception.errors), [("Article", "shard3")])
+        self.assertEqual(mock_connection.put.call_count, 1 + 5 + 6 + 6)
+
+        # a single class raises the error of the failed request
+        with self.assertRaises(UnexpectedStatusCodeException) as error:
+            schema.update_class_shard("Article", "READY")
+        self.assertIsInstance(error.exception.__cause__, SchemaApplyException)
+        self.assertEqual(mock_connection.put.call_count, 1 + 5 + 6 + 6 + 5)
+
+        with self.assertRaises(TypeError):
+            schema.update_classes_shards("Article", "READY")
+        with self.assertRaises(ValueError):
+            schema.update_classes_shards(["Article"], "READY", max_workers=0)
+
     def test__create_complex_properties_from_classes(self):
         """
         Test the `_create_complex_properties_from_classes` method.
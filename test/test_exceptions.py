@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 from unittest.mock import Mock
 
@@ -8,6 +10,8 @@ from weaviate.exceptions import (
     ObjectAlreadyExistsException,
     AuthenticationFailedException,
     SchemaValidationException,
+    SchemaApplyException,
+    QueryFailedException,
 )
 
 
@@ -62,3 +66,28 @@ class TestExceptions(unittest.TestCase):
 
         exception = SchemaValidationException("Test")
         self.assertEqual(str(exception), "Test")
+
+    def test_schema_apply(self):
+        """
+        Test the `SchemaApplyException` exception.
+        """
+
+        exception = SchemaApplyException({"op": "Test"}, ["skipped"])
+        self.assertEqual(
+            str(exception),
+            "1 schema operation(s) failed and 1 dependent operation(s) were skipped: op: Test",
+        )
+        for copied in [pickle.loads(pickle.dumps(exception)), copy.copy(exception)]:
+            self.assertEqual(str(copied), str(exception))
+            self.assertEqual((copied.errors, copied.skipped), ({"op": "Test"}, ["skipped"]))
+
+    def test_query_failed(self):
+        """
+        Test the `QueryFailedException` exception.
+        """
+
+        exception = QueryFailedException("Test", [{"message": "error"}])
+        self.assertEqual(str(exception), "Test: [{'message': 'error'}]")
+        for copied in [pickle.loads(pickle.dumps(exception)), copy.copy(exception)]:
+            self.assertEqual(str(copied), str(exception))
+            self.assertEqual(copied.errors, [{"message": "error"}])
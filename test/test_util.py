@@ -1,8 +1,11 @@
+import json
 import unittest
 import uuid as uuid_lib
 from copy import deepcopy
 from unittest.mock import patch, Mock
 
+import pytest
+
 from test.util import check_error_message
 from weaviate import SchemaValidationException
 from weaviate.util import (
@@ -13,10 +16,13 @@ from weaviate.util import (
     is_object_url,
     is_weaviate_object_url,
     get_vector,
+    format_vector,
     get_valid_uuid,
     get_domain_from_weaviate_url,
     _get_dict_from_object,
     _is_sub_schema,
+    _is_version_at_least,
+    _import_optional,
 )
 
 schema_set = {
@@ -459,3 +465,54 @@ class TestUtil(unittest.TestCase):
         result = generate_uuid5("TestID!", "Test!")
         self.assertIsInstance(result, str)
         mock_uuid.uuid5.assert_called()
+
+    def test_format_vector(self):
+        """
+        Test the `format_vector` function.
+        """
+
+        # lists and float64 are formatted losslessly
+        self.assertEqual(format_vector([0.1, 2.0, 3]), "[0.10000000000000001,2,3]")
+        self.assertEqual(json.loads(format_vector([0.1, 1 / 3, -3e-10])), [0.1, 1 / 3, -3e-10])
+        self.assertEqual(format_vector([0.123456, 2.0, -3e-10], precision=3), "[0.123,2,-3e-10]")
+        self.assertEqual(format_vector([], precision=3), "[]")
+        with self.assertRaises(ValueError):
+            format_vector([0.1], precision=0)
+        with self.assertRaises(TypeError):
+            format_vector({0.1})
+        with self.assertRaises(TypeError):
+            format_vector(["0.1"])
+
+        np = pytest.importorskip("numpy")
+        vector = np.random.rand(1, 100).astype(np.float32)
+        # float32 is formatted losslessly with fewer digits
+        parsed = np.array(json.loads(format_vector(vector)), dtype=np.float32)
+        self.assertTrue((parsed == vector[0]).all())
+        self.assertLess(len(format_vector(vector)), len(format_vector(vector.astype(np.float64))))
+        self.assertEqual(format_vector(np.array([0.5])), "[0.5]")
+        vector = np.random.rand(100)
+        self.assertTrue((np.array(json.loads(format_vector(vector))) == vector).all())
+
+    def test__is_version_at_least(self):
+        """
+        Test the `_is_version_at_least` function.
+        """
+
+        self.assertTrue(_is_version_at_least("1.21.0", "1.21"))
+        self.assertTrue(_is_version_at_least("1.22.0-rc.0", "1.21"))
+        self.assertTrue(_is_version_at_least("2.0", "1.21"))
+        self.assertFalse(_is_version_at_least("1.9.0", "1.21"))
+        self.assertFalse(_is_version_at_least("1.13.2", "1.14"))
+
+    def test__import_optional(self):
+        """
+        Test the `_import_optional` function.
+        """
+
+        self.assertIs(_import_optional("json", "Testing"), json)
+        with self.assertRaises(ImportError) as error:
+            _import_optional("not_installed_package.sub", "Testing")
+        self.assertEqual(
+            str(error.exception),
+            "Testing requires 'not_installed_package': pip install not_installed_package",
+        )
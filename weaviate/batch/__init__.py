@@ -3,5 +3,6 @@ Module for uploading objects and references to Weaviate in batches.
 """
 
 from .crud_batch import Batch
+from .sync import IncrementalSync
 
-__all__ = ["Batch"]
+__all__ = ["Batch", "IncrementalSync"]
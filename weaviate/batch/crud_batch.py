@@ -2,22 +2,46 @@
 Batch class definitions.
 """
 import datetime
+import queue
 import sys
 import threading
 import time
 import warnings
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from numbers import Real
-from typing import Tuple, Callable, Optional, Sequence, Union, List
+from typing import (
+    Any,
+    Tuple,
+    Callable,
+    Optional,
+    Sequence,
+    Union,
+    List,
+    Dict,
+    Hashable,
+    Iterable,
+    Set,
+)
 
 from requests import ReadTimeout, Response
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from weaviate.data.replication import ConsistencyLevel
+from weaviate.gql.aggregate import AggregateBuilder
+from weaviate.gql.cache import QueryCache
 from weaviate.types import UUID
+from .importers import (
+    iter_import_items,
+    load_vectors,
+    prefetch,
+    read_csv,
+    read_jsonl,
+    read_parquet,
+)
 from .requests import BatchRequest, ObjectsBatchRequest, ReferenceBatchRequest, BatchResponse
 from ..error_msgs import (
     BATCH_REF_DEPRECATION_NEW_V14_CLS_NS_W,
@@ -29,6 +53,8 @@ from ..util import (
     _capitalize_first_letter,
     check_batch_result,
     _check_positive_num,
+    _is_version_at_least,
+    get_valid_uuid,
 )
 from ..warnings import _Warnings
 
@@ -101,6 +127,128 @@ class BatchExecutor(ThreadPoolExecutor):
         return self._shutdown
 
 
+class CallbackDispatcher:
+    """
+    Runs the user supplied batch callbacks in a dedicated thread, so the BatchExecutor workers do not
+    wait on user code. Callbacks are executed one at a time in the order they were submitted.
+    """
+
+    _STOP = object()
+
+    def __init__(self, max_queue_size: int, drop_when_full: bool = False):
+        """
+        Initialize a CallbackDispatcher class instance and start its thread.
+
+        Parameters
+        ----------
+        max_queue_size : int
+            The maximal number of responses waiting for their callback.
+        drop_when_full : bool, optional
+            Whether to drop responses when the queue is full instead of blocking the submitting
+            thread until there is room, by default False
+        """
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._drop_when_full = drop_when_full
+        self._errors: List[Exception] = []
+        self.num_dropped = 0
+        self._thread = threading.Thread(
+            target=self._run, name="weaviate-batch-callback", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, callback: Callable[[BatchResponse], None], response: BatchResponse) -> None:
+        """
+        Queue a response for its callback.
+
+        Parameters
+        ----------
+        callback : Callable[[BatchResponse], None]
+            The callback to run.
+        response : BatchResponse
+            The response to run the callback on.
+        """
+
+        if not self._drop_when_full:
+            self._queue.put((callback, response))
+            return
+        try:
+            self._queue.put_nowait((callback, response))
+        except queue.Full:
+            self.num_dropped += 1
+
+    def join(self) -> None:
+        """
+        Wait until all queued callbacks have run and re-raise the first exception raised by a
+        callback since the last call.
+
+        Raises
+        ------
+        Exception
+            The first exception raised by a callback.
+        """
+
+        self._queue.join()
+        if len(self._errors) != 0:
+            error = self._errors[0]
+            self._errors = []
+            raise error
+
+    def is_alive(self) -> bool:
+        """
+        Check if the dispatcher thread is running.
+
+        Returns
+        -------
+        bool
+            Whether the dispatcher accepts callbacks.
+        """
+
+        return self._thread.is_alive()
+
+    def shutdown(self) -> None:
+        """
+        Run all queued callbacks and stop the dispatcher thread. The exceptions raised by
+        callbacks that were not re-raised by `join` are reported with a warning.
+        """
+
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if len(self._errors) != 0:
+            errors, self._errors = self._errors, []
+            _Warnings.batch_callback_errors_at_shutdown(errors)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                callback, response = item
+                callback(response)
+            except Exception as error:
+                self._errors.append(error)
+            finally:
+                self._queue.task_done()
+
+
+class _BatchShard:
+    """
+    Per producer-thread buffer of a thread-safe Batch. The lock is only contended when the shard is
+    merged into the shared Batch buffer.
+    """
+
+    def __init__(self, deduplicate: bool):
+        self.thread = threading.current_thread()
+        self.lock = threading.Lock()
+        self.objects = ObjectsBatchRequest(deduplicate=deduplicate)
+        self.references = ReferenceBatchRequest()
+
+    def __len__(self) -> int:
+        return len(self.objects) + len(self.references)
+
+
 class Batch:
     """
     Batch class used to add multiple objects or object references at once into weaviate.
@@ -234,7 +382,7 @@ class Batch:
     on how/why and what you need to configure/set in order to use a particular Case.
     """
 
-    def __init__(self, connection: Connection):
+    def __init__(self, connection: Connection, query_cache: Optional[QueryCache] = None):
         """
         Initialize a Batch class instance. This defaults to manual creation configuration.
         See docs for the `configure` or `__call__` method for different types of configurations.
@@ -243,12 +391,16 @@ class Batch:
         ----------
         connection : weaviate.connect.Connection
             Connection object to an active and running weaviate instance.
+        query_cache : Optional[weaviate.gql.cache.QueryCache], optional
+            The query cache invalidated by the writes, by default None
         """
 
         # set all protected attributes
         self._connection = connection
+        self._query_cache = query_cache if query_cache is not None else QueryCache()
         self._objects_batch = ObjectsBatchRequest()
         self._reference_batch = ReferenceBatchRequest()
+        self._inflight_uuids: Dict[str, Future] = {}
         # do not keep too many past values, so it is a better estimation of the throughput is computed for 1 second
         self._objects_throughput_frame = deque(maxlen=5)
         self._references_throughput_frame = deque(maxlen=5)
@@ -267,9 +419,22 @@ class Batch:
         self._connection_error_retries = 3
         self._batching_type = None
         self._num_workers = 1
+        self._max_workers = None
+        self._current_num_workers = 1
+        self._keep_executor = False
         self._consistency_level = None
+        self._return_futures = False
+        self._callback_queue_size = None
+        self._callback_queue_policy = "block"
+        self._deduplicate = False
+        self._thread_safe = False
+        self._shards: List[_BatchShard] = []
+        self._shards_lock = threading.Lock()
+        self._local_shard = threading.local()
+        self._send_lock = threading.RLock()
         # thread pool executor
         self._executor: Optional[BatchExecutor] = None
+        self._callback_dispatcher: Optional[CallbackDispatcher] = None
 
     def configure(
         self,
@@ -282,6 +447,13 @@ class Batch:
         dynamic: bool = False,
         num_workers: int = 1,
         consistency_level: Optional[ConsistencyLevel] = None,
+        return_futures: bool = False,
+        callback_queue_size: Optional[int] = None,
+        callback_queue_policy: str = "block",
+        deduplicate: bool = False,
+        thread_safe: bool = False,
+        max_workers: Optional[int] = None,
+        keep_executor: bool = False,
     ) -> "Batch":
         """
         Configure the instance to your needs. (`__call__` and `configure` methods are the same).
@@ -316,6 +488,42 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        return_futures : bool, optional
+            Whether `add_data_object` and `add_reference` should return a `concurrent.futures.Future`
+            that resolves with the item's entry of the BatchResponse once it was sent to weaviate,
+            by default False
+        callback_queue_size : Optional[int], optional
+            If set, the `callback` runs in a dedicated thread that is fed by a queue of this size,
+            instead of in the thread that sent the batch. Callbacks still run one at a time in the
+            order the responses were received. Exceptions raised by the callback are re-raised by
+            the next `flush`. If None the callback runs in the sending thread, by default None
+        callback_queue_policy : str, optional
+            What to do when the callback queue is full, possible values:
+            - "block" : The sending thread waits until there is room in the queue.
+            - "drop" : The response is not passed to the callback, see `num_dropped_callbacks`.
+            By default "block"
+        deduplicate : bool, optional
+            Whether to keep only the last added version of an object UUID in the batch and to send
+            an object only after all in-flight batches that contain the same UUID are done. This
+            makes multiple `num_workers` safe for streams that update the same objects. The
+            futures (see `return_futures`) of replaced objects resolve with the entry of the object
+            that replaced them, by default False
+        thread_safe : bool, optional
+            Whether the Batch can be shared by multiple producer threads. Each thread adds to its
+            own buffer, which is merged into the Batch when it reaches the batch size (for AUTO or
+            DYNAMIC batching) or when `flush`/`create_objects`/`create_references` is called. `flush`
+            sends the merged buffers in requests of at most the batch size, by default False
+        max_workers : Optional[int], optional
+            If set, the number of concurrent batch requests scales between `num_workers` and
+            `max_workers`: it grows while all in-flight requests are still busy when a new batch is
+            ready, shrinks while they are all already done, and is halved on timeouts. Only used
+            for AUTO or DYNAMIC batching. If None the number of workers is fixed, by default None
+        keep_executor : bool, optional
+            Whether the BatchExecutor (and CallbackDispatcher) should be kept alive when exiting the
+            context manager, so that short consecutive `with client.batch as batch:` sessions reuse
+            the same threads. The recommended batch sizes learned with dynamic batching are kept as
+            well when re-configuring the Batch. Call `shutdown` to stop the threads,
+            by default False
 
         Returns
         -------
@@ -340,6 +548,13 @@ class Batch:
             dynamic=dynamic,
             num_workers=num_workers,
             consistency_level=consistency_level,
+            return_futures=return_futures,
+            callback_queue_size=callback_queue_size,
+            callback_queue_policy=callback_queue_policy,
+            deduplicate=deduplicate,
+            thread_safe=thread_safe,
+            max_workers=max_workers,
+            keep_executor=keep_executor,
         )
 
     def __call__(
@@ -353,6 +568,13 @@ class Batch:
         dynamic: bool = False,
         num_workers: int = 1,
         consistency_level: Optional[ConsistencyLevel] = None,
+        return_futures: bool = False,
+        callback_queue_size: Optional[int] = None,
+        callback_queue_policy: str = "block",
+        deduplicate: bool = False,
+        thread_safe: bool = False,
+        max_workers: Optional[int] = None,
+        keep_executor: bool = False,
     ) -> "Batch":
         """
         Configure the instance to your needs. (`__call__` and `configure` methods are the same).
@@ -387,6 +609,42 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        return_futures : bool, optional
+            Whether `add_data_object` and `add_reference` should return a `concurrent.futures.Future`
+            that resolves with the item's entry of the BatchResponse once it was sent to weaviate,
+            by default False
+        callback_queue_size : Optional[int], optional
+            If set, the `callback` runs in a dedicated thread that is fed by a queue of this size,
+            instead of in the thread that sent the batch. Callbacks still run one at a time in the
+            order the responses were received. Exceptions raised by the callback are re-raised by
+            the next `flush`. If None the callback runs in the sending thread, by default None
+        callback_queue_policy : str, optional
+            What to do when the callback queue is full, possible values:
+            - "block" : The sending thread waits until there is room in the queue.
+            - "drop" : The response is not passed to the callback, see `num_dropped_callbacks`.
+            By default "block"
+        deduplicate : bool, optional
+            Whether to keep only the last added version of an object UUID in the batch and to send
+            an object only after all in-flight batches that contain the same UUID are done. This
+            makes multiple `num_workers` safe for streams that update the same objects. The
+            futures (see `return_futures`) of replaced objects resolve with the entry of the object
+            that replaced them, by default False
+        thread_safe : bool, optional
+            Whether the Batch can be shared by multiple producer threads. Each thread adds to its
+            own buffer, which is merged into the Batch when it reaches the batch size (for AUTO or
+            DYNAMIC batching) or when `flush`/`create_objects`/`create_references` is called. `flush`
+            sends the merged buffers in requests of at most the batch size, by default False
+        max_workers : Optional[int], optional
+            If set, the number of concurrent batch requests scales between `num_workers` and
+            `max_workers`: it grows while all in-flight requests are still busy when a new batch is
+            ready, shrinks while they are all already done, and is halved on timeouts. Only used
+            for AUTO or DYNAMIC batching. If None the number of workers is fixed, by default None
+        keep_executor : bool, optional
+            Whether the BatchExecutor (and CallbackDispatcher) should be kept alive when exiting the
+            context manager, so that short consecutive `with client.batch as batch:` sessions reuse
+            the same threads. The recommended batch sizes learned with dynamic batching are kept as
+            well when re-configuring the Batch. Call `shutdown` to stop the threads,
+            by default False
 
         Returns
         -------
@@ -401,6 +659,16 @@ class Batch:
             If the value of one of the arguments is wrong.
         """
         self.consistency_level = consistency_level
+        _check_bool(return_futures, "return_futures")
+        self._return_futures = return_futures
+        _check_bool(deduplicate, "deduplicate")
+        _check_bool(thread_safe, "thread_safe")
+        self._deduplicate = deduplicate
+        self._merge_shards()
+        self._objects_batch.deduplicate = deduplicate
+        self._thread_safe = thread_safe
+        _check_bool(keep_executor, "keep_executor")
+        self._keep_executor = keep_executor
         if creation_time is not None:
             _check_positive_num(creation_time, "creation_time", Real)
             self._creation_time = creation_time
@@ -411,6 +679,7 @@ class Batch:
         _check_non_negative(connection_error_retries, "connection_error_retries", int)
 
         self._callback = callback
+        self._configure_callback_dispatcher(callback_queue_size, callback_queue_policy)
 
         self._timeout_retries = timeout_retries
         self._connection_error_retries = connection_error_retries
@@ -423,20 +692,31 @@ class Batch:
 
         _check_positive_num(batch_size, "batch_size", int)
         _check_positive_num(num_workers, "num_workers", int)
+        if max_workers is not None:
+            _check_positive_num(max_workers, "max_workers", int)
+            if max_workers < num_workers:
+                raise ValueError("'max_workers' must be greater or equal to 'num_workers'.")
         _check_bool(dynamic, "dynamic")
 
         self._batch_size = batch_size
         if dynamic is False:  # set Batch to auto-commit with fixed batch_size
             self._batching_type = "fixed"
-        else:  # else set to 'dynamic'
+        elif not (  # keep the learned recommendations of a kept executor
+            keep_executor
+            and self._batching_type == "dynamic"
+            and self._recommended_num_objects is not None
+            and self._recommended_num_references is not None
+        ):
             self._batching_type = "dynamic"
             self._recommended_num_objects = batch_size
             self._recommended_num_references = batch_size
 
-        if self._num_workers != num_workers:
+        if self._num_workers != num_workers or self._max_workers != max_workers:
             self.flush()
             self.shutdown()
             self._num_workers = num_workers
+            self._max_workers = max_workers
+            self._current_num_workers = num_workers
             self.start()
 
         self._auto_create()
@@ -448,7 +728,7 @@ class Batch:
         class_name: str,
         uuid: Optional[UUID] = None,
         vector: Optional[Sequence] = None,
-    ) -> str:
+    ) -> Union[str, Future]:
         """
         Add one object to this batch.
         NOTE: If the UUID of one of the objects already exists then the existing object will be
@@ -475,8 +755,10 @@ class Batch:
 
         Returns
         -------
-        str
+        Union[str, concurrent.futures.Future]
             The UUID of the added object. If one was not provided a UUIDv4 will be generated.
+            If `return_futures` is enabled, a Future that resolves with the object's entry of the
+            BatchResponse (which contains the UUID under "id") is returned instead.
 
         Raises
         ------
@@ -485,14 +767,21 @@ class Batch:
         ValueError
             If 'uuid' is not of a proper form.
         """
-        uuid = self._objects_batch.add(
-            class_name=_capitalize_first_letter(class_name),
-            data_object=data_object,
-            uuid=uuid,
-            vector=vector,
-        )
+        shard = self._get_shard() if self._thread_safe else None
+        with nullcontext() if shard is None else shard.lock:
+            objects_batch = self._objects_batch if shard is None else shard.objects
+            uuid = objects_batch.add(
+                class_name=_capitalize_first_letter(class_name),
+                data_object=data_object,
+                uuid=uuid,
+                vector=vector,
+            )
+            if self._return_futures:
+                uuid = objects_batch.add_future()
 
-        if self._batching_type:
+        if shard is not None:
+            self._auto_merge_shard(shard)
+        elif self._batching_type:
             self._auto_create()
 
         return uuid
@@ -504,7 +793,7 @@ class Batch:
         from_property_name: str,
         to_object_uuid: UUID,
         to_object_class_name: Optional[str] = None,
-    ) -> None:
+    ) -> Optional[Future]:
         """
         Add one reference to this batch.
 
@@ -528,6 +817,12 @@ class Batch:
             versions of Weaviate Server and Clients. Use None value ONLY for Weaviate < v1.14.0,
             by default None
 
+        Returns
+        -------
+        Optional[concurrent.futures.Future]
+            If `return_futures` is enabled, a Future that resolves with the reference's entry of
+            the BatchResponse, otherwise None.
+
         Raises
         ------
         TypeError
@@ -560,17 +855,125 @@ class Batch:
                     )
                 to_object_class_name = _capitalize_first_letter(to_object_class_name)
 
-        self._reference_batch.add(
-            from_object_class_name=_capitalize_first_letter(from_object_class_name),
-            from_object_uuid=from_object_uuid,
-            from_property_name=from_property_name,
-            to_object_uuid=to_object_uuid,
-            to_object_class_name=to_object_class_name,
-        )
+        shard = self._get_shard() if self._thread_safe else None
+        with nullcontext() if shard is None else shard.lock:
+            reference_batch = self._reference_batch if shard is None else shard.references
+            reference_batch.add(
+                from_object_class_name=_capitalize_first_letter(from_object_class_name),
+                from_object_uuid=from_object_uuid,
+                from_property_name=from_property_name,
+                to_object_uuid=to_object_uuid,
+                to_object_class_name=to_object_class_name,
+            )
+            future = reference_batch.add_future() if self._return_futures else None
 
-        if self._batching_type:
+        if shard is not None:
+            self._auto_merge_shard(shard)
+        elif self._batching_type:
             self._auto_create()
 
+        return future
+
+    def _get_shard(self) -> _BatchShard:
+        """
+        Get the buffer of the current thread, create it if it does not exist yet.
+
+        Returns
+        -------
+        _BatchShard
+            The buffer of the current thread.
+        """
+
+        shard = getattr(self._local_shard, "shard", None)
+        if shard is None:
+            shard = _BatchShard(self._deduplicate)
+            self._local_shard.shard = shard
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _auto_merge_shard(self, shard: _BatchShard) -> None:
+        """
+        Merge the buffer of the current thread into the Batch and auto-create if it reached the
+        batch size. For MANUAL batching the buffers are only merged by `flush` and the create
+        methods.
+
+        Parameters
+        ----------
+        shard : _BatchShard
+            The buffer of the current thread.
+        """
+
+        if self._batching_type is None:
+            return
+        if self._is_full(len(shard.objects), len(shard.references)):
+            with self._send_lock:
+                self._merge_shard(shard)
+                self._auto_create()
+
+    def _merge_shard(self, shard: _BatchShard) -> None:
+        with shard.lock:
+            objects, shard.objects = shard.objects, ObjectsBatchRequest(
+                deduplicate=self._deduplicate
+            )
+            references, shard.references = shard.references, ReferenceBatchRequest()
+        self._objects_batch.merge(objects)
+        self._reference_batch.merge(references)
+
+    def _merge_shards(self, send_full: bool = False) -> None:
+        """
+        Merge the buffers of all producer threads into the Batch, and drop the buffers of the
+        threads that ended.
+
+        Parameters
+        ----------
+        send_full : bool, optional
+            Whether to send the Batch before merging a buffer would make it reach the batch size,
+            and whenever it reaches the batch size, so that no request carries the buffers of all
+            the threads at once. Only used for AUTO or DYNAMIC batching, by default False
+        """
+
+        with self._shards_lock:
+            shards = list(self._shards)
+        # checked before merging, so an ended thread cannot have added after its merge
+        ended = [shard for shard in shards if not shard.thread.is_alive()]
+        send_full = send_full and self._batching_type is not None
+        with self._send_lock:
+            for shard in shards:
+                if (
+                    send_full
+                    and not (self._objects_batch.is_empty() and self._reference_batch.is_empty())
+                    and self._is_full(
+                        len(self._objects_batch) + len(shard.objects),
+                        len(self._reference_batch) + len(shard.references),
+                    )
+                ):
+                    self._send_batch_requests(force_wait=False)
+                self._merge_shard(shard)
+                if send_full:
+                    self._auto_create()
+        if len(ended) != 0:
+            with self._shards_lock:
+                self._shards = [shard for shard in self._shards if shard not in ended]
+
+    def _shards_shape(self) -> Tuple[int, int]:
+        """
+        Get the number of objects and references in the buffers of the producer threads that are
+        not merged yet.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The number of objects and references, respectively.
+        """
+
+        with self._shards_lock:
+            shards = list(self._shards)
+        return (
+            sum(len(shard.objects) for shard in shards),
+            sum(len(shard.references) for shard in shards),
+        )
+
     def _create_data(
         self,
         data_type: str,
@@ -606,6 +1009,8 @@ class Batch:
             If weaviate reports a none OK status.
         """
         params = {"consistency_level": self._consistency_level} if self._consistency_level else None
+        futures = batch_request.pop_futures()
+        class_names = _get_batch_class_names(data_type, batch_request)
 
         try:
             timeout_count = connection_count = batch_error_count = 0
@@ -651,15 +1056,19 @@ class Batch:
                         )
                         if len(batch_to_retry) > 0:
                             self._run_callback(response_json_successful)
+                            _resolve_futures(futures, response_json_successful)
 
                             batch_error_count += 1
                             batch_request = batch_to_retry
                             continue  # run the request again, but only with objects that had errors
 
                     self._run_callback(response_json)
+                    _resolve_futures(futures, response_json)
                     break
         except RequestsConnectionError as conn_err:
-            raise RequestsConnectionError("Batch was not added to weaviate.") from conn_err
+            error = RequestsConnectionError("Batch was not added to weaviate.")
+            _fail_futures(futures, error)
+            raise error from conn_err
         except ReadTimeout:
             message = (
                 f"The '{data_type}' creation was cancelled because it took "
@@ -667,18 +1076,85 @@ class Batch:
                 f"Try reducing the batch size (currently {len(batch_request)}) to a lower value. "
                 "Aim to on average complete batch request within less than 10s"
             )
-            raise ReadTimeout(message) from None
+            error = ReadTimeout(message)
+            _fail_futures(futures, error)
+            raise error from None
+        except Exception as error:
+            _fail_futures(futures, error)
+            raise
+        finally:
+            self._query_cache.invalidate(class_names)
         if response.status_code == 200:
+            # items confirmed after a timeout have no entry in any response
+            _resolve_futures(futures, None)
             return response
-        raise UnexpectedStatusCodeException(f"Create {data_type} in batch", response)
+        error = UnexpectedStatusCodeException(f"Create {data_type} in batch", response)
+        _fail_futures(futures, error)
+        raise error
 
     def _run_callback(self, response: BatchResponse):
         if self._callback is None:
             return
+        dispatcher = self._callback_dispatcher
+        if dispatcher is not None and dispatcher.is_alive():
+            dispatcher.submit(self._callback, response)
+            return
         # We don't know if user-supplied functions are threadsafe
         with self._callback_lock:
             self._callback(response)
 
+    def _configure_callback_dispatcher(
+        self, callback_queue_size: Optional[int], callback_queue_policy: str
+    ) -> None:
+        """
+        Validate the callback queue configuration and (re)start the CallbackDispatcher if needed.
+
+        Parameters
+        ----------
+        callback_queue_size : Optional[int]
+            The size of the callback queue, None to run callbacks in the sending thread.
+        callback_queue_policy : str
+            Either "block" or "drop".
+
+        Raises
+        ------
+        TypeError
+            If one of the arguments is of a wrong type.
+        ValueError
+            If the value of one of the arguments is wrong.
+        """
+
+        if callback_queue_size is not None:
+            _check_positive_num(callback_queue_size, "callback_queue_size", int)
+        if callback_queue_policy not in ("block", "drop"):
+            raise ValueError(
+                "'callback_queue_policy' must be either 'block' or 'drop'. "
+                f"Given value: {callback_queue_policy}"
+            )
+        if (
+            self._callback_queue_size == callback_queue_size
+            and self._callback_queue_policy == callback_queue_policy
+        ):
+            return
+
+        self._stop_callback_dispatcher()
+        self._callback_queue_size = callback_queue_size
+        self._callback_queue_policy = callback_queue_policy
+        self._start_callback_dispatcher()
+
+    def _start_callback_dispatcher(self) -> None:
+        if self._callback_queue_size is None:
+            return
+        if self._callback_dispatcher is None or not self._callback_dispatcher.is_alive():
+            self._callback_dispatcher = CallbackDispatcher(
+                max_queue_size=self._callback_queue_size,
+                drop_when_full=self._callback_queue_policy == "drop",
+            )
+
+    def _stop_callback_dispatcher(self) -> None:
+        if self._callback_dispatcher is not None:
+            self._callback_dispatcher.shutdown()
+
     def _batch_retry_after_timeout(
         self, data_type: str, batch_request: BatchRequest
     ) -> BatchRequest:
@@ -868,6 +1344,7 @@ class Batch:
             If weaviate reports a none OK status.
         """
 
+        self._merge_shards()
         if len(self._objects_batch) != 0:
             _Warnings.manual_batching()
 
@@ -875,7 +1352,7 @@ class Batch:
                 data_type="objects",
                 batch_request=self._objects_batch,
             )
-            self._objects_batch = ObjectsBatchRequest()
+            self._objects_batch = ObjectsBatchRequest(deduplicate=self._deduplicate)
 
             self._objects_throughput_frame.append(
                 len(self._objects_batch) / response.elapsed.total_seconds()
@@ -963,6 +1440,7 @@ class Batch:
             If weaviate reports a none OK status.
         """
 
+        self._merge_shards()
         if len(self._reference_batch) != 0:
             _Warnings.manual_batching()
 
@@ -1043,34 +1521,47 @@ class Batch:
             )
             self.start()
 
+        uuids = self._objects_batch.uuids() if self._deduplicate else []
+        # never send two versions of the same object concurrently
+        wait([self._inflight_uuids[uuid] for uuid in uuids if uuid in self._inflight_uuids])
+
         future = self._executor.submit(
             self._flush_in_thread,
             data_type="objects",
             batch_request=self._objects_batch,
         )
+        for uuid in uuids:
+            self._inflight_uuids[uuid] = future
 
         self._future_pool.append(future)
         if len(self._reference_batch) > 0:
             self._reference_batch_queue.append(self._reference_batch)
 
-        self._objects_batch = ObjectsBatchRequest()
+        self._objects_batch = ObjectsBatchRequest(deduplicate=self._deduplicate)
         self._reference_batch = ReferenceBatchRequest()
 
-        if not force_wait and self._num_workers > 1 and len(self._future_pool) < self._num_workers:
+        if (
+            not force_wait
+            and self._current_num_workers > 1
+            and len(self._future_pool) < self._current_num_workers
+        ):
             return
+        num_busy = sum(not future.done() for future in self._future_pool)
         timeout_occurred = False
         for done_future in as_completed(self._future_pool):
             response_objects, nr_objects = done_future.result()
 
-            # handle objects response
+            # handle objects response, empty batches are not sent and carry no information
             if response_objects is not None:
                 self._objects_throughput_frame.append(
                     nr_objects / response_objects.elapsed.total_seconds()
                 )
 
-            else:
+            elif nr_objects != 0:
                 timeout_occurred = True
 
+        if not force_wait:
+            self._scale_workers(num_busy, timeout_occurred)
         if timeout_occurred and self._recommended_num_objects is not None:
             self._recommended_num_objects = max(self._recommended_num_objects // 2, 1)
         elif len(self._objects_throughput_frame) != 0 and self._recommended_num_objects is not None:
@@ -1100,7 +1591,7 @@ class Batch:
                 self._references_throughput_frame.append(
                     nr_references / response_references.elapsed.total_seconds()
                 )
-            else:
+            elif nr_references != 0:
                 timeout_occurred = True
 
         if timeout_occurred and self._recommended_num_objects is not None:
@@ -1118,9 +1609,32 @@ class Batch:
             )
 
         self._future_pool = []
+        self._inflight_uuids = {}
         self._reference_batch_queue = []
         return
 
+    def _scale_workers(self, num_busy: int, timeout_occurred: bool) -> None:
+        """
+        Scale the number of concurrent batch requests between `num_workers` and `max_workers`,
+        based on how many of the in-flight requests were still busy when the next batch was ready.
+
+        Parameters
+        ----------
+        num_busy : int
+            The number of in-flight requests that were not done yet.
+        timeout_occurred : bool
+            Whether one of the requests timed out.
+        """
+
+        if self._max_workers is None:
+            return
+        if timeout_occurred:
+            self._current_num_workers = max(self._current_num_workers // 2, self._num_workers)
+        elif num_busy == len(self._future_pool):
+            self._current_num_workers = min(self._current_num_workers + 1, self._max_workers)
+        elif num_busy == 0:
+            self._current_num_workers = max(self._current_num_workers - 1, self._num_workers)
+
     def _auto_create(self) -> None:
         """
         Auto create both objects and references in the batch. This protected method works with a
@@ -1129,18 +1643,41 @@ class Batch:
         creates both batch requests when only one is full.
         """
 
+        # only the merged items are sent, the buffers of producer threads are merged on their own
+        if self._is_full(len(self._objects_batch), len(self._reference_batch)):
+            self._send_batch_requests(force_wait=False)
+
+    def _is_full(self, num_objects: int, num_references: int) -> bool:
+        """
+        Check whether a number of objects and references reaches the batch size.
+
+        Parameters
+        ----------
+        num_objects : int
+            The number of objects.
+        num_references : int
+            The number of references.
+
+        Returns
+        -------
+        bool
+            For a 'fixed' batching type, whether their sum reaches batch_size. For dynamic
+            batching, whether one of them reaches its recommended batch size.
+
+        Raises
+        ------
+        ValueError
+            If the batching type is not supported.
+        """
+
         # greater or equal in case the self._batch_size is changed manually
         if self._batching_type == "fixed":
-            if sum(self.shape) >= self._batch_size:
-                self._send_batch_requests(force_wait=False)
-            return
+            return num_objects + num_references >= self._batch_size
         elif self._batching_type == "dynamic":
-            if (
-                self.num_objects() >= self._recommended_num_objects
-                or self.num_references() >= self._recommended_num_references
-            ):
-                self._send_batch_requests(force_wait=False)
-            return
+            return (
+                num_objects >= self._recommended_num_objects
+                or num_references >= self._recommended_num_references
+            )
         # just in case
         raise ValueError(f'Unsupported batching type "{self._batching_type}"')
 
@@ -1149,7 +1686,243 @@ class Batch:
         Flush both objects and references to the Weaviate server and call the callback function
         if one is provided. (See the docs for `configure` or `__call__` for how to set one.)
         """
-        self._send_batch_requests(force_wait=True)
+        with self._send_lock:
+            self._merge_shards(send_full=True)
+            self._send_batch_requests(force_wait=True)
+        if self._callback_dispatcher is not None and self._callback_dispatcher.is_alive():
+            self._callback_dispatcher.join()
+
+    def import_records(
+        self,
+        records: Iterable[dict],
+        class_name: str,
+        property_mapping: Optional[Dict[str, str]] = None,
+        uuid_column: Optional[str] = None,
+        vector_column: Optional[str] = None,
+        vectors: Union[str, Any, None] = None,
+        max_prefetched: int = 1000,
+    ) -> int:
+        """
+        Import an iterable of records (dicts) as objects of one class. The records are consumed and
+        converted in a separate reader thread that stays at most `max_prefetched` records ahead of
+        the upload, so the memory usage does not depend on the number of records. The batch is
+        flushed at the end. For MANUAL batching (`batch_size` is None) the batch is also flushed
+        every `max_prefetched` objects.
+
+        Parameters
+        ----------
+        records : Iterable[dict]
+            The records to import, e.g. a generator. The records are not modified.
+        class_name : str
+            The name of the class the objects belong to.
+        property_mapping : Optional[Dict[str, str]], optional
+            Mapping from column to property name. Only mapped columns are imported. If None all
+            columns except `uuid_column` and `vector_column` are imported with their own name,
+            by default None
+        uuid_column : Optional[str], optional
+            The column that contains the UUID of the object, by default None (generate UUIDs).
+        vector_column : Optional[str], optional
+            The column that contains the vector of the object, by default None
+        vectors : Union[str, numpy.ndarray, None], optional
+            The path to a `.npy` file (or a 2D array) where row `i` is the vector of the `i`-th
+            record. The file is memory-mapped, so only the rows in use are read. Takes precedence
+            over `vector_column`, by default None
+        max_prefetched : int, optional
+            The maximal number of records read ahead in the reader thread, by default 1000
+
+        Returns
+        -------
+        int
+            The number of imported objects.
+
+        Examples
+        --------
+        >>> with client.batch(batch_size=100, num_workers=2) as batch:
+        ...     batch.import_jsonl(
+        ...         "articles.jsonl",
+        ...         "Article",
+        ...         property_mapping={"headline": "title", "text": "body"},
+        ...         uuid_column="id",
+        ...         vectors="article_vectors.npy",
+        ...     )
+        250000
+        """
+
+        _check_positive_num(max_prefetched, "max_prefetched", int)
+        items = iter_import_items(
+            records=records,
+            property_mapping=property_mapping,
+            uuid_column=uuid_column,
+            vector_column=vector_column,
+            vectors=load_vectors(vectors) if vectors is not None else None,
+        )
+
+        num_imported = 0
+        for properties, uuid, vector in prefetch(items, max_prefetched):
+            self.add_data_object(properties, class_name, uuid, vector)
+            num_imported += 1
+            if self._batching_type is None and self.num_objects() >= max_prefetched:
+                self.flush()
+        self.flush()
+        return num_imported
+
+    def import_jsonl(
+        self,
+        path: str,
+        class_name: str,
+        property_mapping: Optional[Dict[str, str]] = None,
+        uuid_column: Optional[str] = None,
+        vector_column: Optional[str] = None,
+        vectors: Union[str, Any, None] = None,
+        max_prefetched: int = 1000,
+    ) -> int:
+        """
+        Stream a JSON Lines file (one object per line) into this batch, see `import_records`.
+
+        Parameters
+        ----------
+        path : str
+            The path to the JSONL file.
+        class_name : str
+            The name of the class the objects belong to.
+        property_mapping : Optional[Dict[str, str]], optional
+            Mapping from column to property name. Only mapped columns are imported. If None all
+            columns except `uuid_column` and `vector_column` are imported with their own name,
+            by default None
+        uuid_column : Optional[str], optional
+            The column that contains the UUID of the object, by default None (generate UUIDs).
+        vector_column : Optional[str], optional
+            The column that contains the vector of the object, by default None
+        vectors : Union[str, numpy.ndarray, None], optional
+            The path to a `.npy` file (or a 2D array) where row `i` is the vector of the `i`-th
+            record. The file is memory-mapped, so only the rows in use are read. Takes precedence
+            over `vector_column`, by default None
+        max_prefetched : int, optional
+            The maximal number of records read ahead in the reader thread, by default 1000
+
+        Returns
+        -------
+        int
+            The number of imported objects.
+        """
+
+        return self.import_records(
+            read_jsonl(path),
+            class_name,
+            property_mapping,
+            uuid_column,
+            vector_column,
+            vectors,
+            max_prefetched,
+        )
+
+    def import_csv(
+        self,
+        path: str,
+        class_name: str,
+        property_mapping: Optional[Dict[str, str]] = None,
+        uuid_column: Optional[str] = None,
+        vectors: Union[str, Any, None] = None,
+        converters: Optional[Dict[str, Callable[[str], Any]]] = None,
+        max_prefetched: int = 1000,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Stream a CSV file with a header row into this batch, see `import_records`. All values are
+        strings unless converted with `converters`.
+
+        Parameters
+        ----------
+        path : str
+            The path to the CSV file.
+        class_name : str
+            The name of the class the objects belong to.
+        property_mapping : Optional[Dict[str, str]], optional
+            Mapping from column to property name. Only mapped columns are imported. If None all
+            columns except `uuid_column` are imported with their own name, by default None
+        uuid_column : Optional[str], optional
+            The column that contains the UUID of the object, by default None (generate UUIDs).
+        vectors : Union[str, numpy.ndarray, None], optional
+            The path to a `.npy` file (or a 2D array) where row `i` is the vector of the `i`-th
+            row, by default None
+        converters : Optional[Dict[str, Callable[[str], Any]]], optional
+            Functions to convert the values of some columns, e.g. {"price": float},
+            by default None
+        max_prefetched : int, optional
+            The maximal number of records read ahead in the reader thread, by default 1000
+        **kwargs : Any
+            Passed to `csv.DictReader`, e.g. `delimiter`.
+
+        Returns
+        -------
+        int
+            The number of imported objects.
+        """
+
+        return self.import_records(
+            read_csv(path, converters, **kwargs),
+            class_name,
+            property_mapping,
+            uuid_column,
+            None,
+            vectors,
+            max_prefetched,
+        )
+
+    def import_parquet(
+        self,
+        path: str,
+        class_name: str,
+        property_mapping: Optional[Dict[str, str]] = None,
+        uuid_column: Optional[str] = None,
+        vector_column: Optional[str] = None,
+        vectors: Union[str, Any, None] = None,
+        max_prefetched: int = 1000,
+    ) -> int:
+        """
+        Stream a Parquet file into this batch, see `import_records`. Requires `pyarrow`.
+
+        Parameters
+        ----------
+        path : str
+            The path to the Parquet file.
+        class_name : str
+            The name of the class the objects belong to.
+        property_mapping : Optional[Dict[str, str]], optional
+            Mapping from column to property name. Only mapped columns are imported. If None all
+            columns except `uuid_column` and `vector_column` are imported with their own name,
+            by default None
+        uuid_column : Optional[str], optional
+            The column that contains the UUID of the object, by default None (generate UUIDs).
+        vector_column : Optional[str], optional
+            The column that contains the vector of the object, by default None
+        vectors : Union[str, numpy.ndarray, None], optional
+            The path to a `.npy` file (or a 2D array) where row `i` is the vector of the `i`-th
+            record. The file is memory-mapped, so only the rows in use are read. Takes precedence
+            over `vector_column`, by default None
+        max_prefetched : int, optional
+            The maximal number of records read ahead in the reader thread, by default 1000
+
+        Returns
+        -------
+        int
+            The number of imported objects.
+
+        Raises
+        ------
+        ImportError
+            If `pyarrow` is not installed.
+        """
+
+        return self.import_records(
+            read_parquet(path),
+            class_name,
+            property_mapping,
+            uuid_column,
+            vector_column,
+            vectors,
+            max_prefetched,
+        )
 
     def delete_objects(
         self,
@@ -1262,10 +2035,250 @@ class Batch:
             )
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Batch delete was not successful.") from conn_err
+        finally:
+            self._query_cache.invalidate([class_name])
         if response.status_code == 200:
             return response.json()
         raise UnexpectedStatusCodeException("Delete in batch", response)
 
+    def purge_objects(
+        self,
+        class_name: str,
+        where: dict,
+        output: str = "minimal",
+        dry_run: bool = False,
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+        progress: Optional[Callable[[dict], None]] = None,
+    ) -> dict:
+        """
+        Delete ALL objects that match the `where` filter. Weaviate deletes at most `limit` (the
+        `QUERY_MAXIMUM_RESULTS` of the server) objects per `delete_objects` call, so the call is
+        repeated until all matches are deleted. A top level `Or` filter with more than
+        `chunk_size` operands, or a `ContainsAny` filter with more than `chunk_size` values, is
+        split into chunks that are deleted concurrently in `max_workers` threads.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name for which to delete objects.
+        where : dict
+            The content of the `where` filter used to match objects that should be deleted.
+        output : str, optional
+            The control of the verbosity of the output, see `delete_objects`. With "verbose" the
+            objects of all calls are merged, by default "minimal"
+        dry_run : bool, optional
+            If True, objects are not deleted but only counted, with one call per chunk. If the
+            matches of a chunk reach the `limit` of the server they are counted with an
+            `Aggregate` query instead. If that is not possible, e.g. for a filter that GraphQL
+            does not support, the capped matches are counted and "truncated" is True in the
+            result. With "verbose" `output` at most `limit` objects per chunk are listed,
+            by default False
+        chunk_size : int, optional
+            The maximal number of operands/values per chunk of the filter, by default 1000
+        max_workers : int, optional
+            The maximal number of concurrent `delete_objects` calls, by default 4
+        progress : Optional[Callable[[dict], None]], optional
+            Called with a copy of the aggregated result (see Returns, without "objects") after
+            every `delete_objects` call, by default None
+
+        Returns
+        -------
+        dict
+            The aggregated result of all calls, e.g.
+            {
+                "dryRun": False,
+                "results": {"matches": 25000, "successful": 25000, "failed": 0},
+                "requests": 4,
+                "elapsed": 3.2,
+                "objectsPerSecond": 7812.5
+            }
+            where "results" has the merged "objects" too if `output` is "verbose", "elapsed" is in
+            seconds and "objectsPerSecond" counts the successful deletes (the matches if
+            `dry_run` is True). If `dry_run` is True it has "truncated" too, see `dry_run`.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+
+        Examples
+        --------
+        >>> client.batch.purge_objects(
+        ...     class_name="Event",
+        ...     where={"path": ["year"], "operator": "LessThan", "valueInt": 2020},
+        ...     dry_run=True,
+        ... )["results"]["matches"]
+        1200000
+        """
+
+        if not isinstance(where, dict):
+            raise TypeError(f"'where' must be of type dict. Given type: {type(where)}.")
+        _check_positive_num(chunk_size, "chunk_size", int)
+        _check_positive_num(max_workers, "max_workers", int)
+
+        verbose = output == "verbose"
+        total = _new_purge_result(dry_run, verbose)
+        lock = threading.Lock()
+        start = time.perf_counter()
+
+        def _add(results: dict, truncated: bool = False) -> None:
+            with lock:
+                if truncated:
+                    total["truncated"] = True
+                for key in ("matches", "successful", "failed"):
+                    total["results"][key] += results.get(key) or 0
+                if verbose:
+                    total["results"]["objects"].extend(results.get("objects") or [])
+                total["requests"] += 1
+                total["elapsed"] = time.perf_counter() - start
+                num_done = total["results"]["matches" if dry_run else "successful"]
+                total["objectsPerSecond"] = num_done / max(total["elapsed"], 1e-9)
+                if progress is not None:
+                    results_so_far = dict(total["results"])
+                    results_so_far.pop("objects", None)
+                    progress({**total, "results": results_so_far})
+
+        def _purge(chunk: dict) -> None:
+            while True:
+                results = self.delete_objects(class_name, chunk, output, dry_run)["results"]
+                matches = results.get("matches") or 0
+                is_capped = matches >= results.get("limit", matches + 1)
+                if dry_run:
+                    count = self._count_objects(class_name, chunk) if is_capped else matches
+                    if count is not None:
+                        results = {**results, "matches": count}
+                    _add(results, truncated=count is None)
+                    return
+                _add(results)
+                # stop if nothing can be deleted, to not loop forever on failing deletes
+                if results.get("successful", 0) == 0 or not is_capped:
+                    return
+
+        chunks = _split_where(where, chunk_size)
+        if len(chunks) == 1:
+            _purge(chunks[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                for future in [executor.submit(_purge, chunk) for chunk in chunks]:
+                    future.result()
+        return total
+
+    def _count_objects(self, class_name: str, where: dict) -> Optional[int]:
+        """
+        Count the objects that match a `where` filter with an `Aggregate` query, which is not
+        capped at the `limit` of the server like the matches of `delete_objects`.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name of the objects.
+        where : dict
+            The content of the `where` filter.
+
+        Returns
+        -------
+        Optional[int]
+            The number of objects, or None if the filter is not supported by GraphQL or the query
+            returns errors.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        try:
+            builder = AggregateBuilder(class_name, self._connection).with_where(where)
+        except (TypeError, ValueError):
+            return None
+        response = builder.with_meta_count().do()
+        if response.get("errors"):
+            return None
+        return response["data"]["Aggregate"][builder._class_name][0]["meta"]["count"]
+
+    def delete_by_ids(
+        self,
+        class_name: str,
+        uuids: Iterable[UUID],
+        output: str = "minimal",
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+        progress: Optional[Callable[[dict], None]] = None,
+    ) -> dict:
+        """
+        Delete the objects with the given UUIDs. The UUIDs are matched with one `ContainsAny`
+        filter on `id` (Weaviate >= 1.21) or an `Or` of `Equal` filters, which is split into
+        chunks of `chunk_size` UUIDs that are deleted concurrently, see `purge_objects`.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name of the objects.
+        uuids : Iterable[UUID]
+            The UUIDs of the objects to delete. UUIDs of objects that do not exist are ignored.
+        output : str, optional
+            The control of the verbosity of the output, see `delete_objects`. With "verbose" the
+            objects of all chunks are merged, by default "minimal"
+        chunk_size : int, optional
+            The number of UUIDs per `delete_objects` call, by default 1000
+        max_workers : int, optional
+            The maximal number of concurrent `delete_objects` calls, by default 4
+        progress : Optional[Callable[[dict], None]], optional
+            Called with the aggregated result after every `delete_objects` call, see
+            `purge_objects`, by default None
+
+        Returns
+        -------
+        dict
+            The aggregated result of all calls, see `purge_objects`.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+
+        Examples
+        --------
+        >>> client.batch.delete_by_ids("Article", uuids_to_delete)["results"]["successful"]
+        200000
+        """
+
+        uuids = list(dict.fromkeys(get_valid_uuid(uuid) for uuid in uuids))
+        if len(uuids) == 0:
+            return _new_purge_result(dry_run=False, verbose=output == "verbose")
+        if _is_version_at_least(self._connection.server_version, "1.21"):
+            where = {"path": ["id"], "operator": "ContainsAny", "valueTextArray": uuids}
+        else:
+            where = {
+                "operator": "Or",
+                "operands": [
+                    {"path": ["id"], "operator": "Equal", "valueString": uuid} for uuid in uuids
+                ],
+            }
+        return self.purge_objects(
+            class_name,
+            where,
+            output=output,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            progress=progress,
+        )
+
     def num_objects(self) -> int:
         """
         Get current number of objects in the batch.
@@ -1273,9 +2286,12 @@ class Batch:
         Returns
         -------
         int
-            The number of objects in the batch.
+            The number of objects in the batch, including the objects added by the producer
+            threads of a `thread_safe` Batch.
         """
 
+        if self._thread_safe:
+            return len(self._objects_batch) + self._shards_shape()[0]
         return len(self._objects_batch)
 
     def num_references(self) -> int:
@@ -1285,9 +2301,12 @@ class Batch:
         Returns
         -------
         int
-            The number of references in the batch.
+            The number of references in the batch, including the references added by the producer
+            threads of a `thread_safe` Batch.
         """
 
+        if self._thread_safe:
+            return len(self._reference_batch) + self._shards_shape()[1]
         return len(self._reference_batch)
 
     def pop_object(self, index: int = -1) -> dict:
@@ -1381,9 +2400,16 @@ class Batch:
         -------
         Tuple[int, int]
             The number of objects and references, respectively, in the batch as a tuple,
-            i.e. returns (number of objects, number of references).
+            i.e. returns (number of objects, number of references). It includes the objects and
+            references added by the producer threads of a `thread_safe` Batch.
         """
 
+        if self._thread_safe:
+            num_objects, num_references = self._shards_shape()
+            return (
+                len(self._objects_batch) + num_objects,
+                len(self._reference_batch) + num_references,
+            )
         return (len(self._objects_batch), len(self._reference_batch))
 
     @property
@@ -1480,6 +2506,66 @@ class Batch:
     def consistency_level(self, x: Optional[Union[ConsistencyLevel, None]]) -> None:
         self._consistency_level = ConsistencyLevel(x).value if x else None
 
+    @property
+    def return_futures(self) -> bool:
+        """
+        Setter and Getter for `return_futures`.
+
+        Parameters
+        ----------
+        value : bool
+            Setter ONLY: Whether `add_data_object` and `add_reference` should return a
+            `concurrent.futures.Future` for each added item. Only items added after enabling it
+            get a Future.
+
+        Returns
+        -------
+        bool
+            Getter ONLY: Whether futures are returned for added items.
+
+        Raises
+        ------
+        TypeError
+            Setter ONLY: If the new value is not of type bool.
+        """
+
+        return self._return_futures
+
+    @return_futures.setter
+    def return_futures(self, value: bool) -> None:
+        _check_bool(value, "return_futures")
+        self._return_futures = value
+
+    @property
+    def num_workers(self) -> int:
+        """
+        The current number of concurrent batch requests. Equal to the configured `num_workers`
+        unless `max_workers` is set.
+
+        Returns
+        -------
+        int
+            The current number of concurrent batch requests.
+        """
+
+        return self._current_num_workers
+
+    @property
+    def num_dropped_callbacks(self) -> int:
+        """
+        The number of responses that were not passed to the callback because the callback queue
+        was full. Only used with `callback_queue_policy="drop"`.
+
+        Returns
+        -------
+        int
+            The number of dropped responses.
+        """
+
+        if self._callback_dispatcher is None:
+            return 0
+        return self._callback_dispatcher.num_dropped
+
     @property
     def recommended_num_objects(self) -> Optional[int]:
         """
@@ -1517,22 +2603,27 @@ class Batch:
         """
 
         if self._executor is None or self._executor.is_shutdown():
-            self._executor = BatchExecutor(max_workers=self._num_workers)
+            self._executor = BatchExecutor(max_workers=self._max_workers or self._num_workers)
+        self._start_callback_dispatcher()
         return self
 
     def shutdown(self) -> None:
         """
-        Shutdown the BatchExecutor.
+        Shutdown the BatchExecutor and the CallbackDispatcher, if one is used.
         """
         if not (self._executor is None or self._executor.is_shutdown()):
             self._executor.shutdown()
+        self._stop_callback_dispatcher()
 
     def __enter__(self) -> "Batch":
         return self.start()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.flush()
-        self.shutdown()
+        try:
+            self.flush()
+        finally:
+            if not self._keep_executor:
+                self.shutdown()
 
     @property
     def creation_time(self) -> Real:
@@ -1699,6 +2790,157 @@ def _check_bool(value: bool, arg_name: str) -> None:
         raise TypeError(f"'{arg_name}' must be of type bool.")
 
 
+def _resolve_futures(
+    futures: Dict[Hashable, List[List[Future]]], response: Optional[BatchResponse]
+) -> None:
+    """
+    Resolve the futures of the batch items contained in `response`. Each future has its own
+    condition, so no lock is shared between the resolving threads.
+
+    Parameters
+    ----------
+    futures : Dict[Hashable, List[List[Future]]]
+        The pending futures by item key, see `BatchRequest.pop_futures`. Each entry of `response`
+        resolves the next futures of its key, which are removed.
+    response : Optional[BatchResponse]
+        The (partial) response of the batch request. If None, all remaining futures are resolved
+        with None.
+    """
+
+    if not futures:
+        return
+    if response is None:
+        for pending in futures.values():
+            for item_futures in pending:
+                for future in item_futures:
+                    future.set_result(None)
+        futures.clear()
+        return
+    for entry in response:
+        key = entry["id"] if "id" in entry else (entry.get("from"), entry.get("to"))
+        pending = futures.get(key)
+        if not pending:
+            continue
+        for future in pending.pop(0):
+            future.set_result(entry)
+        if len(pending) == 0:
+            del futures[key]
+
+
+def _fail_futures(futures: Dict[Hashable, List[List[Future]]], error: BaseException) -> None:
+    """
+    Set `error` as the exception of all the remaining futures.
+
+    Parameters
+    ----------
+    futures : Dict[Hashable, List[List[Future]]]
+        The pending futures by item key, see `BatchRequest.pop_futures`.
+    error : BaseException
+        The exception to set.
+    """
+
+    for pending in futures.values():
+        for item_futures in pending:
+            for future in item_futures:
+                future.set_exception(error)
+    futures.clear()
+
+
+def _new_purge_result(dry_run: bool, verbose: bool) -> dict:
+    """
+    Create the aggregated result of `Batch.purge_objects` before the first call.
+
+    Parameters
+    ----------
+    dry_run : bool
+        Whether the objects are only counted.
+    verbose : bool
+        Whether the deleted objects are listed.
+
+    Returns
+    -------
+    dict
+        The result without any matches.
+    """
+
+    result = {
+        "dryRun": dry_run,
+        "results": {"matches": 0, "successful": 0, "failed": 0},
+        "requests": 0,
+        "elapsed": 0.0,
+        "objectsPerSecond": 0.0,
+    }
+    if dry_run:
+        result["truncated"] = False
+    if verbose:
+        result["results"]["objects"] = []
+    return result
+
+
+def _split_where(where: dict, chunk_size: int) -> List[dict]:
+    """
+    Split a top level `Or` filter with more than `chunk_size` operands, or a `ContainsAny` filter
+    with more than `chunk_size` values, into filters of at most `chunk_size` operands/values.
+
+    Parameters
+    ----------
+    where : dict
+        The content of the `where` filter.
+    chunk_size : int
+        The maximal number of operands/values per filter.
+
+    Returns
+    -------
+    List[dict]
+        The filters, only `where` if it cannot be split.
+    """
+
+    if where.get("operator") == "Or" and len(where.get("operands", [])) > chunk_size:
+        operands = where["operands"]
+        return [
+            {**where, "operands": operands[i : i + chunk_size]}
+            for i in range(0, len(operands), chunk_size)
+        ]
+    if where.get("operator") == "ContainsAny":
+        for value_type in [key for key in where if key.startswith("value")]:
+            values = where[value_type]
+            if isinstance(values, list) and len(values) > chunk_size:
+                return [
+                    {**where, value_type: values[i : i + chunk_size]}
+                    for i in range(0, len(values), chunk_size)
+                ]
+    return [where]
+
+
+def _get_batch_class_names(data_type: str, batch_request: BatchRequest) -> Optional[Set[str]]:
+    """
+    Get the classes written by a batch request.
+
+    Parameters
+    ----------
+    data_type : str
+        The data type of the BatchRequest, either "objects" or "references".
+    batch_request : weaviate.batch.BatchRequest
+        The batch request.
+
+    Returns
+    -------
+    Optional[Set[str]]
+        The class names, or None if the class of a reference source is unknown.
+    """
+
+    if data_type == "objects":
+        return {obj["class"] for obj in batch_request.get_request_body()["objects"]}
+    class_names = set()
+    for reference in batch_request.get_request_body():
+        # weaviate://localhost/<class name>/<uuid>/<property>, the class is optional
+        parts = reference["from"].split("/")
+        if len(parts) != 6:
+            return None
+        class_names.add(parts[3])
+    return class_names
+
+
 def _batch_create_error_handler(retry: int, max_retries: int, error: Exception) -> None:
     """
     Handle errors that occur in Batch creation. This function is going to re-raise the error if
@@ -0,0 +1,227 @@
+"""
+Streaming readers used by the `Batch.import_*` methods to import files with bounded memory.
+"""
+import csv
+import json
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from ..util import _import_optional, get_vector
+
+ImportItem = Tuple[dict, Optional[str], Optional[list]]
+
+
+def read_jsonl(path: str) -> Iterator[dict]:
+    """
+    Read the records of a JSON Lines file one at a time. Empty lines are skipped.
+
+    Parameters
+    ----------
+    path : str
+        The path to the JSONL file.
+
+    Yields
+    ------
+    dict
+        One record per line.
+    """
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_csv(
+    path: str,
+    converters: Optional[Dict[str, Callable[[str], Any]]] = None,
+    **kwargs: Any,
+) -> Iterator[dict]:
+    """
+    Read the records of a CSV file with a header row one at a time.
+
+    Parameters
+    ----------
+    path : str
+        The path to the CSV file.
+    converters : Optional[Dict[str, Callable[[str], Any]]], optional
+        Functions to convert the (str) values of some columns, e.g. {"price": float},
+        by default None
+    **kwargs : Any
+        Passed to `csv.DictReader`, e.g. `delimiter`.
+
+    Yields
+    ------
+    dict
+        One record per row.
+    """
+
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        for record in csv.DictReader(file, **kwargs):
+            if converters is not None:
+                for column, converter in converters.items():
+                    if column in record:
+                        record[column] = converter(record[column])
+            yield record
+
+
+def read_parquet(path: str, batch_size: int = 1000) -> Iterator[dict]:
+    """
+    Read the records of a Parquet file, `batch_size` rows at a time. Requires `pyarrow`.
+
+    Parameters
+    ----------
+    path : str
+        The path to the Parquet file.
+    batch_size : int, optional
+        The number of rows decoded at once, by default 1000
+
+    Yields
+    ------
+    dict
+        One record per row.
+
+    Raises
+    ------
+    ImportError
+        If `pyarrow` is not installed.
+    """
+
+    pq = _import_optional("pyarrow.parquet", "Reading Parquet files")
+    for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        yield from record_batch.to_pylist()
+
+
+def load_vectors(vectors: Union[str, Any]) -> Any:
+    """
+    Memory-map a `.npy` file with one vector per row, so rows are only read from disk when they
+    are accessed. Requires `numpy`.
+
+    Parameters
+    ----------
+    vectors : Union[str, Any]
+        The path to the `.npy` file, or an already loaded 2D array that is returned as is.
+
+    Returns
+    -------
+    numpy.ndarray
+        The (memory-mapped) 2D array.
+    """
+
+    if not isinstance(vectors, str):
+        return vectors
+    np = _import_optional("numpy", "Reading .npy files")
+    return np.load(vectors, mmap_mode="r")
+
+
+def iter_import_items(
+    records: Iterable[dict],
+    property_mapping: Optional[Dict[str, str]] = None,
+    uuid_column: Optional[str] = None,
+    vector_column: Optional[str] = None,
+    vectors: Optional[Any] = None,
+) -> Iterator[ImportItem]:
+    """
+    Convert records to the (properties, uuid, vector) arguments of `Batch.add_data_object`.
+
+    Parameters
+    ----------
+    records : Iterable[dict]
+        The records, e.g. from `read_jsonl`.
+    property_mapping : Optional[Dict[str, str]], optional
+        Mapping from record key (column) to property name. Only mapped columns are imported. If
+        None all columns except `uuid_column` and `vector_column` are imported with their own
+        name, by default None
+    uuid_column : Optional[str], optional
+        The column that contains the UUID of the object, by default None (generate UUIDs).
+    vector_column : Optional[str], optional
+        The column that contains the vector of the object, by default None
+    vectors : Optional[Any], optional
+        A 2D array (see `load_vectors`) where row `i` is the vector of the `i`-th record. Takes
+        precedence over `vector_column`, by default None
+
+    Yields
+    ------
+    ImportItem
+        The properties, UUID and vector of one object.
+    """
+
+    excluded = {uuid_column, vector_column}
+    for i, record in enumerate(records):
+        uuid = record.get(uuid_column) if uuid_column is not None else None
+        vector = record.get(vector_column) if vector_column is not None else None
+        if vectors is not None:
+            vector = vectors[i]
+        if vector is not None:
+            vector = get_vector(vector)
+        # the records are not modified, so they can be imported again
+        if property_mapping is None:
+            properties = {key: value for key, value in record.items() if key not in excluded}
+        else:
+            properties = {
+                prop: record[column]
+                for column, prop in property_mapping.items()
+                if column in record and column not in excluded
+            }
+        yield properties, uuid, vector
+
+
+def prefetch(items: Iterable[Any], max_prefetched: int) -> Iterator[Any]:
+    """
+    Consume `items` in a separate thread, so that reading and parsing overlaps with the upload in
+    the consuming thread. At most `max_prefetched` items are held in memory.
+
+    Parameters
+    ----------
+    items : Iterable[Any]
+        The items to prefetch.
+    max_prefetched : int
+        The maximal number of items read ahead.
+
+    Yields
+    ------
+    Any
+        The items, in order.
+
+    Raises
+    ------
+    Exception
+        Any exception raised while reading the items.
+    """
+
+    done = object()
+    buffer = queue.Queue(maxsize=max_prefetched)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read() -> None:
+        try:
+            for item in items:
+                if not _put((item, None)):
+                    return
+            _put((done, None))
+        except Exception as error:
+            _put((done, error))
+
+    reader = threading.Thread(target=_read, name="weaviate-batch-import", daemon=True)
+    reader.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+        reader.join()
@@ -3,7 +3,8 @@ BatchRequest class definitions.
 """
 import copy
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Optional, Dict, Any
+from concurrent.futures import Future
+from typing import List, Sequence, Optional, Dict, Any, Hashable
 from uuid import uuid4
 
 from weaviate.util import get_valid_uuid, get_vector
@@ -18,6 +19,9 @@ class BatchRequest(ABC):
 
     def __init__(self):
         self._items = []
+        # the futures of the items, by position in `_items`
+        self._futures: Dict[int, List[Future]] = {}
+        self._last_index: Optional[int] = None
 
     def __len__(self):
         return len(self._items)
@@ -40,6 +44,11 @@ class BatchRequest(ABC):
         """
 
         self._items = []
+        self._last_index = None
+        for futures in self._futures.values():
+            for future in futures:
+                future.cancel()
+        self._futures = {}
 
     def pop(self, index: int = -1) -> dict:
         """
@@ -61,7 +70,83 @@ class BatchRequest(ABC):
             If batch is empty or index is out of range.
         """
 
-        return self._items.pop(index)
+        item = self._items.pop(index)
+        self._last_index = None
+        if self._futures:
+            index = index % (len(self._items) + 1)
+            for future in self._futures.pop(index, []):
+                future.cancel()
+            self._futures = {
+                i - 1 if i > index else i: futures for i, futures in self._futures.items()
+            }
+        return item
+
+    def add_future(self) -> Future:
+        """
+        Attach a Future to the last added item. The Future is resolved with the item's entry of
+        the BatchResponse once the item has been sent to weaviate.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The Future of the last added item.
+
+        Raises
+        ------
+        IndexError
+            If no item was added since the BatchRequest was created, emptied or popped.
+        """
+
+        if self._last_index is None:
+            raise IndexError("There is no last added item to attach a Future to.")
+        future = Future()
+        self._futures.setdefault(self._last_index, []).append(future)
+        return future
+
+    def pop_futures(self) -> Dict[Hashable, List[List[Future]]]:
+        """
+        Remove and return all the Futures attached to the items of this BatchRequest.
+
+        Returns
+        -------
+        Dict[Hashable, List[List[concurrent.futures.Future]]]
+            The Futures by item key (see `_item_key`), with one list of Futures per item with the
+            key, in the order of the items. The n-th list belongs to the n-th entry of the key in
+            the BatchResponse.
+        """
+
+        if not self._futures:
+            return {}
+        futures: Dict[Hashable, List[List[Future]]] = {}
+        for i, item in enumerate(self._items):
+            futures.setdefault(self._item_key(item), []).append(self._futures.get(i, []))
+        self._futures = {}
+        return futures
+
+    def merge(self, other: "BatchRequest") -> None:
+        """
+        Move all the items (and their Futures) of another BatchRequest of the same type to the end
+        of this one. `other` must not be used afterwards.
+
+        Parameters
+        ----------
+        other : BatchRequest
+            The BatchRequest to merge into this one.
+        """
+
+        for i, item in enumerate(other._items):
+            self._append(item)
+            if i in other._futures:
+                self._futures.setdefault(self._last_index, []).extend(other._futures[i])
+
+    def _append(self, item: Dict[str, Any]) -> None:
+        self._last_index = len(self._items)
+        self._items.append(item)
+
+    @staticmethod
+    @abstractmethod
+    def _item_key(item: Dict[str, Any]) -> Hashable:
+        """Return the key that matches a batch item with its entry in the BatchResponse."""
 
     @abstractmethod
     def add(self, *args, **kwargs):
@@ -183,7 +268,7 @@ class ReferenceBatchRequest(BatchRequest):
         else:
             to_beacon = f"weaviate://localhost/{to_object_uuid}"
 
-        self._items.append(
+        self._append(
             {
                 "from": "weaviate://localhost/"
                 + from_object_class_name
@@ -208,6 +293,10 @@ class ReferenceBatchRequest(BatchRequest):
 
         return self._items
 
+    @staticmethod
+    def _item_key(item: Dict[str, Any]) -> Hashable:
+        return item["from"], item["to"]
+
     def add_failed_objects_from_response(
         self,
         response: BatchResponse,
@@ -220,7 +309,7 @@ class ReferenceBatchRequest(BatchRequest):
             if self._skip_objects_retry(ref, errors_to_exclude, errors_to_include):
                 successful_responses.append(ref)
                 continue
-            self._items.append({"from": ref["from"], "to": ref["to"]})
+            self._append({"from": ref["from"], "to": ref["to"]})
         return successful_responses
 
 
@@ -230,6 +319,70 @@ class ObjectsBatchRequest(BatchRequest):
     Caution this batch will not be validated through weaviate.
     """
 
+    def __init__(self, deduplicate: bool = False):
+        """
+        Initialize an ObjectsBatchRequest class instance.
+
+        Parameters
+        ----------
+        deduplicate : bool, optional
+            Whether adding an object with an UUID that is already in the batch replaces the
+            previously added object (last write wins), by default False
+        """
+
+        super().__init__()
+        self._uuid_index: Optional[Dict[str, int]] = None
+        self.deduplicate = deduplicate
+
+    @property
+    def deduplicate(self) -> bool:
+        """
+        Setter and Getter for `deduplicate`.
+
+        Parameters
+        ----------
+        value : bool
+            Setter ONLY: Whether objects with the same UUID replace each other. Objects that were
+            added before enabling it are not deduplicated.
+
+        Returns
+        -------
+        bool
+            Getter ONLY: Whether objects with the same UUID replace each other.
+        """
+
+        return self._uuid_index is not None
+
+    @deduplicate.setter
+    def deduplicate(self, value: bool) -> None:
+        if not value:
+            self._uuid_index = None
+        elif self._uuid_index is None:
+            self._uuid_index = {item["id"]: i for i, item in enumerate(self._items)}
+
+    def empty(self) -> None:
+        super().empty()
+        if self._uuid_index is not None:
+            self._uuid_index = {}
+
+    def pop(self, index: int = -1) -> dict:
+        item = super().pop(index)
+        if self._uuid_index is not None:
+            self._uuid_index = {item["id"]: i for i, item in enumerate(self._items)}
+        return item
+
+    def uuids(self) -> List[str]:
+        """
+        Get the UUIDs of all the objects in this batch.
+
+        Returns
+        -------
+        List[str]
+            The UUIDs in the order the objects were added.
+        """
+
+        return [item["id"] for item in self._items]
+
     def add(
         self,
         data_object: dict,
@@ -286,10 +439,21 @@ class ObjectsBatchRequest(BatchRequest):
         if vector is not None:
             batch_item["vector"] = get_vector(vector)
 
-        self._items.append(batch_item)
+        self._append(batch_item)
 
         return batch_item["id"]
 
+    def _append(self, item: Dict[str, Any]) -> None:
+        if self._uuid_index is not None:
+            index = self._uuid_index.get(item["id"])
+            if index is not None:
+                # the futures of the replaced object resolve with the entry of this one
+                self._items[index] = item
+                self._last_index = index
+                return
+            self._uuid_index[item["id"]] = len(self._items)
+        super()._append(item)
+
     def get_request_body(self) -> dict:
         """
         Get the request body as it is needed for the Weaviate server.
@@ -302,6 +466,10 @@ class ObjectsBatchRequest(BatchRequest):
 
         return {"fields": ["ALL"], "objects": self._items}
 
+    @staticmethod
+    def _item_key(item: Dict[str, Any]) -> Hashable:
+        return item["id"]
+
     def add_failed_objects_from_response(
         self,
         response: BatchResponse,
@@ -0,0 +1,282 @@
+"""
+IncrementalSync class definition.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import List, Optional, Sequence, Tuple
+
+from weaviate.types import UUID
+from .crud_batch import Batch
+from ..util import _capitalize_first_letter, _check_positive_num, get_valid_uuid, get_vector
+
+
+class IncrementalSync:
+    """
+    Incremental-sync layer on top of `Batch.add_data_object`. It keeps a local manifest (a sqlite
+    file) of the content hash (properties + vector) of every object that was successfully added
+    through it, and skips objects whose content did not change since. Objects that were not added
+    in the current sync can be deleted from Weaviate with `delete_missing`.
+
+    The manifest only knows about writes made through an IncrementalSync with the same manifest
+    file; objects changed in Weaviate by other means are not detected.
+
+    Examples
+    --------
+    Here `client` is an instance of the `weaviate.Client`.
+
+    >>> with IncrementalSync(client.batch(batch_size=100), "manifest.sqlite") as sync:
+    ...     for uuid, properties, vector in my_data:
+    ...         sync.add_data_object(properties, "MyClass", uuid, vector)
+    ...     sync.delete_missing("MyClass")
+    >>> sync.num_skipped
+    998765
+    """
+
+    def __init__(self, batch: Batch, manifest_path: str, manifest_chunk_size: int = 10_000):
+        """
+        Initialize an IncrementalSync class instance. A new sync run is started, see
+        `delete_missing`.
+
+        Parameters
+        ----------
+        batch : weaviate.batch.Batch
+            The Batch used to add the objects. Its `return_futures` is enabled, because the
+            manifest is only updated for objects that were added successfully. It must stay
+            enabled, see `add_data_object`.
+        manifest_path : str
+            The path to the sqlite manifest file. It is created if it does not exist. Use
+            ":memory:" for a manifest that only lives as long as this instance.
+        manifest_chunk_size : int, optional
+            The number of seen or added objects that are kept in memory before they are written
+            to the manifest, by default 10000.
+
+        Raises
+        ------
+        TypeError
+            If 'manifest_chunk_size' is not an int.
+        ValueError
+            If 'manifest_chunk_size' is not positive.
+        """
+
+        _check_positive_num(manifest_chunk_size, "manifest_chunk_size", int)
+        self._manifest_chunk_size = manifest_chunk_size
+        self._batch = batch
+        self._batch.return_futures = True
+        self._db = sqlite3.connect(manifest_path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS manifest ("
+            "class_name TEXT NOT NULL, uuid TEXT NOT NULL, hash BLOB NOT NULL, run INTEGER NOT NULL, "
+            "PRIMARY KEY (class_name, uuid))"
+        )
+        self._run = self._db.execute("SELECT COALESCE(MAX(run), 0) + 1 FROM manifest").fetchone()[0]
+        self._seen: List[Tuple[int, str, str]] = []
+        self._confirmed: List[Tuple[str, str, bytes, int]] = []
+        # `_confirmed` is appended to from the BatchExecutor threads
+        self._confirmed_lock = threading.Lock()
+        self.num_added = 0
+        self.num_skipped = 0
+
+    def add_data_object(
+        self,
+        data_object: dict,
+        class_name: str,
+        uuid: UUID,
+        vector: Optional[Sequence] = None,
+    ) -> Optional[Future]:
+        """
+        Add one object to the Batch if its content changed since the last successful sync.
+
+        Parameters
+        ----------
+        data_object : dict
+            Object to be added as a dict datatype.
+        class_name : str
+            The name of the class this object belongs to.
+        uuid : UUID
+            The UUID of the object as an uuid.UUID object or str. Unlike `Batch.add_data_object` it
+            is required, as objects are matched with the manifest by UUID.
+        vector: Sequence or None, optional
+            The embedding of the object, see `Batch.add_data_object`, by default None.
+
+        Returns
+        -------
+        Optional[concurrent.futures.Future]
+            The Future returned by `Batch.add_data_object`, or None if the object was skipped.
+
+        Raises
+        ------
+        TypeError
+            If an argument passed is not of an appropriate type.
+        ValueError
+            If 'uuid' is not of a proper form, or if `return_futures` of the Batch was disabled,
+            e.g. by `Batch.configure`.
+        """
+
+        if not self._batch.return_futures:
+            raise ValueError(
+                "IncrementalSync requires the 'return_futures' of its Batch, enable it again after "
+                "'Batch.configure' with 'return_futures=True'."
+            )
+        if uuid is None:
+            raise ValueError("'uuid' is required to sync objects incrementally.")
+        class_name = _capitalize_first_letter(class_name)
+        uuid = get_valid_uuid(uuid)
+        if vector is not None:
+            vector = get_vector(vector)
+        content_hash = _content_hash(data_object, vector)
+
+        self._seen.append((self._run, class_name, uuid))
+        row = self._db.execute(
+            "SELECT hash FROM manifest WHERE class_name = ? AND uuid = ?", (class_name, uuid)
+        ).fetchone()
+        if len(self._seen) >= self._manifest_chunk_size:
+            self._write_manifest()
+        if row is not None and row[0] == content_hash:
+            self.num_skipped += 1
+            return None
+
+        future = self._batch.add_data_object(data_object, class_name, uuid, vector)
+        future.add_done_callback(
+            lambda done: self._confirm(done, class_name, uuid, content_hash),
+        )
+        self.num_added += 1
+        return future
+
+    def _confirm(self, future: Future, class_name: str, uuid: str, content_hash: bytes) -> None:
+        # runs in the BatchExecutor threads, the manifest is written in the thread that adds
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if result is not None and "errors" in result.get("result", {}):
+            return
+        with self._confirmed_lock:
+            self._confirmed.append((class_name, uuid, content_hash, self._run))
+
+    def commit(self) -> None:
+        """
+        Flush the Batch and write the results of this sync run to the manifest.
+        """
+
+        self._batch.flush()
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        """
+        Write the objects seen and added so far to the manifest.
+        """
+
+        with self._confirmed_lock:
+            confirmed, self._confirmed = self._confirmed, []
+        seen, self._seen = self._seen, []
+        with self._db:
+            self._db.executemany(
+                "UPDATE manifest SET run = ? WHERE class_name = ? AND uuid = ?",
+                seen,
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO manifest (class_name, uuid, hash, run) VALUES (?, ?, ?, ?)",
+                confirmed,
+            )
+
+    def missing(self, class_name: str) -> List[str]:
+        """
+        Get the UUIDs of the objects of a class that are in the manifest, but were not added in
+        this sync run.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name for which to get the missing objects.
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the missing objects.
+        """
+
+        self.commit()
+        rows = self._db.execute(
+            "SELECT uuid FROM manifest WHERE class_name = ? AND run < ?",
+            (_capitalize_first_letter(class_name), self._run),
+        )
+        return [row[0] for row in rows]
+
+    def delete_missing(self, class_name: str, chunk_size: int = 500) -> int:
+        """
+        Delete the objects of a class from Weaviate (and the manifest) that were synced before,
+        but were not added in this sync run. Call it only after all objects were added.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name for which to delete the missing objects.
+        chunk_size : int, optional
+            The number of UUIDs per `Batch.delete_objects` request, see `Batch.delete_by_ids`,
+            by default 500.
+
+        Returns
+        -------
+        int
+            The number of deleted objects.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        class_name = _capitalize_first_letter(class_name)
+        uuids = self.missing(class_name)
+        result = self._batch.delete_by_ids(class_name, uuids, chunk_size=chunk_size)
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM manifest WHERE class_name = ? AND uuid = ?",
+                [(class_name, uuid) for uuid in uuids],
+            )
+        return result["results"]["successful"]
+
+    def close(self) -> None:
+        """
+        Commit this sync run and close the manifest.
+        """
+
+        self.commit()
+        self._db.close()
+
+    def __enter__(self) -> "IncrementalSync":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._db.close()
+
+
+def _content_hash(data_object: dict, vector: Optional[list]) -> bytes:
+    """
+    Compute the content hash of an object.
+
+    Parameters
+    ----------
+    data_object : dict
+        The properties of the object.
+    vector : Optional[list]
+        The vector of the object.
+
+    Returns
+    -------
+    bytes
+        The 16 bytes hash.
+    """
+
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(json.dumps(data_object, sort_keys=True, default=str).encode("utf-8"))
+    if vector is not None:
+        hasher.update(json.dumps(vector).encode("utf-8"))
+    return hasher.digest()
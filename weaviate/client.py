@@ -17,6 +17,7 @@ from .data import DataObject
 from .embedded import EmbeddedDB, EmbeddedOptions
 from .exceptions import UnexpectedStatusCodeException
 from .gql import Query
+from .gql.cache import QueryCache
 from .schema import Schema
 
 
@@ -153,12 +154,14 @@ class Client:
             startup_period=startup_period,
             embedded_db=embedded_db,
         )
+        # invalidated by the writes of this client
+        query_cache = QueryCache()
         self.classification = Classification(self._connection)
-        self.schema = Schema(self._connection)
+        self.schema = Schema(self._connection, query_cache)
         self.contextionary = Contextionary(self._connection)
-        self.batch = Batch(self._connection)
-        self.data_object = DataObject(self._connection)
-        self.query = Query(self._connection)
+        self.batch = Batch(self._connection, query_cache)
+        self.data_object = DataObject(self._connection, query_cache, self.schema.cache)
+        self.query = Query(self._connection, query_cache)
         self.backup = Backup(self._connection)
         self.cluster = Cluster(self._connection)
 
@@ -0,0 +1,145 @@
+"""
+Bounded, rate limited concurrent execution used by the bulk methods of `DataObject`.
+"""
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.exceptions import UnexpectedStatusCodeException
+
+# status codes of requests that may succeed when retried
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Limit the rate of requests of many threads to `max_per_second`, by spacing them evenly.
+    """
+
+    def __init__(self, max_per_second: float):
+        """
+        Initialize a RateLimiter class instance.
+
+        Parameters
+        ----------
+        max_per_second : float
+            The maximal number of requests per second.
+        """
+
+        self._interval = 1 / max_per_second
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until the next request is allowed.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            wait_until = max(self._next, now)
+            self._next = wait_until + self._interval
+        if wait_until > now:
+            time.sleep(wait_until - now)
+
+
+def call_with_retries(
+    func: Callable[[], Any],
+    max_retries: int,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Any:
+    """
+    Call `func`, and retry it up to `max_retries` times if it fails with a connection error or a
+    status code in `RETRY_STATUS_CODES`, waiting (retry + 1) * 2 seconds before each retry like
+    the Batch does.
+
+    Parameters
+    ----------
+    func : Callable[[], Any]
+        The function that makes the request.
+    max_retries : int
+        The maximal number of retries.
+    rate_limiter : Optional[RateLimiter], optional
+        The RateLimiter acquired before every call, by default None
+
+    Returns
+    -------
+    Any
+        The result of `func`.
+
+    Raises
+    ------
+    Exception
+        The exception of the last call, or an exception that is not retried.
+    """
+
+    retry = 0
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return func()
+        except (RequestsConnectionError, UnexpectedStatusCodeException) as error:
+            if retry >= max_retries or (
+                isinstance(error, UnexpectedStatusCodeException)
+                and error.status_code not in RETRY_STATUS_CODES
+            ):
+                raise
+            print(
+                f"[ERROR] {error.__class__.__name__} Exception occurred! Retrying in "
+                f"{(retry + 1) * 2}s. [{retry + 1}/{max_retries}]",
+                file=sys.stderr,
+                flush=True,
+            )
+            time.sleep((retry + 1) * 2)
+            retry += 1
+
+
+def run_bounded(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Call `func` for every item in threads. At most 2 * `max_workers` items are taken from `items`
+    before their result is consumed, so `items` can be an arbitrarily long iterator.
+
+    Parameters
+    ----------
+    func : Callable[[Any], Any]
+        The function to call for every item.
+    items : Iterable[Any]
+        The items.
+    max_workers : int
+        The number of threads.
+
+    Yields
+    ------
+    Tuple[Any, Any, Optional[Exception]]
+        The item, the result of `func` (None if it failed) and the exception raised by `func`
+        (None if it succeeded), in the order the calls complete.
+    """
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < 2 * max_workers:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(func, item)] = item
+            if len(pending) == 0:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                yield item, None if error is not None else future.result(), error
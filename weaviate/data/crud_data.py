@@ -3,18 +3,27 @@ DataObject class definition.
 """
 import uuid as uuid_lib
 import warnings
-from typing import Union, Optional, List, Sequence, Dict
+from numbers import Real
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Union, Optional, List, Sequence, Dict, Iterable, Iterator, Tuple
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
+from weaviate.data.bulk import RateLimiter, call_with_retries, run_bounded
+from weaviate.data.export import JsonlWriter, NpyWriter, ParquetWriter, scan_pages
 from weaviate.data.references import Reference
 from weaviate.data.replication import ConsistencyLevel
 from weaviate.error_msgs import DATA_DEPRECATION_NEW_V14_CLS_NS_W, DATA_DEPRECATION_OLD_V14_CLS_NS_W
 from weaviate.exceptions import (
     ObjectAlreadyExistsException,
+    QueryFailedException,
     UnexpectedStatusCodeException,
 )
+from weaviate.gql.cache import QueryCache
+from weaviate.gql.get import GetBuilder
+from weaviate.schema.cache import SchemaCache
+from weaviate.schema.crud_schema import _property_is_primitive
 from weaviate.types import UUID
 from weaviate.util import (
     _get_dict_from_object,
@@ -35,7 +44,12 @@ class DataObject:
         A Reference object to create objects cross-references.
     """
 
-    def __init__(self, connection: Connection):
+    def __init__(
+        self,
+        connection: Connection,
+        query_cache: Optional[QueryCache] = None,
+        schema_cache: Optional[SchemaCache] = None,
+    ):
         """
         Initialize a DataObject class instance.
 
@@ -43,10 +57,17 @@ class DataObject:
         ----------
         connection : weaviate.connect.Connection
             Connection object to an active and running weaviate instance.
+        query_cache : Optional[weaviate.gql.cache.QueryCache], optional
+            The query cache invalidated by the writes, by default None
+        schema_cache : Optional[weaviate.schema.cache.SchemaCache], optional
+            The schema cache used to look up class definitions. If None they are fetched every
+            time, by default None
         """
 
         self._connection = connection
-        self.reference = Reference(self._connection)
+        self._query_cache = query_cache if query_cache is not None else QueryCache()
+        self._schema_cache = schema_cache
+        self.reference = Reference(self._connection, self._query_cache)
 
     def create(
         self,
@@ -140,6 +161,8 @@ class DataObject:
             response = self._connection.post(path=path, weaviate_object=weaviate_obj, params=params)
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Object was not added to Weaviate.") from conn_err
+        finally:
+            self._query_cache.invalidate([class_name] if class_name else None)
         if response.status_code == 200:
             return str(response.json()["id"])
 
@@ -249,6 +272,8 @@ class DataObject:
             )
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Object was not updated.") from conn_err
+        finally:
+            self._query_cache.invalidate([class_name] if class_name else None)
         if response.status_code == 204:
             # Successful merge
             return
@@ -342,11 +367,89 @@ class DataObject:
             response = self._connection.put(path=path, weaviate_object=weaviate_obj, params=params)
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Object was not replaced.") from conn_err
+        finally:
+            self._query_cache.invalidate([class_name] if class_name else None)
         if response.status_code == 200:
             # Successful update
             return
         raise UnexpectedStatusCodeException("Replace object", response)
 
+    def update_many(
+        self,
+        updates: Iterable[Tuple[UUID, str, dict]],
+        replace: bool = False,
+        max_workers: int = 8,
+        max_requests_per_second: Optional[float] = None,
+        max_retries: int = 3,
+        consistency_level: Optional[ConsistencyLevel] = None,
+    ) -> Iterator[dict]:
+        """
+        Update (PATCH, see `update`) or replace (PUT, see `replace`) many objects concurrently.
+        The requests run in `max_workers` threads and `updates` is consumed lazily, so it can be
+        an arbitrarily long iterator. Requests that fail with a connection error or a 429/5xx
+        status code are retried up to `max_retries` times.
+
+        Parameters
+        ----------
+        updates : Iterable[Tuple[UUID, str, dict]]
+            The (uuid, class_name, properties) of the objects to update.
+        replace : bool, optional
+            If True the objects are replaced instead of updated, by default False
+        max_workers : int, optional
+            The maximal number of concurrent requests, by default 8
+        max_requests_per_second : Optional[float], optional
+            If set, the requests (including retries) are limited to this rate, by default None
+        max_retries : int, optional
+            The maximal number of retries per object, by default 3
+        consistency_level : Optional[ConsistencyLevel], optional
+            Can be one of 'ALL', 'ONE', or 'QUORUM'. Determines how many replicas must acknowledge
+            a request before it is considered successful, by default None
+
+        Returns
+        -------
+        Iterator[dict]
+            One result per object, in the order the requests complete, as
+            {"id": str, "class": str, "error": None or Exception}. The requests are only made
+            while the results are consumed.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+
+        Examples
+        --------
+        >>> updates = ((row.uuid, "Article", {"popularity": row.score}) for row in rows)
+        >>> for result in client.data_object.update_many(updates, max_requests_per_second=500):
+        ...     if result["error"] is not None:
+        ...         print(result["id"], result["error"])
+        """
+
+        _check_positive_num(max_workers, "max_workers", int, include_zero=False)
+        _check_positive_num(max_retries, "max_retries", int, include_zero=True)
+        rate_limiter = None
+        if max_requests_per_second is not None:
+            _check_positive_num(
+                max_requests_per_second, "max_requests_per_second", Real, include_zero=False
+            )
+            rate_limiter = RateLimiter(max_requests_per_second)
+        method = self.replace if replace else self.update
+
+        def update_one(update: Tuple[UUID, str, dict]) -> None:
+            uuid, class_name, data_object = update
+            call_with_retries(
+                lambda: method(data_object, class_name, uuid, consistency_level=consistency_level),
+                max_retries,
+                rate_limiter,
+            )
+
+        return (
+            {"id": str(update[0]), "class": update[1], "error": error}
+            for update, _, error in run_bounded(update_one, updates, max_workers)
+        )
+
     def _create_object_for_update(
         self,
         data_object: Union[dict, str],
@@ -626,6 +729,370 @@ class DataObject:
             return None
         raise UnexpectedStatusCodeException("Get object/s", response)
 
+    def get_by_ids(
+        self,
+        class_name: str,
+        uuids: Sequence[UUID],
+        properties: Optional[List[str]] = None,
+        with_vector: bool = False,
+        chunk_size: int = 100,
+        max_workers: int = 8,
+    ) -> dict:
+        """
+        Get many objects of a class by UUID. The UUIDs are split into chunks of `chunk_size` and
+        every chunk is fetched with one GraphQL `Get` query filtered by `id`, at most `max_workers`
+        queries run concurrently. Without `properties` the class definition is fetched first, to
+        request all its properties.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name of the objects.
+        uuids : Sequence[UUID]
+            The UUIDs of the objects to get.
+        properties : Optional[List[str]], optional
+            The properties to return. If None all properties are returned, by default None
+        with_vector : bool, optional
+            If True the `vector` of the objects is returned too, by default False
+        chunk_size : int, optional
+            The number of UUIDs per GraphQL query, by default 100
+        max_workers : int, optional
+            The maximal number of concurrent requests, by default 8
+
+        Returns
+        -------
+        dict
+            The objects in the order of `uuids` under "objects", with None for the objects that do
+            not exist, and the UUIDs of these objects under "missing". The objects have the same
+            format as the ones returned by `get`, i.e. with "class", "id", "properties" (without the
+            properties that are not set) and, if `with_vector` is True, "vector".
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status, e.g. if the class does not exist.
+        weaviate.exceptions.QueryFailedException
+            If a GraphQL query returns errors.
+
+        Examples
+        --------
+        >>> client.data_object.get_by_ids(
+        ...     "Author",
+        ...     ["d842a0f4-ad8c-40eb-80b4-bfefc7b1b530", "e067f671-1202-42c6-848b-ff4d1eb804ab"],
+        ...     properties=["name"],
+        ... )
+        {
+            "objects": [
+                {
+                    "class": "Author",
+                    "id": "d842a0f4-ad8c-40eb-80b4-bfefc7b1b530",
+                    "properties": {"name": "H.P. Lovecraft"}
+                },
+                None
+            ],
+            "missing": ["e067f671-1202-42c6-848b-ff4d1eb804ab"]
+        }
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
+        if properties is not None and not isinstance(properties, list):
+            raise TypeError(
+                f"'properties' must be of type list or None. Given type: {type(properties)}"
+            )
+        _check_positive_num(chunk_size, "chunk_size", int, include_zero=False)
+        _check_positive_num(max_workers, "max_workers", int, include_zero=False)
+        class_name = _capitalize_first_letter(class_name)
+        uuids = [get_valid_uuid(uuid) for uuid in uuids]
+        unique_uuids = list(dict.fromkeys(uuids))
+
+        if len(unique_uuids) == 0:
+            return {"objects": [], "missing": []}
+        references: Dict[str, Optional[str]] = {}
+        if properties is None:
+            properties, references = _property_selection(self._get_class_properties(class_name))
+        additional = ["id", "vector"] if with_vector else ["id"]
+
+        def get_chunk(chunk: List[str]) -> List[dict]:
+            return [
+                _graphql_to_object(class_name, result, references)
+                for result in self._get_chunk_graphql(class_name, chunk, properties, additional)
+            ]
+
+        tasks = [unique_uuids[i : i + chunk_size] for i in range(0, len(unique_uuids), chunk_size)]
+        found: Dict[str, dict] = {
+            obj["id"]: obj
+            for objects in _map_concurrently(get_chunk, tasks, max_workers)
+            for obj in objects
+        }
+
+        return {
+            "objects": [found.get(uuid) for uuid in uuids],
+            "missing": [uuid for uuid in uuids if uuid not in found],
+        }
+
+    def _get_chunk_graphql(
+        self,
+        class_name: str,
+        uuids: List[str],
+        properties: List[str],
+        additional: List[str],
+    ) -> List[dict]:
+        """
+        Get the objects with the given UUIDs with one GraphQL `Get` query.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name of the objects.
+        uuids : List[str]
+            The valid UUIDs of the objects.
+        properties : List[str]
+            The properties to return.
+        additional : List[str]
+            The additional properties to return.
+
+        Returns
+        -------
+        List[dict]
+            The GraphQL results of the objects that exist, in any order.
+
+        Raises
+        ------
+        weaviate.exceptions.QueryFailedException
+            If the GraphQL query returns errors.
+        """
+
+        response = (
+            GetBuilder(class_name, properties, self._connection)
+            .with_additional(additional)
+            .with_where(_id_filter(uuids))
+            .with_limit(len(uuids))
+            .do()
+        )
+        if response.get("errors"):
+            raise QueryFailedException("Get objects by id failed", response["errors"])
+        return response["data"]["Get"][class_name]
+
+    def _get_class_properties(self, class_name: str) -> List[dict]:
+        """
+        Get the property definitions of a class, from the schema cache if there is one.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name.
+
+        Returns
+        -------
+        List[dict]
+            The properties of the class definition, they must NOT be modified.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if self._schema_cache is not None:
+            class_schema = self._schema_cache.get_class(class_name)
+            # unknown classes are requested, to raise the same error as without the cache
+            if class_schema is not None:
+                return class_schema.get("properties") or []
+        try:
+            response = self._connection.get(path=f"/schema/{class_name}")
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Class schema could not be retrieved.") from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Get class schema", response)
+        return response.json().get("properties") or []
+
+    def iterate(
+        self,
+        class_name: str,
+        page_size: int = 100,
+        with_vector: bool = False,
+        max_pages_in_flight: int = 2,
+        num_partitions: int = 1,
+        after: Optional[UUID] = None,
+        target_latency: Optional[float] = None,
+        max_page_size: int = 10000,
+    ) -> Iterator[dict]:
+        """
+        Iterate lazily over all objects of a class with the cursor API (requires Weaviate >= 1.18).
+        Pages are fetched in background threads, up to `max_pages_in_flight` pages ahead of the
+        consumer.
+
+        Parameters
+        ----------
+        class_name : str
+            The class to iterate over.
+        page_size : int, optional
+            The number of objects per request (the initial one if `target_latency` is set),
+            by default 100
+        with_vector : bool, optional
+            If True the `vector` of the objects is returned too, by default False
+        max_pages_in_flight : int, optional
+            The maximal number of fetched pages that are not consumed yet, by default 2
+        num_partitions : int, optional
+            The number of UUID ranges scanned in parallel. With more than one range the objects
+            are NOT returned in UUID order, by default 1
+        after : Optional[UUID], optional
+            Resume the iteration after this UUID, e.g. the `id` of the last consumed object of an
+            interrupted iteration with `num_partitions=1`, by default None
+        target_latency : Optional[float], optional
+            If set, the page size is adapted so that a request takes about `target_latency`
+            seconds, by default None
+        max_page_size : int, optional
+            The maximal page size when adapting it to `target_latency`, by default 10000
+
+        Returns
+        -------
+        Iterator[dict]
+            The objects, in UUID order if `num_partitions` is 1. No request is made before the
+            first object is requested.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+
+        Examples
+        --------
+        >>> for obj in client.data_object.iterate("Article", page_size=500, with_vector=True):
+        ...     backfill(obj["id"], obj["vector"])
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
+        _check_positive_num(page_size, "page_size", int, include_zero=False)
+        _check_positive_num(max_pages_in_flight, "max_pages_in_flight", int, include_zero=False)
+        _check_positive_num(num_partitions, "num_partitions", int, include_zero=False)
+        _check_positive_num(max_page_size, "max_page_size", int, include_zero=False)
+        if target_latency is not None:
+            _check_positive_num(target_latency, "target_latency", Real, include_zero=False)
+
+        def get_page(after_: Optional[str], limit: int) -> List[dict]:
+            response = self.get(
+                class_name=class_name, with_vector=with_vector, limit=limit, after=after_
+            )
+            return [] if response is None else response["objects"]
+
+        pages = scan_pages(
+            get_page,
+            page_size,
+            num_partitions=num_partitions,
+            max_pages_in_flight=max_pages_in_flight,
+            after=get_valid_uuid(after) if after is not None else None,
+            target_latency=target_latency,
+            max_page_size=max_page_size,
+        )
+        return (obj for page in pages for obj in page)
+
+    def export(
+        self,
+        class_name: str,
+        jsonl_path: Optional[str] = None,
+        parquet_path: Optional[str] = None,
+        vectors_path: Optional[str] = None,
+        page_size: int = 1000,
+        num_partitions: int = 1,
+    ) -> int:
+        """
+        Export all objects of a class with the cursor API (requires Weaviate >= 1.18). The UUID
+        space is split into `num_partitions` ranges that are scanned in parallel, and the next page
+        of each range is fetched while the current one is written. The properties are streamed to
+        JSONL and/or Parquet and the vectors to an `.npy` file, so memory usage does not depend on
+        the size of the class. The rows of all outputs are aligned, but not ordered by UUID if
+        `num_partitions` > 1.
+
+        Parameters
+        ----------
+        class_name : str
+            The class to export.
+        jsonl_path : Optional[str], optional
+            Path of the JSONL file to write, one `{"id": ..., "properties": {...}}` per line,
+            by default None
+        parquet_path : Optional[str], optional
+            Path of the Parquet file to write, with an `id` column and one column per property of
+            the class definition. Requires `pyarrow`, by default None
+        vectors_path : Optional[str], optional
+            Path of the `.npy` file to write the vectors to, as a float32 array with one row per
+            object. Every object must have a vector, by default None
+        page_size : int, optional
+            The number of objects per request, by default 1000
+        num_partitions : int, optional
+            The number of UUID ranges scanned in parallel, by default 1
+
+        Returns
+        -------
+        int
+            The number of exported objects.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value, or if `vectors_path` is given and an object
+            has no vector.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
+        _check_positive_num(page_size, "page_size", int, include_zero=False)
+        _check_positive_num(num_partitions, "num_partitions", int, include_zero=False)
+        if jsonl_path is None and parquet_path is None and vectors_path is None:
+            raise ValueError(
+                "At least one of 'jsonl_path', 'parquet_path' or 'vectors_path' must be given."
+            )
+
+        with_vector = vectors_path is not None
+
+        def get_page(after: Optional[str], limit: int) -> List[dict]:
+            response = self.get(
+                class_name=class_name, with_vector=with_vector, limit=limit, after=after
+            )
+            return [] if response is None else response["objects"]
+
+        writers = []
+        try:
+            if jsonl_path is not None:
+                writers.append(JsonlWriter(jsonl_path))
+            if parquet_path is not None:
+                properties = self._get_class_properties(_capitalize_first_letter(class_name))
+                writers.append(ParquetWriter(parquet_path, properties))
+            if vectors_path is not None:
+                writers.append(NpyWriter(vectors_path))
+
+            num_exported = 0
+            for page in scan_pages(get_page, page_size, num_partitions):
+                for writer in writers:
+                    writer.write_objects(page)
+                num_exported += len(page)
+        finally:
+            for writer in writers:
+                writer.close()
+        return num_exported
+
     def delete(
         self,
         uuid: Union[str, uuid_lib.UUID],
@@ -721,6 +1188,8 @@ class DataObject:
             )
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Object could not be deleted.") from conn_err
+        finally:
+            self._query_cache.invalidate([class_name] if class_name else None)
         if response.status_code == 204:
             # Successfully deleted
             return
@@ -821,6 +1290,77 @@ class DataObject:
             return False
         raise UnexpectedStatusCodeException("Object exists", response)
 
+    def exists_many(
+        self,
+        class_name: str,
+        uuids: Sequence[UUID],
+        chunk_size: int = 500,
+        max_workers: int = 8,
+    ) -> List[bool]:
+        """
+        Check for many objects of a class if they exist in weaviate. Instead of one `HEAD` request
+        per object (see `exists`), the UUIDs are split into chunks of `chunk_size` and every chunk
+        is checked with one GraphQL `Get` query filtered by `id` that only returns the `id`. At
+        most `max_workers` queries run concurrently.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name of the objects.
+        uuids : Sequence[UUID]
+            The UUIDs of the objects to check.
+        chunk_size : int, optional
+            The number of UUIDs per GraphQL query, by default 500
+        max_workers : int, optional
+            The maximal number of concurrent queries, by default 8
+
+        Returns
+        -------
+        List[bool]
+            For every UUID in `uuids`, in the same order, True if the object exists, False
+            otherwise.
+
+        Raises
+        ------
+        TypeError
+            If argument is of wrong type.
+        ValueError
+            If argument contains an invalid value.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        weaviate.exceptions.WeaviateBaseError
+            If the GraphQL query returns errors.
+
+        Examples
+        --------
+        >>> client.data_object.exists_many(
+        ...     "Author",
+        ...     ["d842a0f4-ad8c-40eb-80b4-bfefc7b1b530", "e067f671-1202-42c6-848b-ff4d1eb804ab"],
+        ... )
+        [True, False]
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(f"'class_name' must be of type str. Given type: {type(class_name)}")
+        _check_positive_num(chunk_size, "chunk_size", int, include_zero=False)
+        _check_positive_num(max_workers, "max_workers", int, include_zero=False)
+        class_name = _capitalize_first_letter(class_name)
+        uuids = [get_valid_uuid(uuid) for uuid in uuids]
+        unique_uuids = list(dict.fromkeys(uuids))
+
+        def get_chunk(chunk: List[str]) -> List[dict]:
+            return self._get_chunk_graphql(class_name, chunk, [], ["id"])
+
+        chunks = [unique_uuids[i : i + chunk_size] for i in range(0, len(unique_uuids), chunk_size)]
+        existing = {
+            result["_additional"]["id"]
+            for results in _map_concurrently(get_chunk, chunks, max_workers)
+            for result in results
+        }
+        return [uuid in existing for uuid in uuids]
+
     def validate(
         self,
         data_object: Union[dict, str],
@@ -965,3 +1505,146 @@ def _get_params(additional_properties: Optional[List[str]], with_vector: bool) -
         else:
             params["include"] = "vector"
     return params
+
+
+def _map_concurrently(func: Callable[[Any], Any], tasks: List[Any], max_workers: int) -> List[Any]:
+    """
+    Call `func` for every task with at most `max_workers` calls running concurrently.
+
+    Parameters
+    ----------
+    func : Callable[[Any], Any]
+        The function to call.
+    tasks : List[Any]
+        The arguments of the calls.
+    max_workers : int
+        The maximal number of concurrent calls.
+
+    Returns
+    -------
+    List[Any]
+        The results, in the order of `tasks`.
+    """
+
+    if len(tasks) == 0:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        return list(executor.map(func, tasks))
+
+
+def _id_filter(uuids: List[str]) -> dict:
+    """
+    Get the `where` filter that matches the objects with the given UUIDs.
+
+    Parameters
+    ----------
+    uuids : List[str]
+        The valid UUIDs, at least one.
+
+    Returns
+    -------
+    dict
+        The `where` filter.
+    """
+
+    operands = [{"path": ["id"], "operator": "Equal", "valueString": uuid} for uuid in uuids]
+    if len(operands) == 1:
+        return operands[0]
+    return {"operator": "Or", "operands": operands}
+
+
+# the fields of the data types that are objects in GraphQL
+_OBJECT_DATA_TYPE_FIELDS = {
+    "geoCoordinates": "latitude longitude",
+    "phoneNumber": (
+        "input internationalFormatted defaultCountry countryCode national nationalFormatted valid"
+    ),
+}
+
+
+def _property_selection(properties: List[dict]) -> Tuple[List[str], Dict[str, Optional[str]]]:
+    """
+    Get the GraphQL selection of all properties of a class.
+
+    Parameters
+    ----------
+    properties : List[dict]
+        The property definitions of the class.
+
+    Returns
+    -------
+    Tuple[List[str], Dict[str, Optional[str]]]
+        The GraphQL properties, and the target class of every cross-reference property, None if
+        it has more than one.
+    """
+
+    selection = []
+    references: Dict[str, Optional[str]] = {}
+    for prop in properties:
+        name, data_types = prop["name"], prop["dataType"]
+        if data_types[0] in _OBJECT_DATA_TYPE_FIELDS:
+            selection.append(f"{name} {{{_OBJECT_DATA_TYPE_FIELDS[data_types[0]]}}}")
+        elif _property_is_primitive(data_types):
+            selection.append(name)
+        else:
+            targets = [_capitalize_first_letter(target) for target in data_types]
+            fragments = " ".join(f"... on {target} {{_additional {{id}}}}" for target in targets)
+            selection.append(f"{name} {{{fragments}}}")
+            references[name] = targets[0] if len(targets) == 1 else None
+    return selection, references
+
+
+def _graphql_to_object(
+    class_name: str, result: dict, references: Optional[Dict[str, Optional[str]]] = None
+) -> dict:
+    """
+    Convert a GraphQL `Get` result to the object format of the REST API.
+
+    Parameters
+    ----------
+    class_name : str
+        The class name of the object.
+    result : dict
+        The GraphQL result, with `id` and optionally `vector` in `_additional`.
+    references : Optional[Dict[str, Optional[str]]], optional
+        The target class of the cross-reference properties, see `_property_selection`, whose
+        values are converted to beacons, by default None
+
+    Returns
+    -------
+    dict
+        The object with "class", "id", "properties" and, if requested, "vector".
+    """
+
+    properties = {key: value for key, value in result.items() if value is not None}
+    additional = properties.pop("_additional")
+    for name, target in (references or {}).items():
+        if name in properties:
+            properties[name] = [
+                _beacon(ref["_additional"]["id"], target) for ref in properties[name]
+            ]
+    obj = {"class": class_name, "id": additional["id"], "properties": properties}
+    if "vector" in additional:
+        obj["vector"] = additional["vector"]
+    return obj
+
+
+def _beacon(uuid: str, class_name: Optional[str]) -> dict:
+    """
+    Get the REST API format of a cross-reference.
+
+    Parameters
+    ----------
+    uuid : str
+        The UUID of the referenced object.
+    class_name : Optional[str]
+        The class of the referenced object, None if unknown.
+
+    Returns
+    -------
+    dict
+        The cross-reference with "beacon" and "href".
+    """
+
+    path = uuid if class_name is None else f"{class_name}/{uuid}"
+    return {"beacon": f"weaviate://localhost/{path}", "href": f"/v1/objects/{path}"}
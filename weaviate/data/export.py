@@ -0,0 +1,363 @@
+"""
+Parallel cursor scans and writers used by `DataObject.export`.
+"""
+import json
+import queue
+import struct
+import threading
+import time
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from weaviate.schema.crud_schema import _property_is_primitive
+from weaviate.util import _import_optional
+
+# (after, limit) -> page of objects ordered by UUID
+PageGetter = Callable[[Optional[str], int], List[dict]]
+
+_MAX_UUID = "ffffffff-ffff-ffff-ffff-ffffffffffff"
+
+
+def uuid_partitions(num_partitions: int) -> List[Tuple[Optional[str], str]]:
+    """
+    Split the UUID space into `num_partitions` contiguous ranges.
+
+    Parameters
+    ----------
+    num_partitions : int
+        The number of ranges.
+
+    Returns
+    -------
+    List[Tuple[Optional[str], str]]
+        The ranges as (after, until) tuples, i.e. a range contains the UUIDs greater than `after`
+        (all UUIDs if None) and less or equal to `until`.
+    """
+
+    bounds = [None]
+    for i in range(1, num_partitions):
+        hex_ = f"{(i << 128) // num_partitions - 1:032x}"
+        bounds.append(f"{hex_[:8]}-{hex_[8:12]}-{hex_[12:16]}-{hex_[16:20]}-{hex_[20:]}")
+    bounds.append(_MAX_UUID)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def scan_pages(
+    get_page: PageGetter,
+    page_size: int,
+    num_partitions: int = 1,
+    max_pages_in_flight: int = 2,
+    after: Optional[str] = None,
+    target_latency: Optional[float] = None,
+    max_page_size: int = 10000,
+) -> Iterator[List[dict]]:
+    """
+    Scan all objects with the cursor API. Every UUID range is scanned in its own thread, which
+    fetches the next page while the previous ones are consumed. Pages of different ranges are
+    yielded in the order they arrive, pages of one range in UUID order.
+
+    Parameters
+    ----------
+    get_page : PageGetter
+        Function that returns the (at most `limit`) objects after the UUID `after`.
+    page_size : int
+        The number of objects per request.
+    num_partitions : int, optional
+        The number of UUID ranges scanned in parallel, by default 1
+    max_pages_in_flight : int, optional
+        The maximal number of fetched pages that are not consumed yet, by default 2
+    after : Optional[str], optional
+        Only scan the objects after this UUID, by default None
+    target_latency : Optional[float], optional
+        If set, the page size of every range is adapted after each request so that a request
+        takes about `target_latency` seconds, starting from `page_size`, by default None
+    max_page_size : int, optional
+        The maximal page size when adapting it to `target_latency`, by default 10000
+
+    Yields
+    ------
+    List[dict]
+        The pages of objects.
+
+    Raises
+    ------
+    Exception
+        Any exception raised by `get_page`.
+    """
+
+    done = object()
+    pages = queue.Queue(maxsize=max_pages_in_flight)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _scan(start: Optional[str], until: str) -> None:
+        limit = page_size
+        try:
+            while not stop.is_set():
+                request_start = time.perf_counter()
+                raw_page = get_page(start, limit)
+                latency = time.perf_counter() - request_start
+                page = [obj for obj in raw_page if obj["id"] <= until]
+                if len(page) != 0 and not _put((page, None)):
+                    return
+                # the range is exhausted or the next range was reached
+                if len(raw_page) < limit or len(page) < len(raw_page):
+                    break
+                start = page[-1]["id"]
+                if target_latency is not None:
+                    limit = _adapt_page_size(limit, latency, target_latency, max_page_size)
+            _put((done, None))
+        except Exception as error:
+            _put((done, error))
+
+    partitions = [
+        (start, until)
+        for start, until in uuid_partitions(num_partitions)
+        if after is None or until > after
+    ]
+    scanners = []
+    for start, until in partitions:
+        if after is not None and (start is None or start < after):
+            start = after
+        scanners.append(
+            threading.Thread(
+                target=_scan, args=(start, until), name="weaviate-cursor-scan", daemon=True
+            )
+        )
+        scanners[-1].start()
+
+    try:
+        num_running = len(scanners)
+        while num_running > 0:
+            page, error = pages.get()
+            if error is not None:
+                raise error
+            if page is done:
+                num_running -= 1
+                continue
+            yield page
+    finally:
+        stop.set()
+        for scanner in scanners:
+            scanner.join()
+
+
+def _adapt_page_size(
+    page_size: int, latency: float, target_latency: float, max_page_size: int
+) -> int:
+    """
+    Scale the page size towards `target_latency`, by at most a factor 2 per step.
+
+    Parameters
+    ----------
+    page_size : int
+        The page size of the last request.
+    latency : float
+        The latency of the last request in seconds.
+    target_latency : float
+        The wanted latency in seconds.
+    max_page_size : int
+        The maximal page size.
+
+    Returns
+    -------
+    int
+        The new page size.
+    """
+
+    factor = min(max(target_latency / max(latency, 1e-6), 0.5), 2.0)
+    return min(max(round(page_size * factor), 1), max_page_size)
+
+
+class NpyWriter:
+    """
+    Append float32 vectors of a fixed dimension to a `.npy` file, without holding them in memory.
+    The header is rewritten with the final number of rows on `close`.
+    """
+
+    _HEADER_LEN = 128
+
+    def __init__(self, path: str):
+        """
+        Initialize a NpyWriter class instance.
+
+        Parameters
+        ----------
+        path : str
+            The path to the `.npy` file, it is overwritten.
+        """
+
+        self._file = open(path, "wb")
+        self._dim: Optional[int] = None
+        self.num_rows = 0
+        self._file.write(self._header())
+
+    def write(self, vector: List[float]) -> None:
+        """
+        Append a vector.
+
+        Parameters
+        ----------
+        vector : List[float]
+            The vector, all vectors must have the same dimension.
+
+        Raises
+        ------
+        ValueError
+            If the dimension differs from the previous vectors.
+        """
+
+        if self._dim is None:
+            self._dim = len(vector)
+        elif len(vector) != self._dim:
+            raise ValueError(
+                f"All vectors must have the same dimension, expected {self._dim} "
+                f"but got {len(vector)}."
+            )
+        self._file.write(struct.pack(f"<{self._dim}f", *vector))
+        self.num_rows += 1
+
+    def write_objects(self, objects: List[dict]) -> None:
+        """
+        Append the vectors of objects.
+
+        Parameters
+        ----------
+        objects : List[dict]
+            The objects, with their `vector`.
+
+        Raises
+        ------
+        ValueError
+            If an object has no vector, nothing is written then. Skipping it would misalign the
+            rows with the other outputs of the export.
+        """
+
+        for obj in objects:
+            if not obj.get("vector"):
+                raise ValueError(
+                    f"The object {obj.get('id')} has no vector, the vectors can only be exported if "
+                    "every object has one, e.g. if the class has a vectorizer."
+                )
+        for obj in objects:
+            self.write(obj["vector"])
+
+    def close(self) -> None:
+        """
+        Write the final header and close the file.
+        """
+
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.close()
+
+    def _header(self) -> bytes:
+        shape = (self.num_rows, self._dim or 0)
+        header = f"{{'descr': '<f4', 'fortran_order': False, 'shape': {shape}, }}"
+        # magic string, version 1.0 and the header length take 10 bytes
+        header = header.ljust(self._HEADER_LEN - 10 - 1) + "\n"
+        return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+class JsonlWriter:
+    """
+    Write the UUID and properties of one object per line.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write_objects(self, objects: List[dict]) -> None:
+        self._file.writelines(
+            json.dumps({"id": obj["id"], "properties": obj.get("properties", {})}) + "\n"
+            for obj in objects
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Write the UUID (`id` column) and properties of objects to a Parquet file, one row group per call
+    of `write`. Requires `pyarrow`. The schema is built from the class definition, so all pages
+    have the same columns, see `_arrow_type`.
+    """
+
+    def __init__(self, path: str, properties: List[dict]):
+        """
+        Initialize a ParquetWriter class instance.
+
+        Parameters
+        ----------
+        path : str
+            The path to the Parquet file, it is overwritten.
+        properties : List[dict]
+            The properties of the class definition, one column per property.
+        """
+
+        pyarrow = _import_optional("pyarrow", "Writing Parquet files")
+        _import_optional("pyarrow.parquet", "Writing Parquet files")
+        self._pa = pyarrow
+        self._schema = pyarrow.schema(
+            [("id", pyarrow.string())]
+            + [(prop["name"], _arrow_type(pyarrow, prop["dataType"])) for prop in properties]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write_objects(self, objects: List[dict]) -> None:
+        rows = [{"id": obj["id"], **obj.get("properties", {})} for obj in objects]
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _arrow_type(pa: Any, data_types: List[str]) -> Any:
+    """
+    Get the Arrow type of a property. Dates are kept as their RFC 3339 strings, cross-references
+    are lists of their "beacon" and "href".
+
+    Parameters
+    ----------
+    pa : module
+        The pyarrow module.
+    data_types : List[str]
+        The data types of the property.
+
+    Returns
+    -------
+    pyarrow.DataType
+        The Arrow type.
+    """
+
+    if not _property_is_primitive(data_types):
+        return pa.list_(pa.struct([("beacon", pa.string()), ("href", pa.string())]))
+    data_type = data_types[0]
+    is_array = data_type.endswith("[]")
+    scalar_types = {
+        "int": pa.int64(),
+        "number": pa.float64(),
+        "boolean": pa.bool_(),
+        "geoCoordinates": pa.struct([("latitude", pa.float64()), ("longitude", pa.float64())]),
+        "phoneNumber": pa.struct(
+            [
+                ("input", pa.string()),
+                ("internationalFormatted", pa.string()),
+                ("defaultCountry", pa.string()),
+                ("countryCode", pa.int64()),
+                ("national", pa.int64()),
+                ("nationalFormatted", pa.string()),
+                ("valid", pa.bool_()),
+            ]
+        ),
+    }
+    scalar_type = scalar_types.get(data_type[:-2] if is_array else data_type, pa.string())
+    return pa.list_(scalar_type) if is_array else scalar_type
@@ -13,6 +13,7 @@ from weaviate.error_msgs import (
     REF_DEPRECATION_OLD_V14_TO_CLS_NS_W,
 )
 from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.gql.cache import QueryCache
 from weaviate.util import (
     get_valid_uuid,
     _capitalize_first_letter,
@@ -25,7 +26,7 @@ class Reference:
     Reference class used to manipulate references within objects.
     """
 
-    def __init__(self, connection: Connection):
+    def __init__(self, connection: Connection, query_cache: Optional[QueryCache] = None):
         """
         Initialize a Reference class instance.
 
@@ -33,9 +34,12 @@ class Reference:
         ----------
         connection : weaviate.connect.Connection
             Connection object to an active and running weaviate instance.
+        query_cache : Optional[weaviate.gql.cache.QueryCache], optional
+            The query cache invalidated by the reference changes, by default None
         """
 
         self._connection = connection
+        self._query_cache = query_cache if query_cache is not None else QueryCache()
 
     def delete(
         self,
@@ -217,6 +221,8 @@ class Reference:
             response = self._connection.delete(path=path, weaviate_object=beacon, params=params)
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Reference was not deleted.") from conn_err
+        finally:
+            self._query_cache.invalidate([from_class_name] if from_class_name else None)
         if response.status_code == 204:
             return
         raise UnexpectedStatusCodeException("Delete property reference to object", response)
@@ -442,6 +448,8 @@ class Reference:
             )
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Reference was not updated.") from conn_err
+        finally:
+            self._query_cache.invalidate([from_class_name] if from_class_name else None)
         if response.status_code == 200:
             return
         raise UnexpectedStatusCodeException("Update property reference to object", response)
@@ -615,6 +623,8 @@ class Reference:
             )
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Reference was not added.") from conn_err
+        finally:
+            self._query_cache.invalidate([from_class_name] if from_class_name else None)
         if response.status_code == 200:
             return
         raise UnexpectedStatusCodeException("Add property reference to object", response)
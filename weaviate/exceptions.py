@@ -91,6 +91,76 @@ class SchemaValidationException(WeaviateBaseError):
     """
 
 
+class SchemaApplyException(WeaviateBaseError):
+    """
+    Is raised if some operations of a schema change failed. The operations that depend on a failed
+    one are not run.
+    """
+
+    def __init__(self, errors: dict, skipped: list):
+        """
+        Is raised if some operations of a schema change failed.
+
+        Custom code can act on the attributes:
+        - errors
+        - skipped
+
+        Parameters
+        ----------
+        errors : dict
+            The exception of every failed operation, by operation.
+        skipped : list
+            The operations that were not run because an operation they depend on failed.
+        """
+
+        self.errors = errors
+        self.skipped = skipped
+        msg = f"{len(errors)} schema operation(s) failed"
+        if len(skipped) > 0:
+            msg += f" and {len(skipped)} dependent operation(s) were skipped"
+        details = "; ".join(f"{operation}: {error}" for operation, error in errors.items())
+        super().__init__(f"{msg}: {details}")
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> tuple:
+        # pickle and copy re-create the exception from its own arguments, not from the message
+        return self.__class__, (self.errors, self.skipped)
+
+
+class QueryFailedException(WeaviateBaseError):
+    """
+    Is raised if a GraphQL query returns errors.
+    """
+
+    def __init__(self, message: str, errors: list):
+        """
+        Is raised if a GraphQL query returns errors.
+
+        Custom code can act on the attributes:
+        - errors
+
+        Parameters
+        ----------
+        message : str
+            An error message specific to the context in which the error occurred.
+        errors : list
+            The "errors" of the GraphQL response.
+        """
+
+        self.errors = errors
+        self._message = message
+        super().__init__(f"{message}: {errors}")
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> tuple:
+        # pickle and copy re-create the exception from its own arguments, not from the message
+        return self.__class__, (self._message, self.errors)
+
+
 class BackupFailedException(WeaviateBaseError):
     """
     Backup Failed Exception.
@@ -2,7 +2,7 @@
 GraphQL `Aggregate` command.
 """
 import json
-from typing import List, Optional
+from typing import List, Optional, Set
 from weaviate.connect import Connection
 from weaviate.util import _capitalize_first_letter
 from .filter import (
@@ -288,10 +288,12 @@ class AggregateBuilder(GraphQL):
         ...     # certainty ONLY with `cosine` distance specified in the schema
         ...     'certainty': <float>, # Optional, either 'certainty' OR 'distance'
         ...     'distance': <float>, # Optional, either 'certainty' OR 'distance'
+        ...     'precision': <int>, # Optional, significant digits sent per vector element
         ... }
 
         NOTE: Supported types for 'vector' are `list`, 'numpy.ndarray`, `torch.Tensor`
-                and `tf.Tensor`.
+                and `tf.Tensor`. By default the elements are sent losslessly, see
+                `weaviate.util.format_vector`.
 
         Full content:
 
@@ -385,6 +387,9 @@ class AggregateBuilder(GraphQL):
         self._uses_filter = True
         return self
 
+    def _get_class_names(self) -> Set[str]:
+        return {self._class_name}
+
     def build(self) -> str:
         """
         Build the query and return the string.
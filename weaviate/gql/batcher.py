@@ -0,0 +1,292 @@
+"""
+QueryBatcher class definition.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from numbers import Real
+from typing import Dict, List, Optional
+
+from weaviate.connect import Connection
+from weaviate.util import _check_positive_num
+from .get import GetBuilder
+from .multi_get import MultiGetBuilder
+
+# the maximal number of concurrent requests when the queries of a batch are sent again on their own
+_MAX_RESEND_WORKERS = 8
+
+
+class QueryBatcher:
+    """
+    Sends the `Get` queries of the builders with `with_auto_batching` that are run at about the
+    same time, e.g. from many threads, as one `multi_get` request. The first query waits up to
+    `window` seconds for others to join, or until `max_batch_size` queries are collected, then
+    every query gets an alias, the request is sent and each caller gets the part of the response
+    of its own query, as if it was sent alone. If the response has errors that do not belong to
+    one query, e.g. a validation error that fails the whole request, every query is sent again on
+    its own, concurrently, so a bad query does not fail the others.
+    """
+
+    def __init__(self, connection: Connection, window: Real = 0.002, max_batch_size: int = 50):
+        """
+        Initialize a QueryBatcher class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.connect.Connection
+            Connection object to an active and running Weaviate instance.
+        window : Real, optional
+            The time in seconds a query waits for others to join its batch, by default 0.002
+        max_batch_size : int, optional
+            The maximal number of queries in one request, by default 50
+        """
+
+        self._connection = connection
+        self._lock = threading.Lock()
+        self._open_batch: Optional[_Batch] = None
+        self._num_requests = 0
+        self._num_queries = 0
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+    @property
+    def window(self) -> Real:
+        """
+        Setter and Getter for `window`.
+
+        Parameters
+        ----------
+        value : Real
+            Setter ONLY: The new time in seconds a query waits for others to join its batch.
+
+        Returns
+        -------
+        Real
+            Getter ONLY: The `window` value.
+        """
+
+        return self._window
+
+    @window.setter
+    def window(self, value: Real) -> None:
+        _check_positive_num(value, "window", Real, include_zero=True)
+        self._window = value
+
+    @property
+    def max_batch_size(self) -> int:
+        """
+        Setter and Getter for `max_batch_size`.
+
+        Parameters
+        ----------
+        value : int
+            Setter ONLY: The new maximal number of queries in one request.
+
+        Returns
+        -------
+        int
+            Getter ONLY: The `max_batch_size` value.
+        """
+
+        return self._max_batch_size
+
+    @max_batch_size.setter
+    def max_batch_size(self, value: int) -> None:
+        _check_positive_num(value, "max_batch_size", int)
+        self._max_batch_size = value
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for the batching metrics.
+
+        Returns
+        -------
+        dict
+            The number of 'requests' sent and of 'queries' run with them so far.
+        """
+
+        with self._lock:
+            return {"requests": self._num_requests, "queries": self._num_queries}
+
+    def do(self, builder: GetBuilder) -> dict:
+        """
+        Run a query in the next batch.
+
+        Parameters
+        ----------
+        builder : weaviate.gql.get.GetBuilder
+            The query, it must not change until the result is returned.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        with self._lock:
+            batch = self._open_batch
+            is_leader = batch is None
+            if is_leader:
+                batch = self._open_batch = _Batch()
+            index = len(batch.builders)
+            batch.builders.append(builder)
+            if len(batch.builders) >= self._max_batch_size:
+                self._open_batch = None
+                batch.full.set()
+
+        if is_leader:
+            batch.full.wait(self._window)
+            with self._lock:
+                if self._open_batch is batch:
+                    self._open_batch = None
+                self._num_requests += 1
+                self._num_queries += len(batch.builders)
+            self._send(batch)
+        else:
+            batch.done.wait()
+
+        error = batch.errors.get(index, batch.error)
+        if error is not None:
+            raise error
+        return batch.results[index]
+
+    def _send(self, batch: "_Batch") -> None:
+        """
+        Send the queries of a closed batch and hand out the results.
+
+        Parameters
+        ----------
+        batch : _Batch
+            The batch.
+        """
+
+        try:
+            if len(batch.builders) == 1:
+                builder = batch.builders[0]
+                batch.results = [builder._do_query(builder.build())]
+            else:
+                aliased = []
+                for i, builder in enumerate(batch.builders):
+                    aliased_builder = copy(builder)
+                    aliased_builder._alias = f"q{i}"
+                    aliased.append(aliased_builder)
+                response = MultiGetBuilder(aliased, self._connection).do()
+                if _has_request_errors(response, len(batch.builders)):
+                    self._send_alone(batch)
+                else:
+                    batch.results = _split_response(response, batch.builders)
+        except Exception as error:
+            batch.error = error
+        finally:
+            batch.done.set()
+
+    def _send_alone(self, batch: "_Batch") -> None:
+        """
+        Send every query of a batch on its own, concurrently, and keep the result or the
+        exception of every query.
+
+        Parameters
+        ----------
+        batch : _Batch
+            The batch.
+        """
+
+        def run(builder: GetBuilder) -> dict:
+            return builder._do_query(builder.build())
+
+        num_workers = min(len(batch.builders), _MAX_RESEND_WORKERS)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(run, builder) for builder in batch.builders]
+
+        batch.results = [None] * len(futures)
+        for i, future in enumerate(futures):
+            error = future.exception()
+            if error is None:
+                batch.results[i] = future.result()
+            else:
+                batch.errors[i] = error
+
+
+class _Batch:
+    """
+    The queries collected for one request.
+    """
+
+    def __init__(self):
+        self.builders: List[GetBuilder] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: List[Optional[dict]] = []
+        # the exception of the whole batch, or of the query at an index if they were sent alone
+        self.error: Optional[BaseException] = None
+        self.errors: Dict[int, BaseException] = {}
+
+
+def _has_request_errors(response: dict, num_queries: int) -> bool:
+    """
+    Check whether the response of a batch has errors that do not belong to one of its queries.
+
+    Parameters
+    ----------
+    response : dict
+        The response of the batch.
+    num_queries : int
+        The number of queries in the batch, the query at index `i` has the alias 'q<i>'.
+
+    Returns
+    -------
+    bool
+        True if an error has no path to the alias of a query.
+    """
+
+    aliases = {f"q{i}" for i in range(num_queries)}
+    for error in response.get("errors") or []:
+        path = error.get("path") or []
+        if len(path) < 2 or path[1] not in aliases:
+            return True
+    return False
+
+
+def _split_response(response: dict, builders: List[GetBuilder]) -> List[dict]:
+    """
+    Split the response of a batch into the responses of its queries, the query at index `i` has
+    the alias 'q<i>'. Every error must have a path to the alias of a query, see
+    `_has_request_errors`.
+
+    Parameters
+    ----------
+    response : dict
+        The response of the batch.
+    builders : List[weaviate.gql.get.GetBuilder]
+        The queries of the batch.
+
+    Returns
+    -------
+    List[dict]
+        The response of every query, with the errors of its alias.
+    """
+
+    data = (response.get("data") or {}).get("Get") or {}
+    names = {f"q{i}": builder.name for i, builder in enumerate(builders)}
+    errors: Dict[str, List[dict]] = {}
+    for error in response.get("errors") or []:
+        path = error["path"]
+        errors.setdefault(path[1], []).append(
+            dict(error, path=[path[0], names[path[1]]] + path[2:])
+        )
+
+    results = []
+    for alias, name in names.items():
+        result = {"data": {"Get": {name: data.get(alias)}}}
+        if alias in errors:
+            result["errors"] = errors[alias]
+        results.append(result)
+    return results
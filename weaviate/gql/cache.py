@@ -0,0 +1,321 @@
+"""
+QueryCache class definition.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from numbers import Real
+from typing import Callable, Dict, FrozenSet, Iterable, NamedTuple, Optional, Set, Tuple
+
+from weaviate.util import _capitalize_first_letter, _check_positive_num
+
+
+class QueryCache:
+    """
+    Client-side LRU cache of GraphQL query results, bounded by the size of the cached results.
+    Only the queries of builders with `with_cache` are cached, each for the TTL given there, keyed
+    by the built query. The `DataObject`, `Batch` and `Schema` methods of the same client
+    invalidate the results of the classes they write, writes made by other clients are only seen
+    after the TTL. Results of cross-referenced classes are not tracked either.
+
+    Every invalidation increments the version of the invalidated classes. A query that was
+    started before an invalidation of a class it reads is not cached, so a cached result is never
+    older than the last write of this client to its classes.
+
+    Attributes
+    ----------
+    semantic : weaviate.gql.semantic_cache.SemanticCache
+        The cache of the `nearVector` results of the builders with `with_semantic_cache`,
+        invalidated together with this cache.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize a QueryCache class instance.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            The maximal total size of the cached results, as JSON, by default 64 MiB
+        """
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # the cached queries by class name, None for queries of unknown classes
+        self._queries_by_class: Dict[Optional[str], Set[str]] = {}
+        self._num_bytes = 0
+        self._versions = _ClassVersions()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_bytes = max_bytes
+        # imported here, the semantic cache uses `_ClassVersions` of this module
+        from weaviate.gql.semantic_cache import SemanticCache
+
+        self.semantic = SemanticCache()
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Setter and Getter for `max_bytes`.
+
+        Parameters
+        ----------
+        value : int
+            Setter ONLY: The new maximal total size of the cached results, the least recently
+            used results are evicted if it is exceeded.
+
+        Returns
+        -------
+        int
+            Getter ONLY: The `max_bytes` value.
+        """
+
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        _check_positive_num(value, "max_bytes", int, include_zero=True)
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for the cache metrics.
+
+        Returns
+        -------
+        dict
+            The number of 'hits', 'misses' and 'evictions' so far, and the current number of
+            'entries' and their size in 'bytes'.
+        """
+
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._num_bytes,
+            }
+
+    def invalidate(self, class_names: Optional[Iterable[str]] = None) -> None:
+        """
+        Invalidate the cached results of classes.
+
+        Parameters
+        ----------
+        class_names : Optional[Iterable[str]], optional
+            The classes whose results to invalidate, together with the results of queries of
+            unknown classes. If None all results are invalidated, by default None
+        """
+
+        if class_names is not None:
+            class_names = list(class_names)
+        self.semantic.invalidate(class_names)
+        with self._lock:
+            self._versions.increment(class_names)
+            if class_names is None:
+                self._entries.clear()
+                self._queries_by_class.clear()
+                self._num_bytes = 0
+                return
+            queries = set(self._queries_by_class.get(None, ()))
+            for class_name in class_names:
+                queries.update(self._queries_by_class.get(_capitalize_first_letter(class_name), ()))
+            for query in queries:
+                self._remove(query)
+
+    def get_or_run(
+        self,
+        query: str,
+        class_names: Optional[Iterable[str]],
+        ttl: Real,
+        run: Callable[[], dict],
+    ) -> dict:
+        """
+        Get the cached result of a query, or run it and cache its result if it has no errors.
+
+        Parameters
+        ----------
+        query : str
+            The built query.
+        class_names : Optional[Iterable[str]]
+            The classes the query reads, None if unknown.
+        ttl : Real
+            The time in seconds after which the result expires.
+        run : Callable[[], dict]
+            Function that runs the query.
+
+        Returns
+        -------
+        dict
+            The result, every call returns a new copy.
+        """
+
+        classes = _normalize_class_names(class_names)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(query)
+                self._hits += 1
+                text = entry.text
+            else:
+                if entry is not None:
+                    self._remove(query)
+                self._misses += 1
+                text = None
+                version = self._versions.get(classes)
+        if text is not None:
+            return json.loads(text)
+
+        result = run()
+        if isinstance(result, dict) and not result.get("errors"):
+            self._put(query, classes, json.dumps(result), now + ttl, version)
+        return result
+
+    def _put(
+        self,
+        query: str,
+        classes: Optional[FrozenSet[str]],
+        text: str,
+        expires_at: float,
+        version: Tuple[int, ...],
+    ) -> None:
+        """
+        Cache a result, unless the cache was invalidated since the query was started.
+
+        Parameters
+        ----------
+        query : str
+            The built query.
+        classes : Optional[FrozenSet[str]]
+            The classes the query reads, see `_normalize_class_names`.
+        text : str
+            The result as JSON.
+        expires_at : float
+            The `time.monotonic` time when the result expires.
+        version : Tuple[int, ...]
+            The version of the classes when the query was started.
+        """
+
+        with self._lock:
+            if version != self._versions.get(classes) or len(text) > self._max_bytes:
+                return
+            if query in self._entries:
+                self._remove(query)
+            self._entries[query] = _Entry(text, expires_at, classes)
+            self._num_bytes += len(text)
+            for class_name in classes if classes is not None else (None,):
+                self._queries_by_class.setdefault(class_name, set()).add(query)
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used results until the size limit is met, the lock must be held.
+        """
+
+        while self._num_bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, query: str) -> None:
+        """
+        Remove a cached result, the lock must be held.
+
+        Parameters
+        ----------
+        query : str
+            The built query.
+        """
+
+        entry = self._entries.pop(query)
+        self._num_bytes -= len(entry.text)
+        for class_name in entry.classes if entry.classes is not None else (None,):
+            queries = self._queries_by_class[class_name]
+            queries.discard(query)
+            if len(queries) == 0:
+                del self._queries_by_class[class_name]
+
+
+class _Entry(NamedTuple):
+    """
+    A cached result.
+    """
+
+    text: str
+    expires_at: float
+    classes: Optional[FrozenSet[str]]
+
+
+class _ClassVersions:
+    """
+    The versions of the classes of a cache, incremented when the results of a class are
+    invalidated. The lock of the cache must be held.
+    """
+
+    def __init__(self):
+        # incremented when all results are invalidated
+        self._generation = 0
+        # by class name, None for the queries of unknown classes
+        self._versions: Dict[Optional[str], int] = {}
+
+    def get(self, classes: Optional[FrozenSet[str]]) -> Tuple[int, ...]:
+        """
+        Get the version of the classes of a query.
+
+        Parameters
+        ----------
+        classes : Optional[FrozenSet[str]]
+            The classes the query reads, see `_normalize_class_names`.
+
+        Returns
+        -------
+        Tuple[int, ...]
+            The version, it is different after any invalidation of one of the classes.
+        """
+
+        keys = classes if classes is not None else (None,)
+        return (self._generation,) + tuple(self._versions.get(key, 0) for key in keys)
+
+    def increment(self, class_names: Optional[Iterable[str]]) -> None:
+        """
+        Increment the versions of invalidated classes.
+
+        Parameters
+        ----------
+        class_names : Optional[Iterable[str]]
+            The invalidated classes, together with the queries of unknown classes. If None all
+            classes are invalidated.
+        """
+
+        if class_names is None:
+            self._generation += 1
+            self._versions.clear()
+            return
+        for key in {_capitalize_first_letter(name) for name in class_names} | {None}:
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+
+def _normalize_class_names(class_names: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """
+    Normalize the classes a query reads.
+
+    Parameters
+    ----------
+    class_names : Optional[Iterable[str]]
+        The class names, None if unknown.
+
+    Returns
+    -------
+    Optional[FrozenSet[str]]
+        The capitalized class names, None if unknown.
+    """
+
+    if class_names is None:
+        return None
+    return frozenset(_capitalize_first_letter(name) for name in class_names)
@@ -0,0 +1,105 @@
+"""
+QueryCoalescer class definition.
+"""
+import threading
+from copy import deepcopy
+from typing import Callable, Dict, Optional
+
+
+class QueryCoalescer:
+    """
+    Shares one in-flight run between the concurrent identical queries of the builders with
+    `with_coalescing`. The first caller of a query runs it, the callers that arrive while it is
+    running wait for it. Every caller gets its own copy of the result, or the exception of the run.
+    Nothing is kept once the run is done, so unlike the `QueryCache` results are never stale.
+    """
+
+    def __init__(self):
+        """
+        Initialize a QueryCoalescer class instance.
+        """
+
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._runs = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for the coalescing metrics.
+
+        Returns
+        -------
+        dict
+            The number of 'runs' sent so far, the number of calls that were 'coalesced' into a
+            run of another caller, and the number of runs 'in_flight'.
+        """
+
+        with self._lock:
+            return {
+                "runs": self._runs,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def do(self, query: str, run: Callable[[], dict]) -> dict:
+        """
+        Run a query, or wait for the run of the same query that is in flight.
+
+        Parameters
+        ----------
+        query : str
+            The built query.
+        run : Callable[[], dict]
+            Function that runs the query.
+
+        Returns
+        -------
+        dict
+            A copy of the result, that the caller can modify.
+
+        Raises
+        ------
+        Exception
+            The exception raised by the run.
+        """
+
+        with self._lock:
+            call = self._calls.get(query)
+            if call is None:
+                call = self._calls[query] = _Call()
+                self._runs += 1
+                is_leader = True
+            else:
+                self._coalesced += 1
+                is_leader = False
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return deepcopy(call.result)
+
+        try:
+            call.result = run()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[query]
+            call.done.set()
+        # the callers that waited copy `call.result` concurrently, it must stay unmodified
+        return deepcopy(call.result)
+
+
+class _Call:
+    """
+    A run in flight.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[dict] = None
+        self.error: Optional[BaseException] = None
@@ -6,14 +6,17 @@ import warnings
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from json import dumps
-from typing import Any, Union
+from numbers import Real
+from typing import Any, Optional, Set, Union
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from weaviate.error_msgs import FILTER_BEACON_V14_CLS_NS_W
 from weaviate.exceptions import UnexpectedStatusCodeException
-from weaviate.util import get_vector
+from weaviate.gql.cache import QueryCache
+from weaviate.gql.coalescer import QueryCoalescer
+from weaviate.util import _check_positive_num, format_vector
 
 VALUE_TYPES = {
     "valueString",
@@ -42,6 +45,11 @@ class GraphQL(ABC):
         """
 
         self._connection = connection
+        # set by `Query`, see `with_cache` and `with_coalescing`
+        self._query_cache: Optional[QueryCache] = None
+        self._cache_ttl: Optional[Real] = None
+        self._coalescer: Optional[QueryCoalescer] = None
+        self._coalesce = False
 
     @abstractmethod
     def build(self) -> str:
@@ -71,7 +79,134 @@ class GraphQL(ABC):
         weaviate.UnexpectedStatusCodeException
             If weaviate reports a none OK status.
         """
-        query = self.build()
+        if self._cache_ttl is None or self._query_cache is None:
+            return self._do_coalesced()
+        return self._query_cache.get_or_run(
+            self.build(), self._get_class_names(), self._cache_ttl, self._do_coalesced
+        )
+
+    def with_cache(self, ttl: Real) -> "GraphQL":
+        """
+        Cache the result of this query in the query cache of the client (see `Query.cache`).
+        Running the same query again within `ttl` seconds returns the cached result, unless
+        this client wrote to a queried class in the meantime. Results with errors are not cached.
+
+        Parameters
+        ----------
+        ttl : Real
+            The time in seconds after which the cached result expires.
+
+        Returns
+        -------
+        GraphQL
+            The updated builder.
+
+        Examples
+        --------
+        >>> client.query.aggregate("Article").with_meta_count().with_cache(ttl=30).do()
+
+        Raises
+        ------
+        TypeError
+            If `ttl` is not a number.
+        ValueError
+            If `ttl` is not positive.
+        AttributeError
+            If the builder was not created with `client.query`.
+        """
+
+        _check_positive_num(ttl, "ttl", Real)
+        if self._query_cache is None:
+            raise AttributeError("Only the builders of `client.query` can be cached.")
+        self._cache_ttl = ttl
+        return self
+
+    def with_coalescing(self) -> "GraphQL":
+        """
+        Share the run of this query with the identical queries of the client (see
+        `Query.coalescer`) that run at the same time, so only one request is sent for them.
+        Each caller gets its own copy of the result, or the exception of the shared run.
+
+        Returns
+        -------
+        GraphQL
+            The updated builder.
+
+        Examples
+        --------
+        >>> client.query.get("Article", ["title"]).with_limit(10).with_coalescing().do()
+
+        Raises
+        ------
+        AttributeError
+            If the builder was not created with `client.query`.
+        """
+
+        if self._coalescer is None:
+            raise AttributeError("Only the builders of `client.query` can be coalesced.")
+        self._coalesce = True
+        return self
+
+    def _get_class_names(self) -> Optional[Set[str]]:
+        """
+        Get the classes read by the query, used to invalidate its cached result.
+
+        Returns
+        -------
+        Optional[Set[str]]
+            The class names, or None if unknown.
+        """
+
+        return None
+
+    def _do_coalesced(self) -> dict:
+        """
+        Build and run the query without the query cache, coalesced if `with_coalescing` is set.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+        """
+
+        if not self._coalesce or self._coalescer is None:
+            return self._do_uncached()
+        return self._coalescer.do(self.build(), self._do_uncached)
+
+    def _do_uncached(self) -> dict:
+        """
+        Build and run the query, without the query cache.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+        """
+
+        return self._do_query(self.build())
+
+    def _do_query(self, query: str) -> dict:
+        """
+        Run a built query.
+
+        Parameters
+        ----------
+        query : str
+            The GraphQL query.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
         try:
             response = self._connection.post(path="/graphql", weaviate_object={"query": query})
         except RequestsConnectionError as conn_err:
@@ -208,14 +343,21 @@ class NearVector(Filter):
         KeyError
             If 'content' does not contain "vector".
         TypeError
-            If 'content["vector"]' is not of type list.
+            If 'content["vector"]' is not of a supported type, or 'content["precision"]' is not
+            an int.
         AttributeError
             If invalid 'content' keys are provided.
         ValueError
-            If 'content'  has key "certainty"/"distance" but the value is not float.
+            If 'content'  has key "certainty"/"distance" but the value is not float, or
+            'content["precision"]' is not positive.
         """
 
-        super().__init__(content)
+        if isinstance(content, dict) and isinstance(content.get("vector"), list):
+            # a list of numbers does not need a deep copy, which is slow for long vectors
+            super().__init__({key: value for key, value in content.items() if key != "vector"})
+            self._content["vector"] = list(content["vector"])
+        else:
+            super().__init__(content)
 
         if "vector" not in self._content:
             raise KeyError("No 'vector' key in `content` argument.")
@@ -231,16 +373,44 @@ class NearVector(Filter):
         if "distance" in self._content:
             _check_type(var_name="distance", value=self._content["distance"], dtype=float)
 
-        self._content["vector"] = get_vector(self._content["vector"])
+        if "precision" in self._content:
+            _check_positive_num(self._content["precision"], "precision", int)
+
+        vector = self._content["vector"]
+        if not isinstance(vector, list) and not (
+            hasattr(vector, "tolist") or hasattr(vector, "numpy")
+        ):
+            raise TypeError(
+                "The type of the 'vector' argument is not supported!\n"
+                "Supported types are `list`, 'numpy.ndarray`, `torch.Tensor` and `tf.Tensor`"
+            )
+        # the vector is kept as given and converted only once, when it is rendered on first use
+        self._vector_str: Optional[str] = None
 
     def __str__(self):
-        near_vector = f'nearVector: {{vector: {dumps(self._content["vector"])}'
+        near_vector = f"nearVector: {{vector: {self._get_vector_str()}"
         if "certainty" in self._content:
             near_vector += f' certainty: {self._content["certainty"]}'
         if "distance" in self._content:
             near_vector += f' distance: {self._content["distance"]}'
         return near_vector + "} "
 
+    def _get_vector_str(self) -> str:
+        """
+        Get the rendered vector, it is rendered only once.
+
+        Returns
+        -------
+        str
+            The vector as a GraphQL array.
+        """
+
+        if self._vector_str is None:
+            self._vector_str = format_vector(
+                self._content["vector"], self._content.get("precision")
+            )
+        return self._vector_str
+
 
 class NearObject(Filter):
     """
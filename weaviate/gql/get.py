@@ -1,9 +1,12 @@
 """
 GraphQL `Get` command.
 """
+from copy import copy
 from dataclasses import dataclass
+from functools import partial
 from json import dumps
-from typing import List, Union, Optional, Dict, Tuple
+from numbers import Real
+from typing import TYPE_CHECKING, List, Union, Optional, Dict, Set, Tuple
 
 from weaviate import util
 from weaviate.connect import Connection
@@ -18,8 +21,15 @@ from weaviate.gql.filter import (
     NearImage,
     Sort,
 )
+from weaviate.gql.prepared import PreparedQuery, slot_marker
 from weaviate.types import UUID
-from weaviate.util import image_encoder_b64, _capitalize_first_letter, get_valid_uuid
+from weaviate.util import (
+    image_encoder_b64,
+    _capitalize_first_letter,
+    _check_positive_num,
+    _import_optional,
+    get_valid_uuid,
+)
 from weaviate.warnings import _Warnings
 
 try:
@@ -27,6 +37,9 @@ try:
 except ImportError:
     pass
 
+if TYPE_CHECKING:
+    from .batcher import QueryBatcher
+
 
 @dataclass
 class BM25:
@@ -50,7 +63,7 @@ class Hybrid:
     def __str__(self) -> str:
         ret = f'query: "{util.strip_newlines(self.query)}"'
         if self.vector is not None:
-            ret += f", vector: {self.vector}"
+            ret += f", vector: {util.format_vector(self.vector)}"
         if self.alpha is not None:
             ret += f", alpha: {self.alpha}"
 
@@ -114,6 +127,10 @@ class GetBuilder(GraphQL):
         self._bm25: Optional[BM25] = None
         self._hybrid: Optional[Hybrid] = None
         self._alias: Optional[str] = None
+        self._semantic_cache: Optional[Tuple[Real, Real]] = None  # max distance and TTL
+        # set by `Query`, see `with_auto_batching`
+        self._batcher: Optional["QueryBatcher"] = None
+        self._auto_batch = False
 
     def with_after(self, after_uuid: UUID):
         """Can be used to extract all elements by giving the last ID from the previous "page".
@@ -307,10 +324,12 @@ class GetBuilder(GraphQL):
         ...     # certainty ONLY with `cosine` distance specified in the schema
         ...     'certainty': <float>, # Optional, either 'certainty' OR 'distance'
         ...     'distance': <float>, # Optional, either 'certainty' OR 'distance'
+        ...     'precision': <int>, # Optional, significant digits sent per vector element
         ... }
 
         NOTE: Supported types for 'vector' are `list`, 'numpy.ndarray`, `torch.Tensor`
-                and `tf.Tensor`.
+                and `tf.Tensor`. By default the elements are sent losslessly, see
+                `weaviate.util.format_vector`.
 
         Full content:
 
@@ -1007,6 +1026,82 @@ class GetBuilder(GraphQL):
         self._alias = alias
         return self
 
+    def with_auto_batching(self) -> "GetBuilder":
+        """
+        Send this query together with the other queries of the client that are run at about the
+        same time, as one `multi_get` request (see `Query.batcher`). The result is the same as if
+        the query was sent alone. The query is always sent as GraphQL, even if gRPC is enabled.
+
+        Returns
+        -------
+        weaviate.gql.get.GetBuilder
+            The updated GetBuilder.
+
+        Examples
+        --------
+        >>> client.query.batcher.window = 0.005
+        >>> client.query.get("Article", ["title"]).with_limit(10).with_auto_batching().do()
+
+        Raises
+        ------
+        AttributeError
+            If the builder was not created with `client.query`.
+        """
+
+        if self._batcher is None:
+            raise AttributeError("Only the builders of `client.query` can be batched.")
+        self._auto_batch = True
+        return self
+
+    def with_semantic_cache(self, max_distance: Real, ttl: Real) -> "GetBuilder":
+        """
+        Cache the result of this `nearVector` query in the semantic cache of the client (see
+        `Query.cache`). Running the same query again within `ttl` seconds with a vector within
+        `max_distance` cosine distance of the cached one returns the cached result, unless this
+        client wrote to the class in the meantime. Takes precedence over `with_cache`.
+        Requires 'numpy'.
+
+        Parameters
+        ----------
+        max_distance : Real
+            The maximal cosine distance between the vectors of queries that share a result.
+        ttl : Real
+            The time in seconds after which the cached result expires.
+
+        Returns
+        -------
+        weaviate.gql.get.GetBuilder
+            The updated GetBuilder.
+
+        Examples
+        --------
+        >>> client.query.get("Article", ["title"]) \\
+        ...     .with_near_vector({"vector": question_vector}) \\
+        ...     .with_limit(10) \\
+        ...     .with_semantic_cache(max_distance=0.02, ttl=300) \\
+        ...     .do()
+        >>> client.query.cache.semantic.stats["hit_rate"]
+
+        Raises
+        ------
+        TypeError
+            If `max_distance` or `ttl` is not a number.
+        ValueError
+            If `max_distance` is negative or `ttl` is not positive.
+        AttributeError
+            If the builder was not created with `client.query`.
+        ImportError
+            If 'numpy' is not installed.
+        """
+
+        _check_positive_num(max_distance, "max_distance", Real, include_zero=True)
+        _check_positive_num(ttl, "ttl", Real)
+        if self._query_cache is None:
+            raise AttributeError("Only the builders of `client.query` can be cached.")
+        _import_optional("numpy", "The semantic cache")
+        self._semantic_cache = (max_distance, ttl)
+        return self
+
     def build(self, wrap_get: bool = True) -> str:
         """
         Build query filter as a string.
@@ -1058,7 +1153,7 @@ class GetBuilder(GraphQL):
                 "At least one should be included."
             )
 
-        properties = " ".join(self._properties) + self._additional_to_str()
+        properties = " ".join(self._properties) + additional_props
         query += "{" + properties + "}"
         if wrap_get:
             query += "}}"
@@ -1075,11 +1170,50 @@ class GetBuilder(GraphQL):
 
         Raises
         ------
+        AttributeError
+            If `with_semantic_cache` is set without `with_near_vector`.
         requests.ConnectionError
             If the network connection to weaviate fails.
         weaviate.UnexpectedStatusCodeException
             If weaviate reports a none OK status.
         """
+
+        if self._semantic_cache is None or self._query_cache is None:
+            return super().do()
+        if not isinstance(self._near_ask, NearVector):
+            raise AttributeError("The semantic cache can only be used with `with_near_vector`.")
+
+        # the cache key is the query without its vector
+        template = copy(self)
+        near_vector = copy(self._near_ask)
+        near_vector._vector_str = slot_marker("vector")
+        template._near_ask = near_vector
+        max_distance, ttl = self._semantic_cache
+        return self._query_cache.semantic.get_or_run(
+            template.build(),
+            self._near_ask.content["vector"],
+            self._get_class_names(),
+            max_distance,
+            ttl,
+            self._do_coalesced,
+        )
+
+    def _get_class_names(self) -> Set[str]:
+        return {self._class_name}
+
+    def _do_uncached(self) -> dict:
+        """
+        Build and run the query with gRPC if possible, without the query cache.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+        """
+
+        if self._auto_batch and self._batcher is not None:
+            return self._batcher.do(self)
+
         grpc_enabled = (  # only implemented for some scenarios
             self._connection.grpc_stub is not None
             and self._near_ask is not None
@@ -1108,7 +1242,7 @@ class GetBuilder(GraphQL):
                     class_name=self._class_name,
                     limit=self._limit,
                     near_vector=weaviate_pb2.NearVectorParams(
-                        vector=self._near_ask.content["vector"],
+                        vector=util.get_vector(self._near_ask.content["vector"]),
                         certainty=self._near_ask.content.get("certainty", None),
                         distance=self._near_ask.content.get("distance", None),
                     )
@@ -1144,7 +1278,61 @@ class GetBuilder(GraphQL):
             results = {"data": {"Get": {self._class_name: get_results}}}
             return results
         else:
-            return super().do()
+            return super()._do_uncached()
+
+    def prepare(self) -> PreparedQuery:
+        """
+        Compile the query into a template that is run with different values, without building
+        the whole query again. The limit and the 'vector', 'certainty' and 'distance' of the
+        `nearVector` filter, if set, become slots that can be bound when running it. The prepared
+        query is always sent as GraphQL, even if gRPC is enabled.
+
+        Returns
+        -------
+        weaviate.gql.prepared.PreparedQuery
+            The prepared query, changes to this GetBuilder do not affect it.
+
+        Examples
+        --------
+        >>> search = (
+        ...     client.query.get("Article", ["title"])
+        ...     .with_near_vector({"vector": [0.0] * 384})
+        ...     .with_limit(10)
+        ...     .with_additional("distance")
+        ...     .prepare()
+        ... )
+        >>> search.slots
+        ('limit', 'vector')
+        >>> search.do(vector=query_vector)
+        >>> search.do(vector=query_vector, limit=5)
+
+        Raises
+        ------
+        AttributeError
+            If no 'properties' or 'additional properties' are set.
+        """
+
+        template = copy(self)
+        defaults = {}
+        formatters = {}
+        if self._limit is not None:
+            defaults["limit"] = str(self._limit)
+            template._limit = slot_marker("limit")
+        if isinstance(self._near_ask, NearVector):
+            defaults["vector"] = self._near_ask._get_vector_str()
+            near_vector = copy(self._near_ask)
+            near_vector._content = dict(self._near_ask.content)
+            near_vector._vector_str = slot_marker("vector")
+            for name in ("certainty", "distance"):
+                if name in near_vector.content:
+                    defaults[name] = str(near_vector.content[name])
+                    near_vector.content[name] = slot_marker(name)
+            if "precision" in near_vector.content:
+                formatters["vector"] = partial(
+                    util.format_vector, precision=near_vector.content["precision"]
+                )
+            template._near_ask = near_vector
+        return PreparedQuery(template.build(), defaults, self._connection, formatters)
 
     def _additional_to_str(self) -> str:
         """
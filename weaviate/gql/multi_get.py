@@ -2,7 +2,7 @@
 GraphQL `Get` command.
 """
 
-from typing import List
+from typing import List, Set
 from weaviate.gql.filter import (
     GraphQL,
 )
@@ -74,3 +74,6 @@ class MultiGetBuilder(GraphQL):
         for get in self.get_builder:
             query += get.build(wrap_get=False)
         return query + "}}"
+
+    def _get_class_names(self) -> Set[str]:
+        return {get._class_name for get in self.get_builder}
@@ -0,0 +1,191 @@
+"""
+GraphQL queries that are built once and run many times with different values.
+"""
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from weaviate.connect import Connection
+from weaviate.gql.filter import GraphQL, _check_type
+from weaviate.util import format_vector
+
+_SLOT_PATTERN = re.compile("\x00(\\w+)\x00")
+
+
+def slot_marker(name: str) -> str:
+    """
+    Get the placeholder of a slot, to set on a builder before building the template.
+
+    Parameters
+    ----------
+    name : str
+        The slot name.
+
+    Returns
+    -------
+    str
+        The placeholder.
+    """
+
+    return f"\x00{name}\x00"
+
+
+def _format_limit(value: Any) -> str:
+    _check_type(var_name="limit", value=value, dtype=int)
+    if value < 1:
+        raise ValueError("limit cannot be non-positive (limit >=1).")
+    return str(value)
+
+
+def _format_float(name: str) -> Callable[[Any], str]:
+    def _format(value: Any) -> str:
+        _check_type(var_name=name, value=value, dtype=float)
+        return str(value)
+
+    return _format
+
+
+SLOT_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    "vector": format_vector,
+    "limit": _format_limit,
+    "certainty": _format_float("certainty"),
+    "distance": _format_float("distance"),
+}
+
+
+class PreparedQuery(GraphQL):
+    """
+    A GraphQL query compiled into a template once, see `GetBuilder.prepare`. Running it only
+    renders the values that are bound and joins them with the constant parts of the template.
+    """
+
+    def __init__(
+        self,
+        template: str,
+        defaults: Dict[str, str],
+        connection: Connection,
+        formatters: Optional[Dict[str, Callable[[Any], str]]] = None,
+    ):
+        """
+        Initialize a PreparedQuery class instance.
+
+        Parameters
+        ----------
+        template : str
+            The query with a `slot_marker` for every slot in `defaults`.
+        defaults : Dict[str, str]
+            The rendered value of every slot that is used if no other value is bound, by slot
+            name.
+        connection : weaviate.connect.Connection
+            Connection object to an active and running Weaviate instance.
+        formatters : Optional[Dict[str, Callable[[Any], str]]], optional
+            The functions that render the bound values of slots, by slot name, instead of the
+            ones in `SLOT_FORMATTERS`, by default None
+        """
+
+        super().__init__(connection)
+        self._parts, self._slots = _split_template(template)
+        self._defaults = defaults
+        self._formatters = {**SLOT_FORMATTERS, **(formatters or {})}
+
+    @property
+    def slots(self) -> Tuple[str, ...]:
+        """
+        Getter for the names of the slots that can be bound.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The slot names.
+        """
+
+        return tuple(self._defaults)
+
+    def build(self, **values: Any) -> str:
+        """
+        Render the query with the bound values.
+
+        Parameters
+        ----------
+        **values : Any
+            The value of the slots to bind, by slot name, e.g. `vector=[.1, .2]`, `limit=5`.
+            The other slots keep the value they had when the query was prepared.
+
+        Returns
+        -------
+        str
+            The GraphQL query as a string.
+
+        Raises
+        ------
+        TypeError
+            If a slot does not exist or a value is of a wrong type.
+        ValueError
+            If a value is not valid.
+        """
+
+        unknown = set(values) - set(self._defaults)
+        if len(unknown) != 0:
+            raise TypeError(
+                f"The prepared query has no slot(s) {sorted(unknown)}, "
+                f"available slots: {list(self._defaults)}."
+            )
+        rendered = {name: self._formatters[name](value) for name, value in values.items()}
+        query = [self._parts[0]]
+        for name, part in zip(self._slots, self._parts[1:]):
+            query.append(rendered[name] if name in rendered else self._defaults[name])
+            query.append(part)
+        return "".join(query)
+
+    def do(self, **values: Any) -> dict:
+        """
+        Render and run the query with the bound values.
+
+        Parameters
+        ----------
+        **values : Any
+            The value of the slots to bind, see `build`.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+
+        Raises
+        ------
+        TypeError
+            If a slot does not exist or a value is of a wrong type.
+        ValueError
+            If a value is not valid.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        return self._do_query(self.build(**values))
+
+
+def _split_template(template: str) -> Tuple[List[str], List[str]]:
+    """
+    Split a template into its constant parts and slots.
+
+    Parameters
+    ----------
+    template : str
+        The query with slot markers.
+
+    Returns
+    -------
+    Tuple[List[str], List[str]]
+        The constant parts and the slot names in between them, there is one more part than slots.
+    """
+
+    parts = []
+    slots = []
+    start = 0
+    for match in _SLOT_PATTERN.finditer(template):
+        parts.append(template[start : match.start()])
+        slots.append(match.group(1))
+        start = match.end()
+    parts.append(template[start:])
+    return parts, slots
@@ -1,13 +1,19 @@
 """
 GraphQL query module.
 """
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Real
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
-from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.exceptions import QueryFailedException, UnexpectedStatusCodeException
+from weaviate.util import _check_positive_num, _import_optional
 from .aggregate import AggregateBuilder
+from .batcher import QueryBatcher
+from .cache import QueryCache
+from .coalescer import QueryCoalescer
 from .get import GetBuilder
 from .multi_get import MultiGetBuilder
 
@@ -15,9 +21,18 @@ from .multi_get import MultiGetBuilder
 class Query:
     """
     Query class used to make `get` and/or `aggregate` GraphQL queries.
+
+    Attributes
+    ----------
+    cache : weaviate.gql.cache.QueryCache
+        The cache of the results of the builders with `with_cache`.
+    coalescer : weaviate.gql.coalescer.QueryCoalescer
+        Shares the runs of the identical queries of the builders with `with_coalescing`.
+    batcher : weaviate.gql.batcher.QueryBatcher
+        Sends the concurrent queries of the `get` builders with `with_auto_batching` together.
     """
 
-    def __init__(self, connection: Connection):
+    def __init__(self, connection: Connection, query_cache: Optional[QueryCache] = None):
         """
         Initialize a Classification class instance.
 
@@ -25,9 +40,15 @@ class Query:
         ----------
         connection : weaviate.connect.Connection
             Connection object to an active and running Weaviate instance.
+        query_cache : Optional[weaviate.gql.cache.QueryCache], optional
+            The query cache shared with the write methods of the client, a new one if None,
+            by default None
         """
 
         self._connection = connection
+        self.cache = query_cache if query_cache is not None else QueryCache()
+        self.coalescer = QueryCoalescer()
+        self.batcher = QueryBatcher(connection)
 
     def get(
         self,
@@ -50,7 +71,11 @@ class Query:
             A GetBuilder to make GraphQL `get` requests from weaviate.
         """
 
-        return GetBuilder(class_name, properties, self._connection)
+        builder = GetBuilder(class_name, properties, self._connection)
+        builder._query_cache = self.cache
+        builder._coalescer = self.coalescer
+        builder._batcher = self.batcher
+        return builder
 
     def multi_get(
         self,
@@ -71,7 +96,114 @@ class Query:
             A MultiGetBuilder to make GraphQL `get` multiple requests from weaviate.
         """
 
-        return MultiGetBuilder(get_builder, self._connection)
+        builder = MultiGetBuilder(get_builder, self._connection)
+        builder._query_cache = self.cache
+        builder._coalescer = self.coalescer
+        return builder
+
+    def batch_near_vector(
+        self,
+        class_name: str,
+        vectors: Sequence,
+        k: int,
+        properties: Union[List[str], str, None] = None,
+        distance: Optional[float] = None,
+        chunk_size: int = 50,
+        max_workers: int = 4,
+        as_arrays: bool = False,
+    ) -> Union[List[List[dict]], Tuple[Any, Any]]:
+        """
+        Search the `k` nearest objects of many query vectors. The queries are sent as aliased
+        `multi_get` requests of `chunk_size` queries each, which run concurrently.
+
+        Parameters
+        ----------
+        class_name : str
+            Class name of the objects to search.
+        vectors : Sequence
+            The query vectors, a 2D `numpy.ndarray` or a list of vectors (see `get_vector` for
+            the supported types of a vector).
+        k : int
+            The maximal number of objects per query vector.
+        properties : list of str, str or None, optional
+            Properties of the objects to get, by default None
+        distance : Optional[float], optional
+            The maximal distance of the returned objects, by default None
+        chunk_size : int, optional
+            The number of queries per request, by default 50
+        max_workers : int, optional
+            The maximal number of concurrent requests, by default 4
+        as_arrays : bool, optional
+            If True return only the ids and distances as numpy arrays, requires `numpy`,
+            by default False
+
+        Returns
+        -------
+        Union[List[List[dict]], Tuple[numpy.ndarray, numpy.ndarray]]
+            If `as_arrays` is False, the objects of every query vector in the order of `vectors`,
+            nearest first, every object with its properties and `_additional` 'id' and 'distance'.
+            If `as_arrays` is True, the ids (`object` array, None if there are fewer than `k`
+            objects) and distances (`float` array, NaN if there are fewer than `k` objects), both
+            of shape (len(vectors), k).
+
+        Examples
+        --------
+        >>> results = client.query.batch_near_vector("Article", embeddings, k=10, properties=["title"])
+        >>> results[0][0]
+        {'title': '...', '_additional': {'id': '...', 'distance': 0.12}}
+
+        >>> ids, distances = client.query.batch_near_vector("Article", embeddings, k=10, as_arrays=True)
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If `k`, `chunk_size` or `max_workers` is not positive.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        weaviate.exceptions.QueryFailedException
+            If a query returns errors.
+        """
+
+        _check_positive_num(k, "k", int)
+        _check_positive_num(chunk_size, "chunk_size", int)
+        _check_positive_num(max_workers, "max_workers", int)
+        if distance is not None and (not isinstance(distance, Real) or isinstance(distance, bool)):
+            raise TypeError(f"'distance' must be of type {Real}.")
+
+        near_vectors = []
+        for vector in vectors:
+            content = {"vector": vector}
+            if distance is not None:
+                content["distance"] = float(distance)
+            near_vectors.append(content)
+        chunks = [
+            near_vectors[start : start + chunk_size]
+            for start in range(0, len(near_vectors), chunk_size)
+        ]
+
+        def _search(chunk: List[dict]) -> List[List[dict]]:
+            builders = [
+                GetBuilder(class_name, properties, self._connection)
+                .with_near_vector(content)
+                .with_limit(k)
+                .with_additional(["id", "distance"])
+                .with_alias(f"q{i}")
+                for i, content in enumerate(chunk)
+            ]
+            response = MultiGetBuilder(builders, self._connection).do()
+            if response.get("errors"):
+                raise QueryFailedException("Batch near vector search failed", response["errors"])
+            return [response["data"]["Get"][f"q{i}"] for i in range(len(chunk))]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = [objects for chunk in executor.map(_search, chunks) for objects in chunk]
+        if not as_arrays:
+            return results
+        return _to_arrays(results, k)
 
     def aggregate(self, class_name: str) -> AggregateBuilder:
         """
@@ -88,7 +220,10 @@ class Query:
             An AggregateBuilder to make GraphQL `aggregate` requests from weaviate.
         """
 
-        return AggregateBuilder(class_name, self._connection)
+        builder = AggregateBuilder(class_name, self._connection)
+        builder._query_cache = self.cache
+        builder._coalescer = self.coalescer
+        return builder
 
     def raw(self, gql_query: str) -> dict:
         """
@@ -172,3 +307,30 @@ class Query:
         if response.status_code == 200:
             return response.json()  # Successfully queried
         raise UnexpectedStatusCodeException("GQL query failed", response)
+
+
+def _to_arrays(results: List[List[dict]], k: int) -> Tuple[Any, Any]:
+    """
+    Convert the objects of many searches to id and distance matrices.
+
+    Parameters
+    ----------
+    results : List[List[dict]]
+        The objects of every search, with `_additional` 'id' and 'distance'.
+    k : int
+        The maximal number of objects per search.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        The ids (None if missing) and distances (NaN if missing), of shape (len(results), k).
+    """
+
+    np = _import_optional("numpy", "Returning arrays")
+    ids = np.full((len(results), k), None, dtype=object)
+    distances = np.full((len(results), k), np.nan)
+    for row, objects in enumerate(results):
+        for column, obj in enumerate(objects[:k]):
+            ids[row, column] = obj["_additional"]["id"]
+            distances[row, column] = obj["_additional"]["distance"]
+    return ids, distances
@@ -0,0 +1,334 @@
+"""
+SemanticCache class definition.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from numbers import Real
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from weaviate.gql.cache import _ClassVersions, _normalize_class_names
+from weaviate.util import _capitalize_first_letter, _check_positive_num, _import_optional
+
+
+class SemanticCache:
+    """
+    Client-side LRU cache of `nearVector` query results that are reused for similar vectors.
+    Only the queries of builders with `with_semantic_cache` are cached. A cached result is
+    returned for a query that differs from the cached one only by its vector, if the cosine
+    distance between the two vectors is within the `max_distance` given there. So the class,
+    filters, limit and returned properties must be the same.
+
+    The vectors of the cached queries are kept normalized in one float32 matrix per query, so a
+    lookup is a single matrix-vector product. It is invalidated together with the `QueryCache`
+    it belongs to.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize a SemanticCache class instance.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximal number of cached results, by default 1024
+        """
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        # the cached vectors by query without the vector and vector dimension
+        self._groups: Dict[Tuple[str, int], _Group] = {}
+        # the ids of the cached results by class name, None for queries of unknown classes
+        self._ids_by_class: Dict[Optional[str], Set[int]] = {}
+        self._next_id = 0
+        self._versions = _ClassVersions()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_entries = max_entries
+
+    @property
+    def max_entries(self) -> int:
+        """
+        Setter and Getter for `max_entries`.
+
+        Parameters
+        ----------
+        value : int
+            Setter ONLY: The new maximal number of cached results, the least recently used
+            results are evicted if it is exceeded.
+
+        Returns
+        -------
+        int
+            Getter ONLY: The `max_entries` value.
+        """
+
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int) -> None:
+        _check_positive_num(value, "max_entries", int, include_zero=True)
+        with self._lock:
+            self._max_entries = value
+            self._evict()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for the cache metrics.
+
+        Returns
+        -------
+        dict
+            The number of 'hits', 'misses' and 'evictions' so far, the 'hit_rate' (0.0 if there
+            were no lookups yet) and the current number of 'entries'.
+        """
+
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups != 0 else 0.0,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+            }
+
+    def invalidate(self, class_names: Optional[Iterable[str]] = None) -> None:
+        """
+        Invalidate the cached results of classes.
+
+        Parameters
+        ----------
+        class_names : Optional[Iterable[str]], optional
+            The classes whose results to invalidate, together with the results of queries of
+            unknown classes. If None all results are invalidated, by default None
+        """
+
+        if class_names is not None:
+            class_names = list(class_names)
+        with self._lock:
+            self._versions.increment(class_names)
+            if class_names is None:
+                self._entries.clear()
+                self._groups.clear()
+                self._ids_by_class.clear()
+                return
+            ids = set(self._ids_by_class.get(None, ()))
+            for class_name in class_names:
+                ids.update(self._ids_by_class.get(_capitalize_first_letter(class_name), ()))
+            for entry_id in ids:
+                self._remove(entry_id)
+
+    def get_or_run(
+        self,
+        query: str,
+        vector: Any,
+        class_names: Optional[Iterable[str]],
+        max_distance: Real,
+        ttl: Real,
+        run: Callable[[], dict],
+    ) -> dict:
+        """
+        Get the cached result of a query with a similar vector, or run the query and cache its
+        result if it has no errors.
+
+        Parameters
+        ----------
+        query : str
+            The built query without its vector, see `weaviate.gql.prepared.slot_marker`.
+        vector : Any
+            The vector of the query, a list or a numpy array.
+        class_names : Optional[Iterable[str]]
+            The classes the query reads, None if unknown.
+        max_distance : Real
+            The maximal cosine distance between the vector and the vector of a cached result.
+        ttl : Real
+            The time in seconds after which the result expires.
+        run : Callable[[], dict]
+            Function that runs the query.
+
+        Returns
+        -------
+        dict
+            The result, every call returns a new copy.
+        """
+
+        np = _import_optional("numpy", "The semantic cache")
+        unit = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(unit)
+        if norm == 0:
+            # the cosine distance is not defined
+            return run()
+        unit /= norm
+        group_key = (query, len(unit))
+        classes = _normalize_class_names(class_names)
+
+        now = time.monotonic()
+        with self._lock:
+            entry_id = self._find(group_key, unit, max_distance, now)
+            if entry_id is not None:
+                self._entries.move_to_end(entry_id)
+                self._hits += 1
+                text = self._entries[entry_id].text
+            else:
+                self._misses += 1
+                text = None
+                version = self._versions.get(classes)
+        if text is not None:
+            return json.loads(text)
+
+        result = run()
+        if isinstance(result, dict) and not result.get("errors"):
+            self._put(group_key, unit, classes, json.dumps(result), now + ttl, version)
+        return result
+
+    def _find(
+        self, group_key: Tuple[str, int], unit: Any, max_distance: Real, now: float
+    ) -> Optional[int]:
+        """
+        Find the cached result with the most similar vector, the lock must be held.
+
+        Parameters
+        ----------
+        group_key : Tuple[str, int]
+            The query without its vector and the vector dimension.
+        unit : numpy.ndarray
+            The normalized vector.
+        max_distance : Real
+            The maximal cosine distance.
+        now : float
+            The current `time.monotonic` time.
+
+        Returns
+        -------
+        Optional[int]
+            The id of the cached result, or None if there is no unexpired one within
+            `max_distance`.
+        """
+
+        group = self._groups.get(group_key)
+        if group is None:
+            return None
+        similarities = group.vectors[: len(group.ids)] @ unit
+        index = int(similarities.argmax())
+        if 1.0 - float(similarities[index]) > max_distance:
+            return None
+        entry_id = group.ids[index]
+        if self._entries[entry_id].expires_at <= now:
+            self._remove(entry_id)
+            return None
+        return entry_id
+
+    def _put(
+        self,
+        group_key: Tuple[str, int],
+        unit: Any,
+        classes: Optional[FrozenSet[str]],
+        text: str,
+        expires_at: float,
+        version: Tuple[int, ...],
+    ) -> None:
+        """
+        Cache a result, unless the cache was invalidated since the query was started.
+
+        Parameters
+        ----------
+        group_key : Tuple[str, int]
+            The query without its vector and the vector dimension.
+        unit : numpy.ndarray
+            The normalized vector.
+        classes : Optional[FrozenSet[str]]
+            The classes the query reads, see `weaviate.gql.cache._normalize_class_names`.
+        text : str
+            The result as JSON.
+        expires_at : float
+            The `time.monotonic` time when the result expires.
+        version : Tuple[int, ...]
+            The version of the classes when the query was started.
+        """
+
+        with self._lock:
+            if version != self._versions.get(classes) or self._max_entries == 0:
+                return
+            entry_id = self._next_id
+            self._next_id += 1
+            group = self._groups.get(group_key)
+            if group is None:
+                group = self._groups[group_key] = _Group(len(unit))
+            group.append(entry_id, unit)
+            self._entries[entry_id] = _Entry(group_key, text, expires_at, classes)
+            for class_name in classes if classes is not None else (None,):
+                self._ids_by_class.setdefault(class_name, set()).add(entry_id)
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used results until the entry limit is met, the lock must be
+        held.
+        """
+
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, entry_id: int) -> None:
+        """
+        Remove a cached result, the lock must be held.
+
+        Parameters
+        ----------
+        entry_id : int
+            The id of the cached result.
+        """
+
+        entry = self._entries.pop(entry_id)
+        group = self._groups[entry.group_key]
+        group.remove(entry_id)
+        if len(group.ids) == 0:
+            del self._groups[entry.group_key]
+        for class_name in entry.classes if entry.classes is not None else (None,):
+            ids = self._ids_by_class[class_name]
+            ids.discard(entry_id)
+            if len(ids) == 0:
+                del self._ids_by_class[class_name]
+
+
+class _Group:
+    """
+    The normalized vectors of the cached results of one query, the rows past the number of ids
+    are unused.
+    """
+
+    def __init__(self, dimension: int):
+        np = _import_optional("numpy", "The semantic cache")
+        self.vectors = np.empty((8, dimension), dtype=np.float32)
+        self.ids: List[int] = []
+
+    def append(self, entry_id: int, unit: Any) -> None:
+        if len(self.ids) == len(self.vectors):
+            np = _import_optional("numpy", "The semantic cache")
+            self.vectors = np.concatenate([self.vectors, np.empty_like(self.vectors)])
+        self.vectors[len(self.ids)] = unit
+        self.ids.append(entry_id)
+
+    def remove(self, entry_id: int) -> None:
+        # move the last row into the freed one
+        index = self.ids.index(entry_id)
+        last = len(self.ids) - 1
+        self.vectors[index] = self.vectors[last]
+        self.ids[index] = self.ids[last]
+        self.ids.pop()
+
+
+class _Entry(NamedTuple):
+    """
+    A cached result.
+    """
+
+    group_key: Tuple[str, int]
+    text: str
+    expires_at: float
+    classes: Optional[FrozenSet[str]]
@@ -0,0 +1,77 @@
+"""
+Run schema operations concurrently in the order of their dependencies.
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Collection, Dict, Hashable, List, Tuple
+
+from weaviate.exceptions import SchemaApplyException
+
+# operation -> (function that applies it, operations it depends on)
+Operations = Dict[Hashable, Tuple[Callable[[], Any], Collection[Hashable]]]
+
+
+def apply_in_order(operations: Operations, max_workers: int) -> None:
+    """
+    Run every operation once all operations it depends on succeeded, with at most `max_workers`
+    operations running concurrently. Dependencies that are not in `operations` are ignored. If an
+    operation fails, the operations that (transitively) depend on it are skipped, all the others
+    are still run.
+
+    Parameters
+    ----------
+    operations : Operations
+        The operations, with their dependencies.
+    max_workers : int
+        The maximal number of concurrent operations.
+
+    Raises
+    ------
+    weaviate.exceptions.SchemaApplyException
+        If at least one operation failed, or the dependencies contain a cycle.
+    """
+
+    num_pending_deps: Dict[Hashable, int] = {}
+    dependents: Dict[Hashable, List[Hashable]] = {key: [] for key in operations}
+    for key, (_, dependencies) in operations.items():
+        dependencies = {dep for dep in dependencies if dep in operations and dep != key}
+        num_pending_deps[key] = len(dependencies)
+        for dep in dependencies:
+            dependents[dep].append(key)
+
+    ready = [key for key, num in num_pending_deps.items() if num == 0]
+    errors: Dict[Hashable, Exception] = {}
+    skipped: List[Hashable] = []
+    finished = set()
+
+    def _skip_dependents(key: Hashable) -> None:
+        for dependent in dependents[key]:
+            if dependent not in finished:
+                finished.add(dependent)
+                skipped.append(dependent)
+                _skip_dependents(dependent)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+        while len(ready) > 0 or len(running) > 0:
+            for key in ready:
+                running[executor.submit(operations[key][0])] = key
+            ready = []
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                finished.add(key)
+                error = future.exception()
+                if error is not None:
+                    errors[key] = error
+                    _skip_dependents(key)
+                    continue
+                for dependent in dependents[key]:
+                    num_pending_deps[dependent] -= 1
+                    if num_pending_deps[dependent] == 0 and dependent not in finished:
+                        ready.append(dependent)
+
+    for key in operations:
+        if key not in finished:
+            errors[key] = ValueError("Cyclic dependency between schema operations.")
+    if len(errors) > 0:
+        raise SchemaApplyException(errors, skipped)
@@ -0,0 +1,249 @@
+"""
+SchemaCache class definition.
+"""
+import threading
+import time
+from numbers import Real
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from weaviate.util import _capitalize_first_letter, _check_positive_num
+
+
+class SchemaCache:
+    """
+    Client-side cache of the whole schema, with O(1) class and property lookups. The schema is
+    fetched on the first lookup and again once it is older than `ttl` seconds or was invalidated.
+    The Schema (and Property) methods of the same client invalidate it after every schema
+    mutation, schema changes made by other clients are only seen after `ttl` or `refresh`.
+    Besides the `use_cache` lookups of the Schema, `Schema.update_config` and the class
+    definitions needed by `DataObject.get_by_ids` and `DataObject.export` are read from it.
+
+    Every invalidation increments `version`. A fetch that was started before an invalidation is
+    not cached, so a lookup never returns a schema that is older than the last mutation.
+
+    The returned dicts are shared with the cache and must NOT be modified.
+    """
+
+    def __init__(self, fetch: Callable[[], dict], ttl: Optional[Real] = 60):
+        """
+        Initialize a SchemaCache class instance.
+
+        Parameters
+        ----------
+        fetch : Callable[[], dict]
+            Function that fetches the whole schema from Weaviate.
+        ttl : Optional[Real], optional
+            The time in seconds after which the cached schema is fetched again. If None it is only
+            fetched again after an invalidation, by default 60
+        """
+
+        self._fetch = fetch
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot: Optional[_Snapshot] = None
+        self._fetched_at = 0.0
+
+    @property
+    def ttl(self) -> Optional[Real]:
+        """
+        Setter and Getter for `ttl`.
+
+        Parameters
+        ----------
+        value : Optional[Real]
+            Setter ONLY: The new time in seconds after which the cached schema is fetched again,
+            or None to only fetch it again after an invalidation.
+
+        Returns
+        -------
+        Optional[Real]
+            Getter ONLY: The `ttl` value.
+        """
+
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: Optional[Real]) -> None:
+        if value is not None:
+            _check_positive_num(value, "ttl", Real, include_zero=True)
+        self._ttl = value
+
+    @property
+    def version(self) -> int:
+        """
+        Getter for the number of invalidations so far.
+
+        Returns
+        -------
+        int
+            The version of the cache.
+        """
+
+        return self._version
+
+    def invalidate(self) -> None:
+        """
+        Invalidate the cached schema, it is fetched again on the next lookup.
+        """
+
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+
+    def refresh(self) -> dict:
+        """
+        Fetch the schema again, regardless of its age.
+
+        Returns
+        -------
+        dict
+            The whole schema.
+        """
+
+        self.invalidate()
+        return self.get()
+
+    def get(self) -> dict:
+        """
+        Get the whole schema.
+
+        Returns
+        -------
+        dict
+            The (cached) schema.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to Weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If Weaviate reports a non-OK status.
+        """
+
+        return self._load().schema
+
+    def get_class(self, class_name: str) -> Optional[dict]:
+        """
+        Get the schema of a class.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name.
+
+        Returns
+        -------
+        Optional[dict]
+            The (cached) schema of the class, or None if it does not exist.
+        """
+
+        return self._load().classes.get(_capitalize_first_letter(class_name))
+
+    def get_property(self, class_name: str, property_name: str) -> Optional[dict]:
+        """
+        Get the schema of a property.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name.
+        property_name : str
+            The property name.
+
+        Returns
+        -------
+        Optional[dict]
+            The (cached) schema of the property, or None if it (or the class) does not exist.
+        """
+
+        return self._load().properties.get((_capitalize_first_letter(class_name), property_name))
+
+    def contains_class(self, class_name: str) -> bool:
+        """
+        Check if a class exists.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name.
+
+        Returns
+        -------
+        bool
+            True if the class exists, False otherwise.
+        """
+
+        return self.get_class(class_name) is not None
+
+    def _load(self) -> "_Snapshot":
+        """
+        Get the cached snapshot, or fetch a new one if there is none or it expired.
+
+        Returns
+        -------
+        _Snapshot
+            The schema and its indexes.
+        """
+
+        with self._lock:
+            if self._snapshot is not None and (
+                self._ttl is None or time.monotonic() - self._fetched_at < self._ttl
+            ):
+                return self._snapshot
+            version = self._version
+
+        fetched_at = time.monotonic()
+        snapshot = _Snapshot.from_schema(self._fetch())
+        with self._lock:
+            # do not cache a schema that was fetched before the last invalidation
+            if version == self._version:
+                self._snapshot = snapshot
+                self._fetched_at = fetched_at
+        return snapshot
+
+
+class _Snapshot(NamedTuple):
+    """
+    The whole schema, indexed by class name and (class name, property name).
+    """
+
+    schema: dict
+    classes: Dict[str, dict]
+    properties: Dict[Tuple[str, str], dict]
+
+    @classmethod
+    def from_schema(cls, schema: dict) -> "_Snapshot":
+        classes = {
+            _capitalize_first_letter(class_["class"]): class_
+            for class_ in schema.get("classes", [])
+        }
+        properties = {
+            (class_name, property_["name"]): property_
+            for class_name, class_ in classes.items()
+            for property_ in class_.get("properties") or []
+        }
+        return cls(schema, classes, properties)
+
+
+def _copy_schema(value: Any) -> Any:
+    """
+    Copy a (part of a) schema. Schemas only consist of dicts, lists and immutable values, so this
+    is several times faster than `copy.deepcopy`.
+
+    Parameters
+    ----------
+    value : Any
+        The schema, a class or a property.
+
+    Returns
+    -------
+    Any
+        The copy.
+    """
+
+    if isinstance(value, dict):
+        return {key: _copy_schema(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_schema(item) for item in value]
+    return value
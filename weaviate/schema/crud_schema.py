@@ -1,12 +1,24 @@
 """
 Schema class definition.
 """
-from typing import Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Union, Optional
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
-from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.exceptions import SchemaApplyException, UnexpectedStatusCodeException
+from weaviate.gql.cache import QueryCache
+from weaviate.schema.applier import Operations, apply_in_order
+from weaviate.schema.cache import SchemaCache, _copy_schema
+from weaviate.schema.planner import (
+    ADD_PROPERTY,
+    CREATE_CLASS,
+    UPDATE_CONFIG,
+    SchemaOperation,
+    plan_schema_changes,
+)
 from weaviate.schema.properties import Property
 from weaviate.schema.validate_schema import (
     validate_schema,
@@ -14,7 +26,12 @@ from weaviate.schema.validate_schema import (
     CLASS_KEYS,
     PROPERTY_KEYS,
 )
-from weaviate.util import _get_dict_from_object, _is_sub_schema, _capitalize_first_letter
+from weaviate.util import (
+    _get_dict_from_object,
+    _is_sub_schema,
+    _capitalize_first_letter,
+    _check_positive_num,
+)
 
 _PRIMITIVE_WEAVIATE_TYPES_SET = {
     "string",
@@ -43,9 +60,11 @@ class Schema:
     ----------
     property : weaviate.schema.properties.Property
         A Property object to create new schema property/ies.
+    cache : weaviate.schema.cache.SchemaCache
+        The client-side cache of the schema, invalidated by the schema mutations of this client.
     """
 
-    def __init__(self, connection: Connection):
+    def __init__(self, connection: Connection, query_cache: Optional[QueryCache] = None):
         """
         Initialize a Schema class instance.
 
@@ -53,12 +72,17 @@ class Schema:
         ----------
         connection : weaviate.connect.Connection
             Connection object to an active and running Weaviate instance.
+        query_cache : Optional[weaviate.gql.cache.QueryCache], optional
+            The query cache invalidated by the deletion and reconfiguration of classes,
+            by default None
         """
 
         self._connection = connection
-        self.property = Property(self._connection)
+        self._query_cache = query_cache if query_cache is not None else QueryCache()
+        self.cache = SchemaCache(self._get_schema)
+        self.property = Property(self._connection, self.cache)
 
-    def create(self, schema: Union[dict, str]) -> None:
+    def create(self, schema: Union[dict, str], max_workers: int = 1) -> None:
         """
         Create the schema of the Weaviate instance, with all classes at once.
 
@@ -66,6 +90,12 @@ class Schema:
         ----------
         schema : dict or str
             Schema as a Python dict, or the path to a JSON file, or the URL of a JSON file.
+        max_workers : int, optional
+            The maximal number of concurrent requests. If greater than 1 the classes (with their
+            primitive properties) are created concurrently, and every cross-reference property is
+            added as soon as its class and the classes it references exist. A failed request does
+            not stop the creation of the classes and properties that do not depend on it,
+            by default 1
 
         Examples
         --------
@@ -120,11 +150,19 @@ class Schema:
             If Weaviate reports a non-OK status.
         weaviate.SchemaValidationException
             If the 'schema' could not be validated against the standard format.
+        weaviate.exceptions.SchemaApplyException
+            If `max_workers` is greater than 1 and some classes or properties could not be
+            created, with the error of every failed request.
         """
 
+        _check_positive_num(max_workers, "max_workers", int)
         loaded_schema = _get_dict_from_object(schema)
         # validate the schema before loading
         validate_schema(loaded_schema)
+        if max_workers > 1:
+            operations = plan_schema_changes(loaded_schema, {"classes": []})
+            apply_in_order(_get_apply_operations(self, operations), max_workers)
+            return
         self._create_classes_with_primitives(loaded_schema["classes"])
         self._create_complex_properties_from_classes(loaded_schema["classes"])
 
@@ -213,6 +251,9 @@ class Schema:
             response = self._connection.delete(path=path)
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Deletion of class.") from conn_err
+        finally:
+            self.cache.invalidate()
+            self._query_cache.invalidate([class_name])
         if response.status_code != 200:
             raise UnexpectedStatusCodeException("Delete class from schema", response)
 
@@ -230,7 +271,7 @@ class Schema:
         for _class in classes:
             self.delete_class(_class["class"])
 
-    def contains(self, schema: Optional[Union[dict, str]] = None) -> bool:
+    def contains(self, schema: Optional[Union[dict, str]] = None, use_cache: bool = False) -> bool:
         """
         Check if Weaviate already contains a schema.
 
@@ -241,6 +282,9 @@ class Schema:
             If a schema is given it is checked if this specific schema is already loaded.
             It will test only this schema. If the given schema is a subset of the loaded
             schema it will still return true, by default None.
+        use_cache : bool, optional
+            If True the schema is compared with the cached schema, see `cache`, instead of
+            fetching it, by default False
 
         Examples
         --------
@@ -271,7 +315,7 @@ class Schema:
             False otherwise.
         """
 
-        loaded_schema = self.get()
+        loaded_schema = self.cache.get() if use_cache else self.get()
 
         if schema is not None:
             sub_schema = _get_dict_from_object(schema)
@@ -281,7 +325,7 @@ class Schema:
             return False
         return True
 
-    def update_config(self, class_name: str, config: dict) -> None:
+    def update_config(self, class_name: str, config: dict, use_cache: bool = False) -> None:
         """
         Update a schema configuration for a specific class.
 
@@ -291,6 +335,10 @@ class Schema:
             The class for which to update the schema configuration.
         config : dict
             The configurations to update (MUST follow schema format).
+        use_cache : bool, optional
+            Whether to update the cached class definition (see `cache`) instead of fetching it
+            first. Only set it to True if the cache was just refreshed, otherwise changes of the
+            class by other clients within the `ttl` of the cache are overwritten, by default False
 
         Example
         -------
@@ -338,7 +386,7 @@ class Schema:
         """
 
         class_name = _capitalize_first_letter(class_name)
-        class_schema = self.get(class_name)
+        class_schema = self.get(class_name, use_cache=use_cache)
         new_class_schema = _update_nested_dict(class_schema, config)
         check_class(new_class_schema)
 
@@ -349,10 +397,117 @@ class Schema:
             raise RequestsConnectionError(
                 "Class schema configuration could not be updated."
             ) from conn_err
+        finally:
+            self.cache.invalidate()
+            self._query_cache.invalidate([class_name])
         if response.status_code != 200:
             raise UnexpectedStatusCodeException("Update class schema configuration", response)
 
-    def get(self, class_name: str = None) -> dict:
+    def plan(
+        self,
+        schema: Union[dict, str],
+        delete_missing: bool = False,
+        use_cache: bool = True,
+    ) -> List[SchemaOperation]:
+        """
+        Compute the minimal operations that change the schema of Weaviate to contain `schema`,
+        without executing them. Missing classes and properties are created and the class
+        settings in `schema` that differ are updated, nothing is recreated.
+
+        Parameters
+        ----------
+        schema : dict or str
+            The desired schema as a Python dict, or the path to a JSON file, or the URL of a JSON
+            file.
+        delete_missing : bool, optional
+            If True the classes that are not in `schema` are deleted, by default False
+        use_cache : bool, optional
+            Whether to compare with the cached schema (see `cache`) instead of fetching it,
+            by default True
+
+        Returns
+        -------
+        List[weaviate.schema.planner.SchemaOperation]
+            The operations, in an order in which they can be applied one after another.
+
+        Examples
+        --------
+        >>> client.schema.plan({"classes": [{"class": "Article", "description": "News"}]})
+        [SchemaOperation(action='update_config', class_name='Article', payload={'description':
+        'News'}, depends_on=[])]
+
+        Raises
+        ------
+        TypeError
+            If the 'schema' is neither a string nor a dict.
+        ValueError
+            If 'schema' can not be converted into a Weaviate schema.
+        requests.ConnectionError
+            If the network connection to Weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If Weaviate reports a non-OK status.
+        weaviate.SchemaValidationException
+            If the 'schema' could not be validated against the standard format, or if the data
+            type of an existing property would have to change.
+        """
+
+        loaded_schema = _get_dict_from_object(schema)
+        validate_schema(loaded_schema)
+        live_schema = self.cache.get() if use_cache else self._get_schema()
+        return plan_schema_changes(loaded_schema, live_schema, delete_missing=delete_missing)
+
+    def migrate(
+        self,
+        schema: Union[dict, str],
+        delete_missing: bool = False,
+        max_workers: int = 4,
+    ) -> List[SchemaOperation]:
+        """
+        Change the schema of Weaviate to contain `schema` with the operations of `plan`, compared
+        with the freshly fetched schema. Operations that do not depend on each other are executed
+        concurrently, e.g. the configs of all classes are updated at once.
+
+        Parameters
+        ----------
+        schema : dict or str
+            The desired schema as a Python dict, or the path to a JSON file, or the URL of a JSON
+            file.
+        delete_missing : bool, optional
+            If True the classes that are not in `schema` are deleted, with all their objects,
+            by default False
+        max_workers : int, optional
+            The maximal number of concurrent requests, by default 4
+
+        Returns
+        -------
+        List[weaviate.schema.planner.SchemaOperation]
+            The executed operations, empty if the schema already contained `schema`.
+
+        Raises
+        ------
+        TypeError
+            If the 'schema' is neither a string nor a dict.
+        ValueError
+            If 'schema' can not be converted into a Weaviate schema.
+        requests.ConnectionError
+            If the network connection to Weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If Weaviate reports a non-OK status.
+        weaviate.SchemaValidationException
+            If the 'schema' could not be validated against the standard format, or if the data
+            type of an existing property would have to change.
+        weaviate.exceptions.SchemaApplyException
+            If some operations failed, with the error of every failed operation.
+        """
+
+        _check_positive_num(max_workers, "max_workers", int)
+        self.cache.invalidate()
+        operations = self.plan(schema, delete_missing=delete_missing)
+        if len(operations) != 0:
+            apply_in_order(_get_apply_operations(self, operations), max_workers)
+        return operations
+
+    def get(self, class_name: str = None, use_cache: bool = False) -> dict:
         """
         Get the schema from Weaviate.
 
@@ -361,6 +516,9 @@ class Schema:
         class_name : str, optional
             The class for which to return the schema. If NOT provided the whole schema is returned,
             otherwise only the schema of this class is returned. By default None.
+        use_cache : bool, optional
+            If True a copy of the cached schema is returned, see `cache`, instead of fetching it.
+            The schema is fetched if it is not cached or expired, by default False
 
         Returns
         -------
@@ -456,6 +614,14 @@ class Schema:
                 )
             path = f"/schema/{_capitalize_first_letter(class_name)}"
 
+        if use_cache:
+            if class_name is None:
+                return _copy_schema(self.cache.get())
+            class_schema = self.cache.get_class(class_name)
+            # unknown classes are requested, to raise the same error as without the cache
+            if class_schema is not None:
+                return _copy_schema(class_schema)
+
         try:
             response = self._connection.get(path=path)
         except RequestsConnectionError as conn_err:
@@ -464,6 +630,18 @@ class Schema:
             raise UnexpectedStatusCodeException("Get schema", response)
         return response.json()
 
+    def _get_schema(self) -> dict:
+        """
+        Fetch the whole schema, used by the `cache`.
+
+        Returns
+        -------
+        dict
+            The schema.
+        """
+
+        return self.get()
+
     def get_class_shards(self, class_name: str) -> list:
         """
         Get the status of all shards in an index.
@@ -514,6 +692,7 @@ class Schema:
         class_name: str,
         status: str,
         shard_name: Optional[str] = None,
+        max_workers: int = 8,
     ) -> list:
         """
         Get the status of all shards in an index.
@@ -527,6 +706,8 @@ class Schema:
         shard_name : str or None, optional
             The shard name for which to update the status of the class of the shard. If None then
             all the shards are going to be updated to the 'status'. By default None.
+        max_workers : int, optional
+            The maximal number of concurrent requests when updating all shards, by default 8
 
         Returns
         -------
@@ -560,7 +741,9 @@ class Schema:
         requests.ConnectionError
             If the network connection to Weaviate fails.
         weaviate.UnexpectedStatusCodeException
-            If Weaviate reports a non-OK status.
+            If Weaviate reports a non-OK status. If `shard_name` is None the other shards are
+            still updated, and the error is chained to a `weaviate.exceptions.SchemaApplyException`
+            with the errors of all failed requests.
         """
 
         if not isinstance(class_name, str):
@@ -576,40 +759,136 @@ class Schema:
                 "'status' argument must be of type `str`! " f"Given type: {type(status)}."
             )
 
-        if shard_name is None:
-            shards_config = self.get_class_shards(
-                class_name=class_name,
+        if shard_name is not None:
+            return self._update_shard_status(class_name, shard_name, status)
+        try:
+            return self.update_classes_shards([class_name], status, max_workers)[class_name]
+        except SchemaApplyException as error:
+            raise next(iter(error.errors.values())) from error
+
+    def update_classes_shards(
+        self,
+        class_names: List[str],
+        status: str,
+        max_workers: int = 8,
+    ) -> Dict[str, list]:
+        """
+        Update the status of all shards of many classes. The shards of all classes are listed and
+        then updated concurrently, with at most `max_workers` requests at a time. A failed request
+        does not stop the update of the other shards.
+
+        Parameters
+        ----------
+        class_names : List[str]
+            The classes for which to update the status of all shards.
+        status : str
+            The new status of the shards. The available options are: 'READY' and 'READONLY'.
+        max_workers : int, optional
+            The maximal number of concurrent requests, by default 8
+
+        Returns
+        -------
+        Dict[str, list]
+            The updated statuses of the shards, by class name.
+
+        Examples
+        --------
+        >>> client.schema.update_classes_shards(['Article', 'Author'], 'READY')
+        {'Article': [{'status': 'READY'}, {'status': 'READY'}], 'Author': [{'status': 'READY'}]}
+
+        Raises
+        ------
+        TypeError
+            If an argument is of a wrong type.
+        ValueError
+            If `max_workers` is not positive.
+        weaviate.exceptions.SchemaApplyException
+            If some shards could not be listed or updated, with the error of every failed request
+            by class name (failed listing) or by (class name, shard name) (failed update).
+        """
+
+        if not isinstance(class_names, list) or not all(
+            isinstance(class_name, str) for class_name in class_names
+        ):
+            raise TypeError(
+                "'class_names' argument must be of type `List[str]`! "
+                f"Given type: {type(class_names)}."
             )
-            shard_names = [shard_config["name"] for shard_config in shards_config]
-        else:
-            shard_names = [shard_name]
+        if not isinstance(status, str):
+            raise TypeError(
+                "'status' argument must be of type `str`! " f"Given type: {type(status)}."
+            )
+        _check_positive_num(max_workers, "max_workers", int)
 
-        data = {"status": status}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            listings = {
+                class_name: executor.submit(self.get_class_shards, class_name)
+                for class_name in class_names
+            }
+            updates = {}
+            for class_name, listing in listings.items():
+                if listing.exception() is not None:
+                    errors[class_name] = listing.exception()
+                    continue
+                for shard in listing.result():
+                    updates[(class_name, shard["name"])] = executor.submit(
+                        self._update_shard_status, class_name, shard["name"], status
+                    )
+
+        to_return = {class_name: [] for class_name in listings if class_name not in errors}
+        for (class_name, shard_name), update in updates.items():
+            if update.exception() is not None:
+                errors[(class_name, shard_name)] = update.exception()
+            else:
+                to_return[class_name].append(update.result())
+        if len(errors) > 0:
+            raise SchemaApplyException(errors, [])
+        return to_return
+
+    def _update_shard_status(self, class_name: str, shard_name: str, status: str) -> dict:
+        """
+        Update the status of a shard.
 
-        to_return = []
+        Parameters
+        ----------
+        class_name : str
+            The class of the shard.
+        shard_name : str
+            The shard name.
+        status : str
+            The new status of the shard.
 
-        for _shard_name in shard_names:
-            path = f"/schema/{_capitalize_first_letter(class_name)}/shards/{_shard_name}"
-            try:
-                response = self._connection.put(
-                    path=path,
-                    weaviate_object=data,
-                )
-            except RequestsConnectionError as conn_err:
-                raise RequestsConnectionError(
-                    f"Class shards' status could not be updated for shard '{_shard_name}' due to "
-                    "connection error."
-                ) from conn_err
-            if response.status_code != 200:
-                raise UnexpectedStatusCodeException(
-                    f"Update shard '{_shard_name}' status",
-                    response,
-                )
-            to_return.append(response.json())
+        Returns
+        -------
+        dict
+            The updated status.
 
-        if shard_name is None:
-            return to_return
-        return to_return[0]
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to Weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If Weaviate reports a non-OK status.
+        """
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}/shards/{shard_name}"
+        try:
+            response = self._connection.put(
+                path=path,
+                weaviate_object={"status": status},
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                f"Class shards' status could not be updated for shard '{shard_name}' due to "
+                "connection error."
+            ) from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException(
+                f"Update shard '{shard_name}' status",
+                response,
+            )
+        return response.json()
 
     def _create_complex_properties_from_class(self, schema_class: dict) -> None:
         """
@@ -636,25 +915,48 @@ class Schema:
             if _property_is_primitive(property_["dataType"]):
                 continue
 
-            # Create the property object. All complex dataTypes should be capitalized.
-            schema_property = {
-                "dataType": [_capitalize_first_letter(dtype) for dtype in property_["dataType"]],
-                "name": property_["name"],
-            }
+            self._create_complex_property(schema_class["class"], property_)
+
+    def _create_complex_property(self, class_name: str, property_: dict) -> None:
+        """
+        Add a cross-reference to an already existing class.
+
+        Parameters
+        ----------
+        class_name : str
+            The class to add the cross-reference to.
+        property_ : dict
+            Description of the cross-reference property.
 
-            for property_field in PROPERTY_KEYS - {"name", "dataType"}:
-                if property_field in property_:
-                    schema_property[property_field] = property_[property_field]
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to Weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If Weaviate reports a non-OK status.
+        """
 
-            path = "/schema/" + _capitalize_first_letter(schema_class["class"]) + "/properties"
-            try:
-                response = self._connection.post(path=path, weaviate_object=schema_property)
-            except RequestsConnectionError as conn_err:
-                raise RequestsConnectionError(
-                    "Property may not have been created properly."
-                ) from conn_err
-            if response.status_code != 200:
-                raise UnexpectedStatusCodeException("Add properties to classes", response)
+        # Create the property object. All complex dataTypes should be capitalized.
+        schema_property = {
+            "dataType": [_capitalize_first_letter(dtype) for dtype in property_["dataType"]],
+            "name": property_["name"],
+        }
+
+        for property_field in PROPERTY_KEYS - {"name", "dataType"}:
+            if property_field in property_:
+                schema_property[property_field] = property_[property_field]
+
+        path = "/schema/" + _capitalize_first_letter(class_name) + "/properties"
+        try:
+            response = self._connection.post(path=path, weaviate_object=schema_property)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                "Property may not have been created properly."
+            ) from conn_err
+        finally:
+            self.cache.invalidate()
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Add properties to classes", response)
 
     def _create_complex_properties_from_classes(self, schema_classes_list: list) -> None:
         """
@@ -704,6 +1006,8 @@ class Schema:
             response = self._connection.post(path="/schema", weaviate_object=schema_class)
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Class may not have been created properly.") from conn_err
+        finally:
+            self.cache.invalidate()
         if response.status_code != 200:
             raise UnexpectedStatusCodeException("Create class", response)
 
@@ -723,6 +1027,44 @@ class Schema:
             self._create_class_with_primitives(weaviate_class)
 
 
+def _get_apply_operations(schema: Schema, operations: List[SchemaOperation]) -> Operations:
+    """
+    Get the `apply_in_order` operations that execute planned schema operations.
+
+    Parameters
+    ----------
+    schema : Schema
+        The Schema used to execute the operations.
+    operations : List[weaviate.schema.planner.SchemaOperation]
+        The planned operations, see `plan_schema_changes`.
+
+    Returns
+    -------
+    Operations
+        The operations for `apply_in_order`, with the same keys and dependencies.
+    """
+
+    to_apply = {}
+    for operation in operations:
+        if operation.action == CREATE_CLASS:
+            func = partial(schema._create_class_with_primitives, operation.payload)
+        elif operation.action == ADD_PROPERTY:
+            if _property_is_primitive(operation.payload["dataType"]):
+                func = partial(schema.property.create, operation.class_name, operation.payload)
+            else:
+                func = partial(
+                    schema._create_complex_property, operation.class_name, operation.payload
+                )
+        elif operation.action == UPDATE_CONFIG:
+            func = partial(
+                schema.update_config, operation.class_name, operation.payload, use_cache=False
+            )
+        else:
+            func = partial(schema.delete_class, operation.class_name)
+        to_apply[operation.key] = (func, operation.depends_on)
+    return to_apply
+
+
 def _property_is_primitive(data_type_list: list) -> bool:
     """
     Check if the property is primitive.
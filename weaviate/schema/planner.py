@@ -0,0 +1,266 @@
+"""
+Compute the operations that migrate a live schema to a desired schema.
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from weaviate.exceptions import SchemaValidationException
+from weaviate.schema.validate_schema import CLASS_KEYS
+from weaviate.util import _capitalize_first_letter, _compare_properties
+
+CREATE_CLASS = "create_class"
+ADD_PROPERTY = "add_property"
+UPDATE_CONFIG = "update_config"
+DELETE_CLASS = "delete_class"
+
+
+@dataclass
+class SchemaOperation:
+    """
+    One schema change.
+
+    Attributes
+    ----------
+    action : str
+        One of "create_class" (`payload` is the class with only its primitive properties),
+        "add_property" (`payload` is the property), "update_config" (`payload` is the config to
+        update, see `Schema.update_config`) or "delete_class" (no `payload`).
+    class_name : str
+        The class to change.
+    payload : Optional[dict]
+        The content of the change, see `action`.
+    depends_on : List[tuple]
+        The keys of the operations that must be applied before this one.
+    """
+
+    action: str
+    class_name: str
+    payload: Optional[dict] = None
+    depends_on: List[tuple] = field(default_factory=list)
+
+    @property
+    def key(self) -> tuple:
+        """
+        The unique key of the operation, e.g. ("add_property", "Article", "title").
+        """
+
+        if self.action == ADD_PROPERTY:
+            return (self.action, self.class_name, self.payload["name"])
+        return (self.action, self.class_name)
+
+
+def plan_schema_changes(
+    desired: dict, live: dict, delete_missing: bool = False
+) -> List[SchemaOperation]:
+    """
+    Compute the minimal operations that change the `live` schema to contain the `desired` one.
+    Classes and properties are never recreated: missing classes and properties are created,
+    the class settings that differ from the live ones are updated. Settings that are not in the
+    `desired` schema are left as they are, as are the settings of existing properties.
+
+    Parameters
+    ----------
+    desired : dict
+        The desired schema, with the "classes" key.
+    live : dict
+        The current schema of Weaviate, see `Schema.get`.
+    delete_missing : bool, optional
+        If True the classes that are not in the `desired` schema are deleted, with all their
+        objects, by default False
+
+    Returns
+    -------
+    List[SchemaOperation]
+        The operations, in an order in which they can be applied one after another.
+
+    Raises
+    ------
+    weaviate.SchemaValidationException
+        If the data type of an existing property or an immutable class setting, e.g. the
+        'vectorizer', would have to change, which requires recreating the class.
+    """
+
+    live_classes = {
+        _capitalize_first_letter(class_["class"]): class_ for class_ in live.get("classes", [])
+    }
+    desired_classes = [
+        {**class_, "class": _capitalize_first_letter(class_["class"])}
+        for class_ in desired["classes"]
+    ]
+
+    creates: List[SchemaOperation] = []
+    add_properties: List[SchemaOperation] = []
+    updates: List[SchemaOperation] = []
+
+    for desired_class in desired_classes:
+        class_name = desired_class["class"]
+        desired_properties = desired_class.get("properties") or []
+        live_class = live_classes.get(class_name)
+
+        if live_class is None:
+            primitive_class = {
+                **desired_class,
+                "properties": [prop for prop in desired_properties if _is_primitive(prop)],
+            }
+            creates.append(SchemaOperation(CREATE_CLASS, class_name, primitive_class))
+            new_properties = [prop for prop in desired_properties if not _is_primitive(prop)]
+        else:
+            live_properties = live_class.get("properties") or []
+            new_properties = [
+                prop
+                for prop in desired_properties
+                if not _compare_properties([prop], live_properties)
+            ]
+            _check_data_types(class_name, desired_properties, live_properties)
+            config = _config_diff(
+                {key: value for key, value in desired_class.items() if key in _CONFIG_KEYS},
+                live_class,
+            )
+            if config is not None:
+                _check_immutable_settings(class_name, config)
+                # the update PUTs the whole class, properties included, so it must read the class
+                # after its new properties are added
+                depends_on = [(ADD_PROPERTY, class_name, prop["name"]) for prop in new_properties]
+                updates.append(SchemaOperation(UPDATE_CONFIG, class_name, config, depends_on))
+
+        for prop in new_properties:
+            depends_on = [(CREATE_CLASS, class_name)]
+            if not _is_primitive(prop):
+                depends_on += [
+                    (CREATE_CLASS, _capitalize_first_letter(dtype)) for dtype in prop["dataType"]
+                ]
+            add_properties.append(SchemaOperation(ADD_PROPERTY, class_name, prop, depends_on))
+
+    deletes = []
+    if delete_missing:
+        desired_names = {class_["class"] for class_ in desired_classes}
+        deletes = [
+            SchemaOperation(DELETE_CLASS, class_name)
+            for class_name in live_classes
+            if class_name not in desired_names
+        ]
+
+    operations = creates + add_properties + updates + deletes
+    keys = {operation.key for operation in operations}
+    for operation in operations:
+        operation.depends_on = [key for key in operation.depends_on if key in keys]
+    return operations
+
+
+_CONFIG_KEYS = CLASS_KEYS - {"class", "properties"}
+# the class settings that cannot be updated once the class exists
+_IMMUTABLE_KEYS = {"vectorizer", "vectorIndexType", "moduleConfig", "shardingConfig"}
+
+
+def _is_primitive(property_: dict) -> bool:
+    """
+    Check if a property is primitive, i.e. not a cross-reference.
+
+    Parameters
+    ----------
+    property_ : dict
+        The property.
+
+    Returns
+    -------
+    bool
+        True if all its data types are primitive.
+    """
+
+    # imported here, crud_schema imports this module
+    from weaviate.schema.crud_schema import _property_is_primitive
+
+    return _property_is_primitive(property_["dataType"])
+
+
+def _check_data_types(class_name: str, desired: list, live: list) -> None:
+    """
+    Check that the existing properties have the desired data types.
+
+    Parameters
+    ----------
+    class_name : str
+        The class of the properties.
+    desired : list
+        The desired properties.
+    live : list
+        The existing properties.
+
+    Raises
+    ------
+    weaviate.SchemaValidationException
+        If the data type of an existing property differs.
+    """
+
+    live_data_types = {prop["name"]: _normalize_data_type(prop) for prop in live}
+    for prop in desired:
+        live_data_type = live_data_types.get(prop["name"])
+        if live_data_type is not None and live_data_type != _normalize_data_type(prop):
+            raise SchemaValidationException(
+                f"The data type of property '{prop['name']}' of class '{class_name}' cannot be "
+                f"changed from {sorted(live_data_type)} to {prop['dataType']} without recreating "
+                "the class."
+            )
+
+
+def _check_immutable_settings(class_name: str, config: dict) -> None:
+    """
+    Check that the settings to update of an existing class are mutable.
+
+    Parameters
+    ----------
+    class_name : str
+        The class of the settings.
+    config : dict
+        The differing settings, see `_config_diff`.
+
+    Raises
+    ------
+    weaviate.SchemaValidationException
+        If an immutable setting differs.
+    """
+
+    immutable = sorted(_IMMUTABLE_KEYS.intersection(config))
+    if len(immutable) != 0:
+        raise SchemaValidationException(
+            f"The settings {immutable} of class '{class_name}' cannot be changed without "
+            "recreating the class."
+        )
+
+
+def _normalize_data_type(property_: dict) -> Tuple[str, ...]:
+    return tuple(
+        sorted(
+            dtype if _is_primitive({"dataType": [dtype]}) else _capitalize_first_letter(dtype)
+            for dtype in property_["dataType"]
+        )
+    )
+
+
+def _config_diff(desired: dict, live: dict) -> Optional[dict]:
+    """
+    Get the (nested) settings of `desired` that differ from `live`.
+
+    Parameters
+    ----------
+    desired : dict
+        The desired settings.
+    live : dict
+        The current settings.
+
+    Returns
+    -------
+    Optional[dict]
+        The differing settings, or None if there are none.
+    """
+
+    diff = {}
+    for key, value in desired.items():
+        live_value = live.get(key)
+        if isinstance(value, dict) and isinstance(live_value, dict):
+            nested = _config_diff(value, live_value)
+            if nested is not None:
+                diff[key] = nested
+        elif value != live_value:
+            diff[key] = value
+    return diff if len(diff) > 0 else None
@@ -1,10 +1,13 @@
 """
 Property class definition.
 """
+from typing import Optional
+
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from weaviate.connect import Connection
 from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.schema.cache import SchemaCache
 from weaviate.schema.validate_schema import check_property
 from weaviate.util import _get_dict_from_object, _capitalize_first_letter
 
@@ -14,7 +17,7 @@ class Property:
     Property class used to create object properties.
     """
 
-    def __init__(self, connection: Connection):
+    def __init__(self, connection: Connection, schema_cache: Optional[SchemaCache] = None):
         """
         Initialize a Property class instance.
 
@@ -22,9 +25,12 @@ class Property:
         ----------
         connection : weaviate.connect.Connection
             Connection object to an active and running weaviate instance.
+        schema_cache : Optional[weaviate.schema.cache.SchemaCache], optional
+            The schema cache to invalidate when a property is created, by default None
         """
 
         self._connection = connection
+        self._schema_cache = schema_cache
 
     def create(self, schema_class_name: str, schema_property: dict) -> None:
         """
@@ -76,5 +82,8 @@ class Property:
             response = self._connection.post(path=path, weaviate_object=loaded_schema_property)
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Property was created properly.") from conn_err
+        finally:
+            if self._schema_cache is not None:
+                self._schema_cache.invalidate()
         if response.status_code != 200:
             raise UnexpectedStatusCodeException("Add property to class", response)
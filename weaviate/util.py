@@ -2,10 +2,12 @@
 Helper functions!
 """
 import base64
+import importlib
 import json
 import os
 import uuid as uuid_lib
 from enum import Enum, EnumMeta
+from functools import lru_cache
 from io import BufferedReader
 from numbers import Real
 from typing import Union, Sequence, Any, Optional, List, Dict
@@ -341,6 +343,72 @@ def get_vector(vector: Sequence) -> list:
             ) from None
 
 
+def format_vector(vector: Sequence, precision: Optional[int] = None) -> str:
+    """
+    Format an embedding vector as a JSON (and GraphQL) array of numbers, much faster than
+    `json.dumps` because all numbers are formatted at once with a fixed number of significant
+    digits.
+
+    Parameters
+    ----------
+    vector: Sequence
+        The embedding, see `get_vector` for the supported types.
+    precision: Optional[int], optional
+        The number of significant digits of every number. If None the numbers are not rounded:
+        a `numpy.ndarray` of dtype float32 is formatted with 9 significant digits and any other
+        vector with 17, which is lossless for float32 and float64 respectively, by default None
+
+    Returns
+    -------
+    str
+        The formatted vector.
+
+    Raises
+    ------
+    TypeError
+        If 'vector' is not of a supported type or has elements that are not numbers, or
+        'precision' is not an int.
+    ValueError
+        If 'precision' is not positive.
+    """
+
+    if precision is not None:
+        _check_positive_num(precision, "precision", int)
+    elif getattr(vector, "dtype", None) == "float32":
+        precision = 9
+    else:
+        precision = 17
+    values = get_vector(vector)
+    if not isinstance(values, list):
+        # a vector with a single element is squeezed to a scalar
+        values = [values]
+    try:
+        return "[" + _vector_format(len(values), precision) % tuple(values) + "]"
+    except TypeError:
+        raise TypeError("All the elements of 'vector' must be numbers.") from None
+
+
+@lru_cache(maxsize=32)
+def _vector_format(length: int, precision: int) -> str:
+    """
+    Get the %-format string of a vector, formatting all numbers at once is faster than one by one.
+
+    Parameters
+    ----------
+    length : int
+        The number of elements of the vector.
+    precision : int
+        The number of significant digits of every number.
+
+    Returns
+    -------
+    str
+        The format string, without the brackets.
+    """
+
+    return ",".join([f"%.{precision}g"] * length)
+
+
 def get_domain_from_weaviate_url(url: str) -> str:
     """
     Get the domain from a weaviate URL.
@@ -492,6 +560,34 @@ def _capitalize_first_letter(string: str) -> str:
     return string[0].capitalize() + string[1:]
 
 
+def _is_version_at_least(version: str, minimum: str) -> bool:
+    """
+    Check if a Weaviate server version is at least `minimum`. Unlike a string comparison this
+    compares the version numerically, e.g. "1.9.0" is lower than "1.21".
+
+    Parameters
+    ----------
+    version : str
+        The server version, e.g. "1.21.2" or "1.22.0-rc.0".
+    minimum : str
+        The minimal version, e.g. "1.21".
+
+    Returns
+    -------
+    bool
+        True if `version` is greater than or equal to `minimum`.
+    """
+
+    def _parse(version_: str) -> List[int]:
+        parts = []
+        for part in version_.split("-")[0].split("."):
+            digits = "".join(char for char in part if char.isdigit())
+            parts.append(int(digits) if digits else 0)
+        return parts
+
+    return _parse(version) >= _parse(minimum)
+
+
 def check_batch_result(
     results: Optional[List[Dict[str, Any]]],
 ) -> None:
@@ -547,6 +643,35 @@ def _check_positive_num(
             raise ValueError(f"'{arg_name}' must be positive, i.e. greater that zero (>0).")
 
 
+def _import_optional(module: str, feature: str) -> Any:
+    """
+    Import an optional dependency when it is first needed.
+
+    Parameters
+    ----------
+    module : str
+        The module to import, e.g. "numpy" or "pyarrow.parquet".
+    feature : str
+        The feature that requires it, used in the error message, e.g. "Reading .npy files".
+
+    Returns
+    -------
+    module
+        The imported module.
+
+    Raises
+    ------
+    ImportError
+        If the package of the module is not installed.
+    """
+
+    package = module.split(".")[0]
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(f"{feature} requires '{package}': pip install {package}") from None
+
+
 def is_weaviate_domain(url: str) -> bool:
     return (
         "weaviate.io" in url.lower()
@@ -1,6 +1,6 @@
 import warnings
 from importlib.metadata import version, PackageNotFoundError
-from typing import Optional
+from typing import List, Optional
 
 try:
     __version__ = version("weaviate")
@@ -106,3 +106,12 @@ class _Warnings:
             category=UserWarning,
             stacklevel=1,
         )
+
+    @staticmethod
+    def batch_callback_errors_at_shutdown(errors: List[Exception]):
+        warnings.warn(
+            message=f"""Bat001: {len(errors)} batch callback(s) raised an exception that was not raised by a flush
+            before the CallbackDispatcher was shut down. First exception: {errors[0]!r}""",
+            category=RuntimeWarning,
+            stacklevel=1,
+        )